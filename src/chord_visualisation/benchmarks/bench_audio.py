@@ -0,0 +1,32 @@
+"""Benchmark exporting a chord library to WAV files.
+
+Reports the export speed as a multiple of real time and the peak memory
+traced during the export, which should stay flat as the library grows.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.bench_audio
+"""
+import tempfile
+import tracemalloc
+
+from core.audio import ChordSynth, export_library
+from core.notes import NOTE_NAMES
+
+
+def main() -> None:
+    synth = ChordSynth()
+    print(f"{'roots':>6}{'files':>8}{'audio s':>10}{'export s':>10}{'x real time':>13}{'peak MiB':>10}")
+    for n_roots in (1, 4, len(NOTE_NAMES)):
+        with tempfile.TemporaryDirectory() as export_dir:
+            tracemalloc.start()
+            stats = export_library(export_dir, roots=NOTE_NAMES[:n_roots], synth=synth)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        print(
+            f"{n_roots:>6}{stats.files:>8}{stats.audio_seconds:>10.0f}{stats.seconds:>10.2f}"
+            f"{stats.realtime_factor:>13.0f}{peak / 2**20:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark chord identification over a fixed corpus of diagrams.
+
+Compares the bitmask lookup in ChordNameGenerator against the interval
+combination search it replaced.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.bench_chord_name
+"""
+import itertools
+import random
+import timeit
+
+from core.chord_name import ChordNameGenerator
+from core.chord_shapes import ChordDiagram, FingerPosition
+from core.chords import ChordFormula, Intervals
+from core.notes import ChromaticNotes
+
+
+def diagram_corpus(size: int = 2000, seed: int = 0) -> list[ChordDiagram]:
+    """Create a reproducible corpus of random chord diagrams."""
+    rng = random.Random(seed)
+    corpus: list[ChordDiagram] = []
+    while len(corpus) < size:
+        diagram = ChordDiagram(shape=[], open_strings=[], muted_strings=[])
+        for string in range(1, 7):
+            r = rng.random()
+            if r < 0.2:
+                diagram.muted_strings.append(string)
+            elif r < 0.4:
+                diagram.open_strings.append(string)
+            else:
+                diagram.shape.append(FingerPosition(string, rng.randint(1, 12)))
+        if diagram.shape or diagram.open_strings:
+            corpus.append(diagram)
+    return corpus
+
+
+def interval_search_quality(cng: ChordNameGenerator, diagram: ChordDiagram) -> str | None:
+    """Identify the chord quality by matching combinations of intervals against every formula."""
+    positions = diagram.shape + [FingerPosition(i, 0) for i in diagram.open_strings]
+    notes = [cng.fretboard.get_note(pos.string, pos.fret) for pos in positions]
+    distances = [
+        ChromaticNotes.get_full_octave_of_notes_and_distance_from_starting_note(cng.root_note_name)[n] for n in notes
+    ]
+    intervals = {cng.root_note_name: [Intervals.P1]}
+    for note, dist in zip(notes, distances):
+        intervals[note] = [i for i in Intervals._member_map_.values() if i.value == dist]
+    for comb in itertools.product(*intervals.values()):
+        for name, formula in ChordFormula.__members__.items():
+            if formula.value == tuple(sorted(comb, key=lambda x: x.value)):
+                return name
+    return None
+
+
+def main(number: int = 3) -> None:
+    corpus = diagram_corpus()
+    cng = ChordNameGenerator()
+
+    def bitmask():
+        for diagram in corpus:
+            cng.identify_root_note(diagram)
+            cng.indentify_chord_quality(diagram)
+
+    def interval_search():
+        for diagram in corpus:
+            cng.identify_root_note(diagram)
+            interval_search_quality(cng, diagram)
+
+    t_bitmask = timeit.timeit(bitmask, number=number) / number / len(corpus)
+    t_search = timeit.timeit(interval_search, number=number) / number / len(corpus)
+    print(f"diagrams:        {len(corpus)}")
+    print(f"interval search: {t_search * 1e6:.2f} us/diagram")
+    print(f"bitmask lookup:  {t_bitmask * 1e6:.2f} us/diagram")
+    print(f"speedup:         {t_search / t_bitmask:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
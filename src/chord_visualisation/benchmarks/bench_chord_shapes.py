@@ -0,0 +1,54 @@
+"""Benchmark chord shape search for every ChordFormula member.
+
+Compares the pruned search in ChordShapes against a full cartesian product
+of note positions followed by filtering, and generating the diagrams of all
+roots by search against deriving them by transposition.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.bench_chord_shapes
+"""
+import timeit
+from itertools import product
+
+from core.chord_shapes import ChordShapes
+from core.chords import ChordFormula
+from core.notes import NOTE_NAMES
+
+
+def product_shapes(shapes: ChordShapes, root: str, quality: str) -> list[list[tuple[int, int]]]:
+    positions = [shapes.fretboard.get_fret_position_from_note(n) for n in shapes.get_chord_notes(root, quality)]
+    return [
+        sorted(shape, key=lambda x: x[0])
+        for shape in product(*positions)
+        if max(f for _, f in shape) - min(f for _, f in shape) < 3 and len({s for s, _ in shape}) == len(shape)
+    ]
+
+
+def main(root: str = "A", number: int = 20) -> None:
+    shapes = ChordShapes()
+    print(f"{'quality':<14}{'shapes':>8}{'product ms':>12}{'search ms':>12}{'speedup':>10}")
+    for quality in ChordFormula.__members__:
+        count = len(list(shapes._search_shapes(root, quality)))
+        t_product = timeit.timeit(lambda: product_shapes(shapes, root, quality), number=number) / number
+        t_search = timeit.timeit(lambda: list(shapes._search_shapes(root, quality)), number=number) / number
+        print(f"{quality:<14}{count:>8}{t_product * 1e3:>12.3f}{t_search * 1e3:>12.3f}{t_product / t_search:>9.1f}x")
+
+
+def all_roots(number: int = 5) -> None:
+    """Compare generating the diagrams of every root and quality by search and by transposition."""
+
+    def generate(transpose: bool):
+        shapes = ChordShapes(transpose=transpose)
+        for quality in ChordFormula.__members__:
+            for root in NOTE_NAMES:
+                shapes.get_chord_diagram(root, quality)
+
+    t_search = timeit.timeit(lambda: generate(False), number=number) / number
+    t_transpose = timeit.timeit(lambda: generate(True), number=number) / number
+    print(f"all roots search:    {t_search * 1e3:.1f} ms")
+    print(f"all roots transpose: {t_transpose * 1e3:.1f} ms ({t_search / t_transpose:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
+    all_roots()
@@ -0,0 +1,58 @@
+"""Benchmark import time of the package entry points.
+
+Runs a fresh interpreter with `python -X importtime` for every module and
+reports the cumulative import time and whether heavy dependencies were loaded.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.bench_import_time
+"""
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("numpy", "matplotlib", "sklearn")
+ENTRY_POINTS = ("main", "core.chord_shapes", "core.chord_name", "core.plot_chords")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter.
+
+    Args:
+        module (str): Name of the module to import.
+
+    Returns:
+        dict[str, int]: Cumulative import time in microseconds of every module
+            that got imported.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PACKAGE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def heavy_imports(times: dict[str, int]) -> list[str]:
+    return [name for name in HEAVY_MODULES if name in times]
+
+
+def main(runs: int = 5) -> None:
+    print(f"{'module':<22}{'median ms':>10}  heavy imports")
+    for module in ENTRY_POINTS:
+        samples = [import_times(module) for _ in range(runs)]
+        median = statistics.median(s[module] for s in samples) / 1e3
+        print(f"{module:<22}{median:>10.1f}  {', '.join(heavy_imports(samples[0])) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
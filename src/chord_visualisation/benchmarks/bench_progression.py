@@ -0,0 +1,42 @@
+"""Benchmark the voice-leading optimiser on random 100-chord progressions.
+
+The run time should grow linearly with the length of the progression. Cold
+runs include building the candidate voicings and transition cost matrices of
+every chord pair seen for the first time, warm runs only the dynamic
+programming.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.bench_progression
+"""
+import random
+import time
+
+from core.progression import ProgressionOptimiser
+
+ROOTS = ("A", "B", "C", "D", "E", "F", "G")
+QUALITIES = ("major", "minor", "dom7", "minor7", "major7")
+
+
+def random_progression(length: int, rng: random.Random) -> list[tuple[str, str]]:
+    return [(rng.choice(ROOTS), rng.choice(QUALITIES)) for _ in range(length)]
+
+
+def main(progressions: int = 10, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    print(f"{'chords':>8}{'cold ms':>10}{'warm ms':>10}{'warm us/chord':>15}")
+    for length in (25, 50, 100, 200):
+        batch = [random_progression(length, rng) for _ in range(progressions)]
+        # cold runs build candidate voicings and transition matrices, warm runs reuse them
+        optimiser = ProgressionOptimiser()
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            for chords in batch:
+                optimiser.optimise(chords)
+            timings.append((time.perf_counter() - start) / progressions)
+        cold, warm = timings
+        print(f"{length:>8}{cold * 1e3:>10.2f}{warm * 1e3:>10.2f}{warm / length * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
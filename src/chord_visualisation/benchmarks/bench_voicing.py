@@ -0,0 +1,56 @@
+"""Benchmark memory footprint and construction cost of Voicing against ChordDiagram.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.bench_voicing
+"""
+import timeit
+import tracemalloc
+from typing import Callable
+
+from core.chord_shapes import ChordDiagram, ChordShapes, FingerPosition
+from core.chords import ChordFormula
+from core.voicing import Voicing
+from core.voicing_library import encode_diagram
+
+
+def allocated_bytes(build: Callable[[], list]) -> int:
+    """Measure the memory held by the objects created by build()."""
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def build_diagram(frets: tuple[int, ...]) -> ChordDiagram:
+    return ChordDiagram(
+        shape=[FingerPosition(idx + 1, f) for idx, f in enumerate(frets) if f > 0],
+        open_strings=[idx + 1 for idx, f in enumerate(frets) if f == 0],
+        muted_strings=[idx + 1 for idx, f in enumerate(frets) if f < 0],
+    )
+
+
+def main(copies: int = 200, number: int = 5) -> None:
+    shapes = ChordShapes()
+    diagrams: list[ChordDiagram] = [
+        d for quality in ChordFormula.__members__ for d in shapes.get_chord_diagram("A", quality)
+    ] * copies
+    frets = [Voicing.from_diagram(d).frets for d in diagrams]
+    raw = [encode_diagram(d) for d in diagrams]
+
+    candidates: dict[str, Callable[[], list]] = {
+        "ChordDiagram": lambda: [build_diagram(f) for f in frets],
+        "Voicing": lambda: [Voicing(f) for f in frets],
+        "Voicing.from_bytes": lambda: [Voicing.from_bytes(b) for b in raw],
+    }
+    print(f"{len(diagrams)} voicings")
+    print(f"{'type':<20}{'bytes/voicing':>15}{'us/voicing':>12}")
+    for name, build in candidates.items():
+        size = allocated_bytes(build) / len(diagrams)
+        seconds = timeit.timeit(build, number=number) / number / len(diagrams)
+        print(f"{name:<20}{size:>15.0f}{seconds * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
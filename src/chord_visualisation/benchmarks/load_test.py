@@ -0,0 +1,91 @@
+"""Load test the chord service with concurrent keep-alive clients.
+
+Starts the service in-process on a free port unless --port is given, then
+sends a mix of voicing, render and naming requests and reports throughput
+and p50/p99 latency per endpoint.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.load_test --clients 32 --requests 50
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+
+from core.chords import ChordFormula
+from server import serve
+
+ROOTS = ["A", "B", "C", "D", "E", "F", "G"]
+
+
+def request_mix(count: int, seed: int = 0) -> list[str]:
+    """Create a reproducible list of request targets."""
+    rng = random.Random(seed)
+    qualities = list(ChordFormula.__members__)
+    targets: list[str] = []
+    for _ in range(count):
+        root, quality = rng.choice(ROOTS), rng.choice(qualities)
+        kind = rng.random()
+        if kind < 0.4:
+            targets.append(f"/voicings?root={root}&quality={quality}&limit=5&rank=playability")
+        elif kind < 0.7:
+            targets.append(f"/render?root={root}&quality={quality}&idx=0&format={rng.choice(['png', 'svg'])}")
+        else:
+            frets = ",".join(str(rng.randint(-1, 4)) for _ in range(6))
+            targets.append(f"/name?frets={frets}")
+    return targets
+
+
+async def _client(host: str, port: int, targets: list[str], latencies: dict[str, list[float]]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    for target in targets:
+        start = time.perf_counter()
+        writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        await writer.drain()
+        await reader.readline()
+        length = 0
+        while (line := await reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+        latencies[target.split("?")[0]].append(time.perf_counter() - start)
+    writer.close()
+
+
+async def run(clients: int, requests: int, host: str = "127.0.0.1", port: int | None = None) -> None:
+    server = None
+    if port is None:
+        server = await serve(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    targets = request_mix(clients * requests)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(_client(host, port, targets[i * requests : (i + 1) * requests], latencies) for i in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+
+    total = clients * requests
+    print(f"{total} requests from {clients} clients in {elapsed:.2f} s ({total / elapsed:.0f} req/s)")
+    print(f"{'endpoint':<12}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for endpoint, times in sorted(latencies.items()):
+        q = statistics.quantiles(times, n=100) if len(times) > 1 else times * 99
+        print(f"{endpoint:<12}{len(times):>8}{q[49] * 1e3:>10.2f}{q[98] * 1e3:>10.2f}")
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.requests, args.host, args.port))
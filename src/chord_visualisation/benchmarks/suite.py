@@ -0,0 +1,143 @@
+"""Benchmark suite for shape generation, chord identification and rendering.
+
+Every benchmark is timed with timeit and the best time per call is compared
+with the results stored by an earlier run. A benchmark that got slower than
+the stored result by more than the threshold is reported as a regression and
+the run exits with status 1.
+
+Usage (from src/chord_visualisation):
+    python -m benchmarks.suite --save           # store the results
+    python -m benchmarks.suite                  # compare with the stored results
+    python -m benchmarks.suite -k chord_shapes  # run matching benchmarks only
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.bench_chord_name import diagram_corpus
+from core.chord_name import ChordNameGenerator
+from core.chord_shapes import ChordShapes
+from core.chords import ChordFormula
+
+RESULTS_PATH = Path(__file__).resolve().parent / "results.json"
+BASE_IMG = str(Path(__file__).resolve().parents[3] / "images" / "fretboard_2.png")
+
+
+def collect_benchmarks(export_dir: Path) -> dict[str, Callable[[], object]]:
+    """Create all benchmarks.
+
+    Args:
+        export_dir (Path): Directory plot exports are written to.
+
+    Returns:
+        dict[str, Callable[[], object]]: Benchmark functions by name.
+    """
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    from core.plot_chords import ChordShapePlot, FretboardToCoord
+
+    benchmarks: dict[str, Callable[[], object]] = {}
+
+    shapes = ChordShapes()
+    for quality in ChordFormula.__members__:
+        benchmarks[f"chord_shapes.{quality}"] = lambda q=quality: shapes.get_chord_diagram("A", q)
+
+    corpus = diagram_corpus()
+    cng = ChordNameGenerator()
+
+    def identify():
+        for diagram in corpus:
+            cng.identify_root_note(diagram)
+            cng.indentify_chord_quality(diagram)
+
+    benchmarks["chord_name.corpus"] = identify
+
+    converter = FretboardToCoord()
+    diagrams = [d for q in ("major", "minor7", "dom9") for d in shapes.get_chord_diagram("C", q)]
+    benchmarks["fretboard_to_coord.diagram_coords"] = lambda: [converter.diagram_coords(d) for d in diagrams]
+
+    for backend in ChordShapePlot.BACKENDS:
+        plot = ChordShapePlot("A", "minor", backend=backend)
+        plot.BASE_IMG = BASE_IMG
+        benchmarks[f"plot_by_idx.{backend}"] = lambda p=plot: p.plot_by_idx(0, save=True, save_path=export_dir)
+
+    return benchmarks
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """Time a function.
+
+    Args:
+        func (Callable[[], object]): Function to time.
+        repeat (int, optional): Number of timing runs. Defaults to 5.
+
+    Returns:
+        float: Best time of a single call in seconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def compare(results: dict[str, float], stored: dict[str, float], threshold: float) -> list[str]:
+    """Find regressions against stored results.
+
+    Args:
+        results (dict[str, float]): Current seconds per call by benchmark.
+        stored (dict[str, float]): Stored seconds per call by benchmark.
+        threshold (float): Allowed relative slowdown, 0.2 allows 20%.
+
+    Returns:
+        list[str]: Names of benchmarks that regressed.
+    """
+    return [name for name, seconds in results.items() if name in stored and seconds > stored[name] * (1 + threshold)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--results", type=Path, default=RESULTS_PATH, help="stored results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="store the results of this run")
+    args = parser.parse_args(argv)
+
+    stored: dict[str, float] = {}
+    if args.results.exists():
+        stored = json.loads(args.results.read_text())["results"]
+
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as export_dir:
+        benchmarks = collect_benchmarks(Path(export_dir))
+        print(f"{'benchmark':<38}{'ms':>10}{'stored ms':>12}{'change':>9}")
+        for name, func in benchmarks.items():
+            if args.filter not in name:
+                continue
+            results[name] = measure(func, args.repeat)
+            line = f"{name:<38}{results[name] * 1e3:>10.3f}"
+            if name in stored:
+                line += f"{stored[name] * 1e3:>12.3f}{results[name] / stored[name] - 1:>+9.1%}"
+            print(line)
+
+    regressions = compare(results, stored, args.threshold)
+    for name in regressions:
+        print(f"REGRESSION {name}: {results[name] / stored[name] - 1:+.1%} > {args.threshold:.0%}", file=sys.stderr)
+
+    if args.save:
+        args.results.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "machine": platform.machine(), "results": {**stored, **results}},
+                indent=2,
+                sort_keys=True,
+            )
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+if TYPE_CHECKING:
+    from core.plot_chords import CoordinateDiagram
+    from core.raster_render import RasterRenderer
+
+
+def build_atlas(
+    diagrams: Iterable["CoordinateDiagram"],
+    count: int,
+    renderer: "RasterRenderer",
+    tile_width: int = 400,
+    columns: int = 4,
+) -> tuple[NDArray[np.uint8], dict[str, Any]]:
+    """Render chord diagrams as thumbnails tiled in a grid.
+
+    Only the atlas and a single full size diagram are held in memory at a
+    time, so memory is bounded by the atlas size.
+
+    Args:
+        diagrams (Iterable[CoordinateDiagram]): Chord diagrams in image coordinates.
+        count (int): Number of diagrams.
+        renderer (RasterRenderer): Renderer of full size diagrams.
+        tile_width (int, optional): Width of a thumbnail in pixels, the height
+            keeps the aspect ratio of the base image. Defaults to 400.
+        columns (int, optional): Number of thumbnails per row. Defaults to 4.
+
+    Returns:
+        tuple[NDArray[np.uint8], dict[str, Any]]: RGBA atlas image and an index
+            with the pixel offset of every tile.
+    """
+    columns = max(1, min(columns, count))
+    rows = -(-count // columns)
+    tile_height = 0
+    atlas: NDArray[np.uint8] | None = None
+    tiles: list[dict[str, Any]] = []
+
+    for idx, diagram in enumerate(diagrams):
+        full = renderer.render(diagram)
+        if atlas is None:
+            tile_height = round(full.shape[0] * tile_width / full.shape[1])
+            atlas = np.zeros((rows * tile_height, columns * tile_width, 4), dtype=np.uint8)
+        x, y = (idx % columns) * tile_width, (idx // columns) * tile_height
+        thumb = Image.fromarray(full).resize((tile_width, tile_height), Image.Resampling.BOX)
+        atlas[y : y + tile_height, x : x + tile_width] = np.asarray(thumb)
+        tiles.append(
+            {
+                "index": idx,
+                "x": x,
+                "y": y,
+                "open_strings": diagram.open_strings,
+                "muted_strings": diagram.muted_strings,
+            }
+        )
+
+    if atlas is None:
+        atlas = np.zeros((0, 0, 4), dtype=np.uint8)
+    index = {"tile_width": tile_width, "tile_height": tile_height, "columns": columns, "tiles": tiles}
+    return atlas, index
+
+
+def save_atlas(atlas: NDArray[np.uint8], index: dict[str, Any], path: str | Path) -> tuple[Path, Path]:
+    """Save an atlas image as PNG together with its JSON index.
+
+    Args:
+        atlas (NDArray[np.uint8]): RGBA atlas image.
+        index (dict[str, Any]): Tile index.
+        path (str | Path): Path of the PNG, the index is saved next to it with a .json suffix.
+
+    Returns:
+        tuple[Path, Path]: Paths of the image and the index.
+    """
+    path = Path(path)
+    index_path = path.with_suffix(".json")
+    Image.fromarray(atlas).save(path, format="PNG")
+    index_path.write_text(json.dumps({"image": path.name, **index}, indent=2), encoding="utf-8")
+    return path, index_path
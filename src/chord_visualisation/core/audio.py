@@ -0,0 +1,207 @@
+import time
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from core.chord_shapes import ChordDiagram, ChordShapes
+from core.chords import ChordFormula
+from core.notes import NOTE_NAMES, ChromaticNotes
+from core.voicing import MUTED, Voicing
+from core.voicing_library import VoicingLibrary
+
+# octaves of the open strings of a guitar in standard tuning, string 1 first
+STANDARD_OCTAVES = (4, 3, 3, 3, 2, 2)
+
+
+class ChordSynth:
+    """
+    Synthesises strummed chord voicings as 16-bit mono audio.
+
+    Every played string is a sum of harmonics of its frequency with
+    exponentially decaying amplitudes, higher harmonics decay faster. The
+    strings are strummed from the lowest string to string 1. The tone of
+    every string and fret is synthesised once for all harmonics and samples
+    with NumPy and cached, a chord mixes the cached tones one chunk of
+    samples at a time. Memory use depends on the size of the fretboard but
+    not on the number of chords synthesised.
+
+    Args:
+        tuning (tuple[str, ...], optional): Open string notes, string 1 first.
+            Defaults to standard tuning.
+        octaves (tuple[int, ...], optional): Octave of every open string in
+            scientific pitch notation, string 1 first. Defaults to STANDARD_OCTAVES.
+        sample_rate (int, optional): Samples per second. Defaults to 44100.
+        duration (float, optional): Length of a chord in seconds. Defaults to 2.0.
+        strum (float, optional): Delay between consecutive strings in seconds. Defaults to 0.03.
+        harmonics (int, optional): Number of harmonics per string. Defaults to 8.
+        decay (float, optional): Decay rate of the fundamental per second. Defaults to 2.0.
+        chunk_size (int, optional): Number of samples written at once. Defaults to 4096.
+    """
+
+    def __init__(
+        self,
+        tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E"),
+        octaves: tuple[int, ...] = STANDARD_OCTAVES,
+        sample_rate: int = 44100,
+        duration: float = 2.0,
+        strum: float = 0.03,
+        harmonics: int = 8,
+        decay: float = 2.0,
+        chunk_size: int = 4096,
+    ) -> None:
+        if len(octaves) != len(tuning):
+            raise ValueError("octaves has to give the octave of every string")
+        self.tuning = tuning
+        self.sample_rate = sample_rate
+        self.duration = duration
+        self.strum = strum
+        self.chunk_size = chunk_size
+        self._open_frequencies = np.array(
+            [ChromaticNotes.frequency(note, octave) for note, octave in zip(tuning, octaves)]
+        )
+        self._harmonics = np.arange(1, harmonics + 1, dtype=np.float32)
+        self._decay = decay
+        self._tones: dict[tuple[int, int], NDArray[np.float32]] = {}
+
+    @property
+    def n_samples(self) -> int:
+        return int(self.duration * self.sample_rate)
+
+    def _played(self, diagram: ChordDiagram) -> list[tuple[int, int]]:
+        # (string, fret) of the played strings in strumming order
+        frets = Voicing.from_diagram(diagram, len(self.tuning)).frets
+        return [(string, frets[string - 1]) for string in range(len(frets), 0, -1) if frets[string - 1] != MUTED]
+
+    def frequencies(self, diagram: ChordDiagram) -> NDArray[np.float64]:
+        """Get the frequencies of the played strings in strumming order.
+
+        Args:
+            diagram (ChordDiagram): Chord diagram.
+
+        Returns:
+            NDArray[np.float64]: Frequency in Hz of every played string, lowest string first.
+        """
+        played = self._played(diagram)
+        return np.array([self._open_frequencies[string - 1] * 2.0 ** (fret / 12) for string, fret in played])
+
+    def _tone(self, string: int, fret: int) -> NDArray[np.float32]:
+        if (string, fret) not in self._tones:
+            frequency = self._open_frequencies[string - 1] * 2.0 ** (fret / 12)
+            # harmonics above the Nyquist frequency would alias
+            harmonics = self._harmonics[self._harmonics * frequency < self.sample_rate / 2][:, None]
+            t = np.arange(self.n_samples, dtype=np.float32) / self.sample_rate
+            partials = np.sin((2 * np.pi * frequency) * harmonics * t) * np.exp(-self._decay * harmonics * t)
+            amplitudes = 1 / harmonics[:, 0]
+            # the peak of a tone can not exceed 1
+            self._tones[(string, fret)] = (amplitudes / amplitudes.sum()) @ partials
+        return self._tones[(string, fret)]
+
+    def iter_chunks(self, diagram: ChordDiagram) -> Iterator[NDArray[np.int16]]:
+        """Synthesise a chord one chunk of samples at a time.
+
+        Args:
+            diagram (ChordDiagram): Chord diagram.
+
+        Yields:
+            NDArray[np.int16]: Up to chunk_size samples.
+        """
+        tones = [self._tone(string, fret) for string, fret in self._played(diagram)]
+        onsets = [round(i * self.strum * self.sample_rate) for i in range(len(tones))]
+        # every tone peaks at most at 1, so the output never clips
+        gain = 32767 * 0.9 / max(len(tones), 1)
+
+        for start in range(0, self.n_samples, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_samples)
+            samples = np.zeros(stop - start, dtype=np.float32)
+            for tone, onset in zip(tones, onsets):
+                if onset < stop:
+                    first = max(start, onset)
+                    samples[first - start :] += tone[first - onset : stop - onset]
+            yield (samples * gain).astype("<i2")
+
+    def synthesise(self, diagram: ChordDiagram) -> NDArray[np.int16]:
+        """Synthesise a whole chord, see iter_chunks()."""
+        return np.concatenate(list(self.iter_chunks(diagram)))
+
+    def write_wav(self, diagram: ChordDiagram, file: str | Path | BinaryIO) -> None:
+        """Write a chord to a mono 16-bit WAV file, streaming one chunk at a time.
+
+        Args:
+            diagram (ChordDiagram): Chord diagram.
+            file (str | Path | BinaryIO): Path or binary file object to write to.
+        """
+        with wave.open(str(file) if isinstance(file, Path) else file, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(self.sample_rate)
+            for chunk in self.iter_chunks(diagram):
+                w.writeframes(chunk.tobytes())
+
+
+@dataclass
+class AudioExportStats:
+    """Number of audio files written by export_library() and the time it took."""
+
+    files: int
+    audio_seconds: float
+    seconds: float
+
+    @property
+    def realtime_factor(self) -> float:
+        """Seconds of audio written per second of export time."""
+        return self.audio_seconds / self.seconds if self.seconds else 0.0
+
+
+def export_library(
+    save_path: str | Path | None = None,
+    roots: Iterable[str] = NOTE_NAMES,
+    qualities: Iterable[str] = tuple(ChordFormula.__members__),
+    synth: ChordSynth | None = None,
+    shapes: ChordShapes | VoicingLibrary | None = None,
+) -> AudioExportStats:
+    """Write every voicing of every chord to a WAV file.
+
+    Files are named like the plot exports, <root><quality>/<root><quality>_<idx>.wav.
+    Voicings are generated and written one at a time, so memory use does not
+    depend on the size of the library.
+
+    Args:
+        save_path (str | Path | None, optional): Directory to save the files in.
+            Defaults to export/audio in the working directory.
+        roots (Iterable[str], optional): Root notes. Defaults to all notes.
+        qualities (Iterable[str], optional): Chord qualities. Defaults to all qualities.
+        synth (ChordSynth | None, optional): Synthesiser. Defaults to standard tuning.
+        shapes (ChordShapes | VoicingLibrary | None, optional): Source of the voicings.
+            Defaults to ChordShapes of the synthesiser tuning.
+
+    Returns:
+        AudioExportStats: Number of files, seconds of audio and export time.
+    """
+    synth = synth or ChordSynth()
+    shapes = shapes or ChordShapes(synth.tuning, transpose=True)
+    p = Path(save_path) if save_path else Path().resolve() / "export" / "audio"
+    qualities = tuple(qualities)
+
+    start = time.perf_counter()
+    files = 0
+    for root in roots:
+        for quality in qualities:
+            chord_dir = p / f"{root}{quality}"
+            chord_dir.mkdir(parents=True, exist_ok=True)
+            for idx, diagram in enumerate(shapes.iter_chord_diagrams(root, quality)):
+                synth.write_wav(diagram, chord_dir / f"{root}{quality}_{idx}.wav")
+                files += 1
+    return AudioExportStats(
+        files=files, audio_seconds=files * synth.n_samples / synth.sample_rate, seconds=time.perf_counter() - start
+    )
+
+
+if __name__ == "__main__":
+    synth = ChordSynth()
+    diagram = next(ChordShapes().iter_chord_diagrams("A", "minor"))
+    print(synth.frequencies(diagram))
+    synth.write_wav(diagram, "Aminor_0.wav")
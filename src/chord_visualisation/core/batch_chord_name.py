@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from core.chords import ChordFormula, interval_mask
+from core.notes import NOTE_NAMES, ChromaticNotes
+from core.voicing import MUTED
+
+
+QUALITIES: list[str] = list(ChordFormula.__members__)
+
+
+def _build_quality_table() -> NDArray[np.int16]:
+    """Lookup table from a 12-bit interval mask to the index of a quality in QUALITIES."""
+    table = np.full(1 << 12, -1, dtype=np.int16)
+    # formula that comes first wins, as in ChordFormula.get_quality_from_mask()
+    for idx in reversed(range(len(QUALITIES))):
+        mask = interval_mask(i.value for i in ChordFormula.__getitem__(QUALITIES[idx]).value)
+        # formulas with intervals above an octave never match a played chord
+        if mask < 1 << 12:
+            table[mask] = idx
+    return table
+
+
+_QUALITY_TABLE = _build_quality_table()
+
+
+@dataclass
+class BatchChordNames:
+    """
+    Chord names of a batch of diagrams, one array element per diagram.
+
+    Args:
+        pitch_class_masks (NDArray[np.int32]): 12-bit masks of played pitch classes
+            with bit 0 being A.
+        bass_notes (NDArray[np.int8]): Pitch class of the lowest played string,
+            -1 if all strings are muted.
+        qualities (NDArray[np.int16]): Index of the chord quality in QUALITIES,
+            -1 if the chord was not identified.
+    """
+
+    pitch_class_masks: NDArray[np.int32]
+    bass_notes: NDArray[np.int8]
+    qualities: NDArray[np.int16]
+
+    def names(self) -> list[str | None]:
+        """Get chord names in the same format as main.find_chord_name_from_diagram().
+
+        Returns:
+            list[str | None]: Chord names, None for diagrams with all strings muted.
+        """
+        notes = np.array(NOTE_NAMES + ("",), dtype=object)
+        qualities = np.array(QUALITIES + ["None"], dtype=object)
+        names = notes[self.bass_notes] + " " + qualities[self.qualities]
+        names[self.bass_notes == MUTED] = None
+        return names.tolist()
+
+
+def identify_chords(
+    frets: NDArray[np.integer], tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E")
+) -> BatchChordNames:
+    """Identify the root notes and qualities of a batch of chord diagrams.
+
+    As in ChordNameGenerator the root of a chord is the note on the lowest
+    (register-wise) played string.
+
+    Args:
+        frets (NDArray[np.integer]): Array of shape (N, number of strings) with the
+            fret of every string, where column 0 is string 1. Use 0 for an open
+            string and -1 for a muted string.
+        tuning (tuple[str, ...], optional): Guitar tuning. Defaults to standard tuning.
+
+    Raises:
+        ValueError: Number of columns does not match the tuning.
+
+    Returns:
+        BatchChordNames: Pitch classes, bass notes and qualities of the diagrams.
+    """
+    frets = np.asarray(frets)
+    if frets.ndim != 2 or frets.shape[1] != len(tuning):
+        raise ValueError(f"expected an array of shape (N, {len(tuning)}), got {frets.shape}")
+
+    played = frets != MUTED
+    open_pitch_classes = np.array([ChromaticNotes.pitch_class(note) for note in tuning])
+    pitch_classes = (open_pitch_classes + frets) % 12
+    masks = np.bitwise_or.reduce(np.where(played, 1 << pitch_classes, 0), axis=1).astype(np.int32)
+
+    # the lowest played string is the last played column
+    any_played = played.any(axis=1)
+    bass_string = frets.shape[1] - 1 - np.argmax(played[:, ::-1], axis=1)
+    bass = np.take_along_axis(pitch_classes, bass_string[:, None], axis=1)[:, 0]
+    bass = np.where(any_played, bass, MUTED).astype(np.int8)
+
+    # rotate the masks so that bit 0 is the bass note
+    shift = np.where(any_played, bass, 0).astype(np.int32)
+    relative = ((masks >> shift) | (masks << (12 - shift))) & 0xFFF
+    qualities = np.where(any_played, _QUALITY_TABLE[relative], -1).astype(np.int16)
+    return BatchChordNames(pitch_class_masks=masks, bass_notes=bass, qualities=qualities)
+
+
+if __name__ == "__main__":
+    diagrams = np.array([[0, 1, 0, 2, 3, -1], [0, 1, 2, 2, 0, -1], [0, 0, 1, 0, 2, 0]])
+    print(identify_chords(diagrams).names())
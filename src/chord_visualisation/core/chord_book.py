@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import Callable, Iterable
+
+from core.chord_shapes import ChordDiagram, ChordShapes
+from core.plot_chords import ChordShapePlot, FigureRenderer, FretboardToCoord
+from core.voicing_library import VoicingLibrary
+
+
+def save_chord_book(
+    chords: Iterable[tuple[str, str]],
+    path: str | Path,
+    limit: int | None = None,
+    rank: Callable[[ChordDiagram], float] | None = None,
+    library: VoicingLibrary | None = None,
+    figsize: tuple[float, float] = ChordShapePlot.FIGSIZE,
+    dpi: int = 150,
+) -> int:
+    """Save the diagrams of many chords as a multi-page PDF, one diagram per page.
+
+    Diagrams are pulled lazily from the shape search and every page is
+    written to the file as soon as it is drawn. A single figure is reused
+    for all pages, so memory use does not grow with the size of the book.
+
+    Args:
+        chords (Iterable[tuple[str, str]]): Pairs of chord root note and quality.
+        path (str | Path): Path of the PDF file.
+        limit (int | None, optional): Maximum number of diagrams per chord. Defaults to None.
+        rank (Callable[[ChordDiagram], float] | None, optional): Scoring function used
+            to order and pick the diagrams. Defaults to None.
+        library (VoicingLibrary | None, optional): Precomputed voicing library to read
+            the diagrams from. Defaults to None.
+        figsize (tuple[float, float], optional): Page size in inches. Defaults to ChordShapePlot.FIGSIZE.
+        dpi (int, optional): Resolution of the embedded fretboard image. Defaults to 150.
+
+    Returns:
+        int: Number of pages written.
+    """
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    shapes = library or ChordShapes()
+    converter = FretboardToCoord()
+    renderer = FigureRenderer(ChordShapePlot.BASE_IMG, dpi, figsize, ChordShapePlot.COLOR, blit=False)
+    pages = 0
+    with PdfPages(path) as pdf:
+        for root_note, quality in chords:
+            for idx, diagram in enumerate(shapes.iter_chord_diagrams(root_note, quality, limit=limit, rank=rank)):
+                renderer.update(converter.diagram_coords(diagram), f"{root_note}{quality} chord |  plot# [{idx}]")
+                pdf.savefig(renderer.figure)
+                pages += 1
+    return pages
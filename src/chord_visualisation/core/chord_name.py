@@ -1,11 +1,8 @@
-import enum
-import itertools
 from functools import reduce
 
 from core.chord_shapes import ChordDiagram, FingerPosition
-from core.chords import ChordFormula, Intervals
-from core.fretboard import FretboardNotes
-from core.notes import ChromaticNotes
+from core.chords import ChordFormula
+from core.fretboard import get_fretboard
 
 
 class ChordNameGenerator:
@@ -16,7 +13,7 @@ class ChordNameGenerator:
 
     def __init__(self, tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E")) -> None:
         self._tuning = tuning
-        self.fretboard = FretboardNotes(tuning)
+        self.fretboard = get_fretboard(tuning)
 
     def identify_root_note(self, diagram: ChordDiagram) -> None:
         """Get root note from a given chord diagram.
@@ -45,105 +42,36 @@ class ChordNameGenerator:
         """Identify the chord's quality from the diagram. To do this we
         first need to identify root note, which is done in identify_root_note()
         method. Then counting from the root note, we get the distances in semitones
-        for other notes of a triad. Finally, we match the collection of
-        Intervals against known chord formulas.
+        for all notes of the chord, set one bit of a mask for every distance
+        and look the mask up in the table of known chord formulas.
 
         Args:
             diagram (ChordDiagram): A ChordDiagram object showing the
                 position of fingers and also open/muted strings.
         """
-        diag_with_open_strings = self._add_open_strings_to_diagram(diagram)
-        notes = self._get_all_other_notes(diag_with_open_strings)
-        dist = self._calculate_distances(notes)
-        intervals = self._create_intervals(self.root_note_name, notes, dist)
-        return self._get_chord_quality_from_formula(intervals)
+        pitch_class = self.fretboard.get_pitch_class
+        root = pitch_class(self.root_note.string, self.root_note.fret)
+        mask = 0
+        for pos in diagram.shape:
+            mask |= 1 << (pitch_class(pos.string, pos.fret) - root) % 12
+        for string in diagram.open_strings:
+            mask |= 1 << (self.fretboard.open_pitch_classes[string - 1] - root) % 12
+        return ChordFormula.get_quality_from_mask(mask)
 
-    def _add_open_strings_to_diagram(self, diagram: ChordDiagram) -> ChordDiagram:
-        """Add open strings to the diagram shape, i.e. when a string is
-        meant to be fretted on 0th fret, we add it to the shape.
 
-        Args:
-            diagram (ChordDiagram): A ChordDiagram object with open strings added
-
-        Returns:
-            ChordDiagram: _description_
-        """
-        open_strings = [FingerPosition(i, 0) for i in diagram.open_strings]
-        diagram.shape += open_strings
-        return diagram
-
-    def _create_chromatic_scale(self, root_note: str) -> dict[str, int]:
-        """Get a dictionary of note standard notations and their distances
-        from the root note.
-
-        Args:
-            root_note (str): Root note of the scale.
-
-        Returns:
-            (dict[str, int]): Dictionary of note standard notations and their distances
-                from the root note
-        """
-        return ChromaticNotes.get_full_octave_of_notes_and_distance_from_starting_note(root_note)
+def chord_name(diagram: ChordDiagram) -> str:
+    """Find the name of a chord from a chord diagram.
 
-    def _get_all_other_notes(self, diagram: ChordDiagram) -> list[str]:
-        """Get all other notes in the chord.
+    Args:
+        diagram (ChordDiagram): Chord diagram.
 
-        Args:
-            diagram (ChordDiagram): ChordDiagram object.
-
-        Returns:
-            (list[str]): List of note names in the chord.
-        """
-        # get names of all other notes in the chord
-        return [self.fretboard.get_note(pos.string, pos.fret) for pos in diagram.shape]
-
-    def _calculate_distances(self, notes: list[str]) -> list[int]:
-        return [
-            ChromaticNotes.get_full_octave_of_notes_and_distance_from_starting_note(starting_note=self.root_note_name)[
-                i
-            ]
-            for i in notes
-        ]
-
-    def _create_intervals(self, root_note: str, notes: list[str], distances: list[int]):
-        intervals_dict: dict[str, list[enum.Enum]] = {}
-        for note, dist in zip(notes, distances):
-            # add a perfect unison interval which will always be there
-            # for the root note
-            intervals_dict[root_note] = [Intervals.P1]
-            # go through all intervals and if the distance
-            # matches what we have available, add it to the list
-            valid_intervals = [i[1] for i in Intervals._member_map_.items() if i[1].value == dist]
-            intervals_dict[note] = valid_intervals
-        return intervals_dict
-
-    def _get_chord_quality_from_formula(self, intervals: dict[str, list[enum.Enum]]) -> str | None:
-        """Get chord quality from the intervals.
-
-        Args:
-            intervals (dict[str, list[enum.Enum]]): Dictionary of notes and their intervals.
-
-        Returns:
-            str | None: Chord quality or None if no match is found.
-        """
-        # because some intervals can have same semitone ranges and it's important
-        # to keep those ranges because they might result in different chords,
-        # out intervals dict will have for each of the notes a list of up to
-        # two intervals that such note can be from the root.
-        #
-        # Now we need to find the formula that matches this combination of
-        # intervals. Now we go through and create all possible combinations
-        # of our list elements and check them against the known formulas.
-        comb: list[tuple[Intervals]] = list(itertools.product(*intervals.values()))
-
-        # sort the resulting list according to the interval value
-        comb_sorted: list[list[Intervals]] = [sorted(i, key=lambda x: x.value) for i in comb]
-
-        # now go through all the chord formulas and see if any of them match
-        for c in comb_sorted:
-            for f in ChordFormula._member_map_.items():
-                if f[1]._value_ == tuple(c):
-                    return f[0]
+    Returns:
+        str: A string of the chord name.
+    """
+    cng = ChordNameGenerator()
+    cng.identify_root_note(diagram)
+    quality = cng.indentify_chord_quality(diagram)
+    return f"{cng.root_note_name} {quality}"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+from typing import Sequence
+
+from core.chord_shapes import ChordDiagram
+from core.chords import ChordFormula
+from core.fretboard import get_fretboard
+from core.notes import NOTE_NAMES
+from core.voicing import MUTED, Voicing
+
+
+class ChordNameSession:
+    """
+    Incrementally identifies a chord while it is edited one string at a time.
+
+    The session keeps the number of strings playing every pitch class, a
+    bitmask of the pitch classes and a bitmask of the played strings, so
+    every edit and every lookup of the chord name takes constant time. As in
+    ChordNameGenerator the root of the chord is the note on the lowest
+    (register-wise) played string.
+
+    Args:
+        tuning (tuple[str, ...], optional): Open string notes, string 1 first.
+            Defaults to standard tuning.
+        frets (Sequence[int] | None, optional): Initial fret of every string,
+            string 1 first, with 0 for an open string and -1 for a muted
+            string. Defaults to all strings muted.
+
+    Raises:
+        ValueError: frets does not give the fret of every string.
+    """
+
+    def __init__(
+        self, tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E"), frets: Sequence[int] | None = None
+    ) -> None:
+        self.fretboard = get_fretboard(tuning)
+        self._frets: list[int] = [MUTED] * len(tuning)
+        self._counts: list[int] = [0] * 12
+        self._mask = 0
+        self._played_strings = 0
+        if frets is not None and len(frets) != len(tuning):
+            raise ValueError(f"expected frets of {len(tuning)} strings, got {len(frets)}")
+        for string, fret in enumerate(frets if frets is not None else (), start=1):
+            if fret != MUTED:
+                self.add(string, int(fret))
+
+    @classmethod
+    def from_diagram(
+        cls, diagram: ChordDiagram, tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E")
+    ) -> "ChordNameSession":
+        return cls(tuning, Voicing.from_diagram(diagram, len(tuning)).frets)
+
+    def add(self, string: int, fret: int) -> None:
+        """Play a string at a fret, replacing whatever the string played before.
+
+        Args:
+            string (int): String number, string 1 first.
+            fret (int): Fret, 0 plays the string open.
+
+        Raises:
+            ValueError: String or fret not on the fretboard.
+        """
+        if not 0 <= fret <= self.fretboard.max_frets:
+            raise ValueError(f"fret {fret} is not on the fretboard")
+        self.mute(string)
+        pitch_class = self.fretboard.get_pitch_class(string, fret)
+        self._frets[string - 1] = fret
+        self._counts[pitch_class] += 1
+        self._mask |= 1 << pitch_class
+        self._played_strings |= 1 << string
+
+    def open(self, string: int) -> None:
+        """Play a string open."""
+        self.add(string, 0)
+
+    def remove(self, string: int, fret: int | None = None) -> None:
+        """Lift the finger from a string, which leaves the string muted.
+
+        Args:
+            string (int): String number, string 1 first.
+            fret (int | None, optional): Only lift the finger if it is on
+                this fret. Defaults to None.
+
+        Raises:
+            ValueError: String not on the fretboard.
+        """
+        self._check_string(string)
+        if fret is None or self._frets[string - 1] == fret:
+            self.mute(string)
+
+    def mute(self, string: int) -> None:
+        """Mute a string.
+
+        Raises:
+            ValueError: String not on the fretboard.
+        """
+        self._check_string(string)
+        fret = self._frets[string - 1]
+        if fret == MUTED:
+            return
+        pitch_class = self.fretboard.get_pitch_class(string, fret)
+        self._frets[string - 1] = MUTED
+        self._counts[pitch_class] -= 1
+        if not self._counts[pitch_class]:
+            self._mask &= ~(1 << pitch_class)
+        self._played_strings &= ~(1 << string)
+
+    def _check_string(self, string: int) -> None:
+        if not 1 <= string <= len(self._frets):
+            raise ValueError(f"string {string} is not on the fretboard")
+
+    @property
+    def frets(self) -> tuple[int, ...]:
+        return tuple(self._frets)
+
+    @property
+    def pitch_class_mask(self) -> int:
+        """Bitmask with bit n set when pitch class n is played."""
+        return self._mask
+
+    @property
+    def bass(self) -> int | None:
+        """Pitch class of the note on the lowest played string, None when all strings are muted."""
+        if not self._played_strings:
+            return None
+        string = self._played_strings.bit_length() - 1
+        return self.fretboard.get_pitch_class(string, self._frets[string - 1])
+
+    @property
+    def root_note_name(self) -> str | None:
+        bass = self.bass
+        return None if bass is None else NOTE_NAMES[bass]
+
+    @property
+    def quality(self) -> str | None:
+        bass = self.bass
+        if bass is None:
+            return None
+        # rotate the mask so that bit 0 is the bass note
+        relative = ((self._mask >> bass) | (self._mask << (12 - bass))) & 0xFFF
+        return ChordFormula.get_quality_from_mask(relative)
+
+    @property
+    def name(self) -> str | None:
+        """Name of the chord in the same format as main.find_chord_name_from_diagram(),
+        None when all strings are muted."""
+        bass = self.bass
+        return None if bass is None else f"{NOTE_NAMES[bass]} {self.quality}"
+
+    def to_diagram(self) -> ChordDiagram:
+        return Voicing(self._frets).to_diagram()
+
+
+if __name__ == "__main__":
+    session = ChordNameSession()
+    for string, fret in [(5, 0), (4, 2), (3, 2), (2, 1), (1, 0)]:
+        session.add(string, fret)
+        print(session.frets, session.name)
+    session.add(2, 2)
+    print(session.frets, session.name)
@@ -1,10 +1,16 @@
+import heapq
+import logging
 from dataclasses import dataclass
-from itertools import product
+from itertools import islice
+from typing import Callable, Iterable, Iterator
 
-from core.chords import Chords
-from core.notes import ChromaticNotes
-from core.fretboard import FretboardNotes
+from core.chords import ChordFormula, Chords, Intervals
+from core.fretboard import get_fretboard
 from core.music_scale import MusicScale, ScalePatterns
+from core.notes import NOTE_NAMES, ChromaticNotes
+from core.stats import DIAGRAMS_EMITTED, SHAPE_CANDIDATES, SHAPE_PRUNED, PipelineStats, current_stats
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -20,98 +26,277 @@ class ChordDiagram:
     muted_strings: list[int]
 
 
+def playability_score(diagram: ChordDiagram) -> int:
+    """Score how hard a chord diagram is to play, lower is easier.
+
+    The score grows with the fret span and the lowest fret of the fretted
+    notes, with the number of fretted notes and with the number of muted
+    strings.
+
+    Args:
+        diagram (ChordDiagram): Chord diagram to score.
+
+    Returns:
+        int: Playability score.
+    """
+    frets = [pos.fret for pos in diagram.shape]
+    span = max(frets) - min(frets) if frets else 0
+    lowest_fret = min(frets) if frets else 0
+    return 2 * span + lowest_fret + len(frets) + 2 * len(diagram.muted_strings)
+
+
+# rankings of chord diagrams by name, lower ranks first
+RANKS = {"playability": playability_score}
+
+
+def select_diagrams(
+    diagrams: Iterable[ChordDiagram], limit: int | None = None, rank: Callable[[ChordDiagram], float] | None = None
+) -> Iterator[ChordDiagram]:
+    """Select diagrams from a stream of diagrams.
+
+    Args:
+        diagrams (Iterable[ChordDiagram]): Stream of chord diagrams.
+        limit (int | None, optional): Maximum number of diagrams to yield.
+            Defaults to None.
+        rank (Callable[[ChordDiagram], float] | None, optional): Scoring
+            function where a lower score is a better diagram. Defaults to None.
+
+    Yields:
+        ChordDiagram: Chord diagram.
+    """
+    if rank is None:
+        yield from islice(diagrams, limit)
+    elif limit is None:
+        yield from sorted(diagrams, key=rank)
+    else:
+        # bounded heap of the best limit diagrams
+        yield from heapq.nsmallest(limit, diagrams, key=rank)
+
+
 class ChordShapes:
-    def __init__(
-        self,
-        tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E"),
-    ) -> None:
+    """
+    Generates chord diagrams of chords on a fretboard.
+
+    Args:
+        tuning (tuple[str, ...], optional): Open string notes, string 1 first.
+            Defaults to standard tuning.
+        transpose (bool, optional): Search the shapes of every chord quality
+            once and derive the shapes of all roots by shifting them along
+            the neck instead of searching every root. Produces the same
+            diagrams in the same order. Defaults to False.
+    """
+
+    MAX_FRET_RANGE = 3
+
+    def __init__(self, tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E"), transpose: bool = False) -> None:
         self.tuning = tuning
-        self.fretboard = FretboardNotes(tuning)
+        self.fretboard = get_fretboard(tuning)
+        # shifting every shape of a reference root by up to 11 frets only
+        # reaches all shapes of another root if the neck is long enough
+        self._transpose = transpose and self.fretboard.max_frets >= 11 + self.MAX_FRET_RANGE - 1
+        self._reference_shapes: dict[str, list[tuple[list[tuple[int, int]], int, int]]] = {}
 
     def get_chord_notes(self, key: str, quality: str) -> list[str]:
         c = Chords(key, quality)
         return c.notes
 
     def get_chord_diagram(self, root_note: str, quality: str) -> list[ChordDiagram]:
-        raw_shapes = self._get_shapes(root_note, quality)
-        filtered_shapes = self._filter_shapes(raw_shapes)
-        return self._check_open_strings(filtered_shapes, root_note, quality)
-
-    def _get_shapes(self, root: str, quality: str) -> list[tuple[tuple[int, int], ...]]:
-        # get chord notes translate flats to alternative names
-        notes = [
-            ChromaticNotes.get_standard_notation_from_alternative_notation(n) or n
-            for n in self.get_chord_notes(root, quality)
-        ]
-        chord_notes: dict[int, list[tuple[int, int]]] = {
-            idx: self.fretboard.get_fret_position_from_note(n) for idx, n in enumerate(notes)
-        }
-        # now get all possible combinations
-        return list(product(*chord_notes.values()))
-
-    def _filter_shapes(self, raw_shapes: list[tuple[tuple[int, int], ...]]):
-        # filter the resulting combinations such that:
-        #  - notes of a chord are no more than 3 frets apart
-        #  - all notes have to be on separate strings
-        unplayable_idx: list[int] = []
-        fret_ranges = list(map(lambda x: max(f[1] for f in x) - min(f[1] for f in x), raw_shapes))
-        unplayable_idx = [idx for idx, i in enumerate(fret_ranges) if i >= 3]
-
-        # identify combinations where different
-        # notes are played on the same string
-        different_strings = [idx for idx, i in enumerate(raw_shapes) if len({x[0] for x in i}) != len(i)]
-        unplayable_idx.extend(different_strings)
-
-        comb_filtered = [i for idx, i in enumerate(raw_shapes) if idx not in unplayable_idx]
-        # sort results in the order of strings
-        comb_filtered = [sorted(i, key=lambda x: x[0]) for i in comb_filtered]
-        return comb_filtered
-
-    def _check_open_strings(
-        self, raw_shapes: list[list[tuple[int, int]]], root: str, quality: str
-    ) -> list[ChordDiagram]:
+        return list(self.iter_chord_diagrams(root_note, quality))
+
+    def iter_chord_diagrams(
+        self,
+        root_note: str,
+        quality: str,
+        limit: int | None = None,
+        rank: Callable[[ChordDiagram], float] | None = None,
+    ) -> Iterator[ChordDiagram]:
+        """Lazily generate chord diagrams of a chord.
+
+        Without rank the diagrams are yielded in search order as soon as
+        each one is found. With rank the diagrams are yielded from the lowest
+        to the highest score, and if limit is also given only a heap of the
+        best limit diagrams is kept while the search runs.
+
+        Args:
+            root_note (str): Root note of the chord.
+            quality (str): Quality of the chord.
+            limit (int | None, optional): Maximum number of diagrams to yield.
+                Defaults to None.
+            rank (Callable[[ChordDiagram], float] | None, optional): Scoring
+                function where a lower score is a better diagram, for example
+                playability_score. Defaults to None.
+
+        Yields:
+            ChordDiagram: Chord diagram.
+        """
+        # note names are only converted at the edges, the search runs on pitch classes
+        root = ChromaticNotes.pitch_class(root_note)
+        scale = frozenset(self._get_scale(root_note, quality))
+        logger.debug("chord scale", extra={"root": root_note, "quality": quality, "scale": sorted(scale)})
+
+        stats = current_stats()
+        shapes = self._transposed_shapes(root, quality) if self._transpose else self._search_shapes(root_note, quality)
+        diagrams = (self._check_open_strings(shape, root, scale) for shape in shapes)
+        if stats is None:
+            yield from select_diagrams(diagrams, limit, rank)
+            return
+        for diagram in select_diagrams(diagrams, limit, rank):
+            stats.count(DIAGRAMS_EMITTED)
+            yield diagram
+
+    def _get_scale(self, root: str, quality: str) -> list[int]:
+        # only major and minor scale patterns exist, other chord
+        # qualities use the scale that matches their third
+        try:
+            pattern = ScalePatterns.__getitem__(quality)
+        except KeyError:
+            minor_third = Intervals.m3 in ChordFormula.__getitem__(quality).value
+            pattern = ScalePatterns.minor if minor_third else ScalePatterns.major
         s = MusicScale(root)
-        scale = s.scale(ScalePatterns.__getitem__(quality).value)
-        print(f"{scale=}")
-
-        res: list[ChordDiagram] = []
-
-        for shape in raw_shapes:
-            # get root note string
-            root_string = self.fretboard.get_root_note_string_from_chord_shape(shape, root)
-
-            played_strings: list[int] = [i[0] for i in shape]
-            raw_open_strings: list[int] = [i for i in range(1, 7) if i not in played_strings]
-            # if any of the notes are played on 0th fret
-            # remove those from played strings and add to
-            # open strings.
-            raw_open_strings.extend([i[0] for i in shape if i[1] == 0])
-            print(f"\n{raw_open_strings=}")
-            played_strings = [i[0] for i in shape if i[1] != 0]
-            print(f"{shape=}, {played_strings=}")
-            # if the open string is lower register than the root note
-            # then it will need to get muted
-            muted_strings: list[int] = [i for i in raw_open_strings if i > root_string]
-            # go through tuning and if a note is not depressed and
-            # it is still in the correct scale then add it to open_strings
-            open_strings = [
-                idx + 1
-                for idx, i in enumerate(self.tuning)
-                if i in scale and idx + 1 in raw_open_strings and idx + 1 not in muted_strings
-            ]
-            print(f"{open_strings=}")
-            muted_strings = [i for i in raw_open_strings if i not in open_strings]
-            print(f"{muted_strings=}")
-
-            # now remove all the muted strings and open strings
-            # from the original shape variable
-            shape = [i for i in shape if i[0] not in open_strings and i[0] not in muted_strings]
-
-            # Create FingerPosition objects
-            pos = [FingerPosition(i[0], i[1]) for i in shape]
-
-            res.append(ChordDiagram(shape=pos, open_strings=open_strings, muted_strings=muted_strings))
-        return res
+        return s.pitch_classes(pattern.value)
+
+    def _search_shapes(self, root: str, quality: str) -> Iterator[list[tuple[int, int]]]:
+        """Generate all playable shapes of a chord.
+
+        Chord notes are assigned to the fretboard one at a time and a partial
+        shape is abandoned as soon as it puts two notes on the same string or
+        its fret range reaches MAX_FRET_RANGE, so no unplayable combination
+        is ever built. Shapes are generated in the same order as the full
+        cartesian product of note positions would produce them.
+
+        Args:
+            root (str): Root note of the chord.
+            quality (str): Quality of the chord.
+
+        Yields:
+            list[tuple[int, int]]: Shape as a list of (string, fret) tuples
+                sorted in the order of strings.
+        """
+        pitch_classes = Chords(root, quality).pitch_classes
+        positions = [self.fretboard.get_fret_position_from_pitch_class(pc) for pc in pitch_classes]
+        yield from self._assign_positions(positions, [], 0, None, None, current_stats())
+
+    def _transposed_shapes(self, root: int, quality: str) -> Iterator[list[tuple[int, int]]]:
+        """Generate all playable shapes of a chord by shifting the shapes of the
+        same quality with pitch class 0 as the root, see _search_shapes().
+
+        A shape of the reference root moved by d frets is a shape of the root
+        d semitones higher as long as it stays on the fretboard, and every
+        shape of any root can be moved down to the reference root. Shapes are
+        sorted into the order the search would generate them in.
+
+        Args:
+            root (int): Pitch class of the root note of the chord.
+            quality (str): Quality of the chord.
+
+        Yields:
+            list[tuple[int, int]]: Shape as a list of (string, fret) tuples
+                sorted in the order of strings.
+        """
+        if quality not in self._reference_shapes:
+            self._reference_shapes[quality] = self._search_reference_shapes(quality)
+        max_fret = self.fretboard.max_frets
+
+        # shapes with their positions in the order of chord notes, the search
+        # iterates over the positions of every note in string and fret order so
+        # sorting these tuples gives the search order
+        shapes: set[tuple[tuple[int, int], ...]] = set()
+        for by_note, low, high in self._reference_shapes[quality]:
+            # every shift by root semitones plus a multiple of an octave that keeps the shape on the neck
+            for d in range(-low + (root + low) % 12, max_fret - high + 1, 12):
+                shapes.add(tuple((string, fret + d) for string, fret in by_note))
+
+        stats = current_stats()
+        for shape in sorted(shapes):
+            if stats is not None:
+                stats.count(SHAPE_CANDIDATES)
+            # sort results in the order of strings
+            yield sorted(shape)
+
+    def _search_reference_shapes(self, quality: str) -> list[tuple[list[tuple[int, int]], int, int]]:
+        # shapes of the chord with pitch class 0 as the root, with positions
+        # in the order of chord notes and the lowest and highest fret
+        note_index = {pc: i for i, pc in enumerate(Chords(NOTE_NAMES[0], quality).pitch_classes)}
+        references = []
+        for shape in self._search_shapes(NOTE_NAMES[0], quality):
+            by_note = sorted(shape, key=lambda pos: note_index[self.fretboard.get_pitch_class(*pos)])
+            frets = [f for _, f in shape]
+            references.append((by_note, min(frets), max(frets)))
+        return references
+
+    def _assign_positions(
+        self,
+        positions: list[list[tuple[int, int]]],
+        shape: list[tuple[int, int]],
+        used_strings: int,
+        low_fret: int | None,
+        high_fret: int | None,
+        stats: PipelineStats | None = None,
+    ) -> Iterator[list[tuple[int, int]]]:
+        if len(shape) == len(positions):
+            if stats is not None:
+                stats.count(SHAPE_CANDIDATES)
+            # sort results in the order of strings
+            yield sorted(shape, key=lambda x: x[0])
+            return
+        pruned = 0
+        for string, fret in positions[len(shape)]:
+            # all notes have to be on separate strings
+            if used_strings & (1 << string):
+                pruned += 1
+                continue
+            low = fret if low_fret is None else min(low_fret, fret)
+            high = fret if high_fret is None else max(high_fret, fret)
+            # notes of a chord have to be less than MAX_FRET_RANGE frets apart
+            if high - low >= self.MAX_FRET_RANGE:
+                pruned += 1
+                continue
+            shape.append((string, fret))
+            yield from self._assign_positions(positions, shape, used_strings | (1 << string), low, high, stats)
+            shape.pop()
+        if stats is not None:
+            stats.count(SHAPE_PRUNED, pruned)
+
+    def _check_open_strings(self, shape: list[tuple[int, int]], root: int, scale: frozenset[int]) -> ChordDiagram:
+        # get root note string
+        root_string = self.fretboard.get_root_string_from_pitch_class(shape, root)
+
+        played_strings: list[int] = [i[0] for i in shape]
+        raw_open_strings: list[int] = [i for i in range(1, len(self.tuning) + 1) if i not in played_strings]
+        # if any of the notes are played on 0th fret
+        # remove those from played strings and add to
+        # open strings.
+        raw_open_strings.extend([i[0] for i in shape if i[1] == 0])
+        # if the open string is lower register than the root note
+        # then it will need to get muted
+        muted_strings: list[int] = [i for i in raw_open_strings if i > root_string]
+        # go through tuning and if a note is not depressed and
+        # it is still in the correct scale then add it to open_strings
+        open_strings = [
+            idx + 1
+            for idx, i in enumerate(self.fretboard.open_pitch_classes)
+            if i in scale and idx + 1 in raw_open_strings and idx + 1 not in muted_strings
+        ]
+        muted_strings = sorted(i for i in raw_open_strings if i not in open_strings)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "open strings checked",
+                extra={
+                    "shape": shape,
+                    "raw_open_strings": raw_open_strings,
+                    "open_strings": open_strings,
+                    "muted_strings": muted_strings,
+                },
+            )
+
+        # now remove all the muted strings and open strings
+        # from the original shape variable
+        shape = [i for i in shape if i[0] not in open_strings and i[0] not in muted_strings]
+
+        # Create FingerPosition objects
+        pos = [FingerPosition(i[0], i[1]) for i in shape]
+
+        return ChordDiagram(shape=pos, open_strings=open_strings, muted_strings=muted_strings)
 
 
 if __name__ == "__main__":
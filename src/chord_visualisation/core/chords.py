@@ -1,6 +1,10 @@
+import logging
 from enum import Enum
+from typing import Iterable
 
-from core.notes import ChromaticNotes
+from core.notes import NOTE_NAMES, ChromaticNotes
+
+logger = logging.getLogger(__name__)
 
 
 class Intervals(Enum):
@@ -46,18 +50,59 @@ class ChordFormula(Enum):
         lookup = dict(zip([v.value for v in cls._member_map_.values()], cls._member_map_.keys()))
         return lookup.get(intervals)
 
+    @classmethod
+    def get_quality_from_mask(cls, mask: int) -> str | None:
+        """Get a chord quality by providing a bitmask of semitone distances from the root,
+        see interval_mask()"""
+        return _QUALITY_BY_MASK.get(mask)
+
+
+def interval_mask(distances: Iterable[int]) -> int:
+    """Create a bitmask with bit n set for every distance of n semitones from the root.
+
+    Args:
+        distances (Iterable[int]): Semitone distances from the root note.
+
+    Returns:
+        int: Bitmask of the distances.
+    """
+    mask = 0
+    for d in distances:
+        mask |= 1 << d
+    return mask
+
+
+# Intervals above an octave (M9) are not folded into the octave, so
+# formulas containing them never match the mask of a played chord.
+# formula that comes first wins, as in a linear search over ChordFormula
+_QUALITY_BY_MASK: dict[int, str] = {
+    interval_mask(i.value for i in formula.value): name for name, formula in reversed(ChordFormula.__members__.items())
+}
+
+
+# semitone distances of the notes of every chord formula within one octave
+# in ascending order, intervals above an octave (M9) are left out
+_FORMULA_DISTANCES: dict[str, tuple[int, ...]] = {
+    name: tuple(sorted({i.value for i in formula.value if i.value < 12}))
+    for name, formula in ChordFormula.__members__.items()
+}
+
 
 class Chords:
     def __init__(self, key: str, quality: str) -> None:
         self.key = key
         self.quality = quality
+        self.root = ChromaticNotes.pitch_class(key)
         self.scale: dict[str, int] = ChromaticNotes.get_full_octave_of_notes_and_distance_from_starting_note(self.key)
 
+    @property
+    def pitch_classes(self) -> list[int]:
+        return [(self.root + d) % 12 for d in _FORMULA_DISTANCES[self.quality]]
+
     @property
     def notes(self):
-        print(ChordFormula.__getitem__(self.quality))
-        ranges: tuple[int, ...] = tuple(i.value for i in ChordFormula.__getitem__(self.quality).value)
-        return [k for k, v in self.scale.items() if v in ranges]
+        logger.debug("chord notes", extra={"key": self.key, "quality": self.quality})
+        return [NOTE_NAMES[pc] for pc in self.pitch_classes]
 
 
 if __name__ == "__main__":
@@ -1,42 +1,95 @@
-from core.notes import ChromaticNotes
+from functools import lru_cache
+from typing import Sequence
+
+from core.notes import NOTE_NAMES, ChromaticNotes
 
 
 class FretboardNotes:
-    chromatic_scale = ChromaticNotes.get_standard_notations_for_full_octave_from_starting_note("A")
+    chromatic_scale = list(NOTE_NAMES)
 
     def __init__(self, tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E"), max_frets: int = 13) -> None:
         self._tuning = tuning
         self._max_frets = max_frets
+        # pitch classes of open strings, string 1 first
+        self.open_pitch_classes: tuple[int, ...] = tuple(ChromaticNotes.pitch_class(note) for note in tuning)
         self._populate_all_strings()
 
     def _populate_all_strings(self):
-        string_notes: dict[str, list[str]] = {}
-        for open_note in self._tuning:
-            string_notes[open_note] = []
-            for fret in range(self._max_frets + 1):
-                string_notes[open_note].append(
-                    self.chromatic_scale[(self.chromatic_scale.index(open_note) + fret) % 12]
-                )
+        # notes and pitch classes of every fret keyed by string number, so
+        # strings tuned to the same note are kept apart
+        string_notes: dict[int, list[str]] = {}
+        string_pitch_classes: dict[int, list[int]] = {}
+        for string, open_pitch_class in enumerate(self.open_pitch_classes, start=1):
+            string_pitch_classes[string] = [(open_pitch_class + fret) % 12 for fret in range(self._max_frets + 1)]
+            string_notes[string] = [NOTE_NAMES[pc] for pc in string_pitch_classes[string]]
         self.string_notes = string_notes
 
+        # (string, fret) positions of every pitch class in the order of strings and frets
+        positions: list[list[tuple[int, int]]] = [[] for _ in range(12)]
+        for string, pitch_classes in string_pitch_classes.items():
+            for fret, pitch_class in enumerate(pitch_classes):
+                positions[pitch_class].append((string, fret))
+        self._positions: tuple[tuple[tuple[int, int], ...], ...] = tuple(tuple(p) for p in positions)
+
+    @property
+    def max_frets(self) -> int:
+        return self._max_frets
+
+    def check_frets(self, frets: Sequence[int]) -> None:
+        """Check that frets give a fret on this fretboard for every string.
+
+        Args:
+            frets (Sequence[int]): Fret of every string, string 1 first, with
+                0 for an open string and -1 for a muted string.
+
+        Raises:
+            ValueError: Wrong number of strings or a fret not on the fretboard.
+        """
+        if len(frets) != len(self._tuning):
+            raise ValueError(f"expected frets of {len(self._tuning)} strings, got {len(frets)}")
+        for fret in frets:
+            if type(fret) is not int or not -1 <= fret <= self._max_frets:
+                raise ValueError(f"fret {fret!r} has to be -1 or from 0 to {self._max_frets}")
+
+    def get_pitch_class(self, string: int, fret: int) -> int:
+        return (self.open_pitch_classes[string - 1] + fret) % 12
+
     def get_note(self, string: int, fret: int) -> str:
-        open_note = self._tuning[string - 1]
-        return self.chromatic_scale[(self.chromatic_scale.index(open_note) + fret) % 12]
+        return NOTE_NAMES[(self.open_pitch_classes[string - 1] + fret) % 12]
+
+    def get_fret_position_from_pitch_class(self, pitch_class: int) -> list[tuple[int, int]]:
+        return list(self._positions[pitch_class])
 
     def get_fret_position_from_note(self, note: str):
-        positions: list[tuple[int, int]] = []
-        for string_no, open_note in enumerate(self.string_notes.keys()):
-            frets = [idx for idx, i in enumerate(self.string_notes[open_note]) if i == note]
-            positions.extend([(string_no + 1, f) for f in frets])
-            if string_no == 0:
-                positions.extend([(6, f) for f in frets])
-        return positions
+        return list(self._positions[ChromaticNotes.pitch_class(note)])
 
-    def get_root_note_string_from_chord_shape(self, shape: list[tuple[int, int]], root_note: str) -> int:
-        roots: list[int] = [string for string, fret in shape if self.get_note(string, fret) == root_note]
-        roots.extend([idx + 1 for idx, i in enumerate(self._tuning) if i == root_note])
+    def get_root_string_from_pitch_class(self, shape: list[tuple[int, int]], root_pitch_class: int) -> int:
+        roots: list[int] = [string for string, fret in shape if self.get_pitch_class(string, fret) == root_pitch_class]
+        roots.extend([idx + 1 for idx, pc in enumerate(self.open_pitch_classes) if pc == root_pitch_class])
         return max(roots)
 
+    def get_root_note_string_from_chord_shape(self, shape: list[tuple[int, int]], root_note: str) -> int:
+        return self.get_root_string_from_pitch_class(shape, ChromaticNotes.pitch_class(root_note))
+
+
+def get_fretboard(tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E"), max_frets: int = 13) -> FretboardNotes:
+    """Get the fretboard of a tuning, shared by everything that uses the same tuning.
+
+    Args:
+        tuning (tuple[str, ...], optional): Open string notes, string 1 first.
+            Defaults to standard tuning.
+        max_frets (int, optional): Number of frets. Defaults to 13.
+
+    Returns:
+        FretboardNotes: Fretboard of the tuning.
+    """
+    return _get_fretboard(tuple(tuning), max_frets)
+
+
+@lru_cache(maxsize=None)
+def _get_fretboard(tuning: tuple[str, ...], max_frets: int) -> FretboardNotes:
+    return FretboardNotes(tuning, max_frets)
+
 
 if __name__ == "__main__":
     f = FretboardNotes()
@@ -1,6 +1,7 @@
 from enum import Enum
+from functools import lru_cache
 
-from core.notes import ChromaticNotes
+from core.notes import NOTE_NAMES, ChromaticNotes
 
 
 class ScalePatterns(Enum):
@@ -30,15 +31,22 @@ class MusicScale:
             list[int]: List of integers of scale intervals from
                 the key note.
         """
-        inter = [1 if i == "H" else 2 for i in pattern.split("-")]
-        cumsum: list[int] = [0]  # starting with 0 because key note alway will be in the scale.
-        running_sum = 0
+        return list(_pattern_intervals(pattern))
 
-        for i in inter:
-            running_sum += i
-            cumsum.append(running_sum)
+    def pitch_classes(self, pattern: str) -> list[int]:
+        """Generate pitch classes of all notes in a music scale
+        following specific pattern, see ChromaticNotes.pitch_class().
 
-        return cumsum
+        Args:
+            pattern (str): A String of scale pattern with
+                "W" indicating a full note and "H" indicating
+                a half note.
+
+        Returns:
+            list[int]: List of pitch classes starting from the key note.
+        """
+        root = ChromaticNotes.pitch_class(self._key)
+        return [(root + i) % 12 for i in _pattern_intervals(pattern) if i < 12]
 
     def scale(self, pattern: str) -> list[str]:
         """Generate major scale following specific pattern
@@ -49,11 +57,21 @@ class MusicScale:
                 a half note.
 
         """
-        notes_and_intervals = ChromaticNotes.get_full_octave_of_notes_and_distance_from_starting_note("A")
-        intervals = self._pattern_to_intervals(pattern)
+        return [NOTE_NAMES[pc] for pc in self.pitch_classes(pattern)]
+
+
+@lru_cache(maxsize=None)
+def _pattern_intervals(pattern: str) -> tuple[int, ...]:
+    # scale patterns are parsed once
+    inter = [1 if i == "H" else 2 for i in pattern.split("-")]
+    cumsum: list[int] = [0]  # starting with 0 because key note alway will be in the scale.
+    running_sum = 0
+
+    for i in inter:
+        running_sum += i
+        cumsum.append(running_sum)
 
-        res_scale: list[str] = [key for key, value in notes_and_intervals.items() if value in intervals]
-        return res_scale
+    return tuple(cumsum)
 
 
 if __name__ == "__main__":
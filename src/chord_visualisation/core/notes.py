@@ -37,6 +37,57 @@ class ChromaticNotes(enum.Enum):
     G = MusicalNote("G", "G", 49, None)
     G_sharp = MusicalNote("G#", "Ab", 51.91, None)
 
+    @classmethod
+    def pitch_class(cls, note: str) -> int:
+        """Get the pitch class of a note, counted in semitones from A.
+
+        Args:
+            note (str): Standard or alternative notation of the musical note.
+
+        Raises:
+            ValueError: Unknown note.
+
+        Returns:
+            int: Pitch class from 0 to 11.
+        """
+        try:
+            return _PITCH_CLASSES[note]
+        except KeyError:
+            raise ValueError(f"unknown note {note}") from None
+
+    @classmethod
+    def note_name(cls, pitch_class: int) -> str:
+        """Get the standard notation of a pitch class, see pitch_class().
+
+        Args:
+            pitch_class (int): Pitch class, counted in semitones from A.
+
+        Returns:
+            str: Standard notation of the musical note.
+        """
+        return NOTE_NAMES[pitch_class % 12]
+
+    @classmethod
+    def frequency(cls, note: str, octave: int) -> float:
+        """Get the frequency of a note in scientific pitch notation, e.g. A4 is 440 Hz.
+
+        The base frequencies of ChromaticNotes run from A0 to G#1, octaves
+        in scientific pitch notation start at C.
+
+        Args:
+            note (str): Standard or alternative notation of the musical note.
+            octave (int): Octave of the note.
+
+        Raises:
+            ValueError: Unknown note.
+
+        Returns:
+            float: Frequency in Hz.
+        """
+        pitch_class = cls.pitch_class(note)
+        base_octave = 0 if pitch_class < _C else 1
+        return NOTES[pitch_class].base_frequency * 2 ** (octave - base_octave)
+
     @classmethod
     def get_note_by_standard_notation(cls, standard_notation: str) -> MusicalNote:
         """Get a MusicalNote object by standard notation.
@@ -44,24 +95,26 @@ class ChromaticNotes(enum.Enum):
         Args:
             standard_notation (str): Standard notation of the musical note.
 
+        Raises:
+            KeyError: Unknown standard notation.
+
         Returns:
             MusicalNote: MusicalNote object.
         """
-        return [i.value for i in cls.__members__.values() if i.value.standard_notation == standard_notation][0]
+        return NOTES[_STANDARD_PITCH_CLASSES[standard_notation]]
 
     @classmethod
-    def get_note_by_alternative_notation(cls, alternative_notation: str) -> MusicalNote:
+    def get_note_by_alternative_notation(cls, alternative_notation: str) -> MusicalNote | None:
         """Get a MusicalNote object by alternative notation.
 
         Args:
             alternative_notation (str): Alternative notation of the musical note.
 
         Returns:
-            MusicalNote: MusicalNote object.
+            MusicalNote | None: MusicalNote object, None for an unknown notation.
         """
-        for note in cls:
-            if note.value.alternative_notation == alternative_notation:
-                return note.value
+        pitch_class = _ALTERNATIVE_PITCH_CLASSES.get(alternative_notation)
+        return None if pitch_class is None else NOTES[pitch_class]
 
     @classmethod
     def get_full_octave_from_starting_note(cls, starting_note: str) -> list[MusicalNote]:
@@ -76,13 +129,10 @@ class ChromaticNotes(enum.Enum):
         Returns:
             list[MusicalNote]: List of MusicalNote objects.
         """
-        for idx, i in enumerate(cls.__members__.values()):
-            if i.value.standard_notation == starting_note:
-                starting_note_index = idx
-                break
-        else:
-            raise ValueError("starting note not in list")
-        return [i.value for i in cls][starting_note_index:] + [i.value for i in cls][:starting_note_index]
+        try:
+            return list(_OCTAVES[_STANDARD_PITCH_CLASSES[starting_note]])
+        except KeyError:
+            raise ValueError("starting note not in list") from None
 
     @classmethod
     def get_full_octave_of_notes_and_distance_from_starting_note(cls, starting_note: str) -> dict[str, int]:
@@ -94,10 +144,8 @@ class ChromaticNotes(enum.Enum):
         Returns:
             dict[str, int]: Dictionary of musical note standard notations and their distances from the starting note.
         """
-        return {
-            note.standard_notation: distance
-            for distance, note in enumerate(cls.get_full_octave_from_starting_note(starting_note))
-        }
+        octave = _OCTAVES[cls.pitch_class(starting_note)]
+        return {note.standard_notation: distance for distance, note in enumerate(octave)}
 
     @classmethod
     def get_standard_notations_for_full_octave_from_starting_note(cls, starting_note: str) -> list[str]:
@@ -109,7 +157,7 @@ class ChromaticNotes(enum.Enum):
         Returns:
             list[str]: List of musical note standard notations.
         """
-        return [i.standard_notation for i in cls.get_full_octave_from_starting_note(starting_note)]
+        return [note.standard_notation for note in _OCTAVES[cls.pitch_class(starting_note)]]
 
     @classmethod
     def get_standard_notation_from_alternative_notation(cls, alternative_notation: str) -> str:
@@ -123,10 +171,21 @@ class ChromaticNotes(enum.Enum):
         Returns:
             str: Standard notation of the musical note.
         """
-        try:
-            return cls.get_note_by_alternative_notation(alternative_notation).standard_notation
-        except AttributeError:
-            return alternative_notation
+        pitch_class = _ALTERNATIVE_PITCH_CLASSES.get(alternative_notation)
+        return alternative_notation if pitch_class is None else NOTE_NAMES[pitch_class]
+
+
+# Lookup tables indexed by pitch class, the position of a note in
+# ChromaticNotes counted in semitones from A. Note names are converted
+# to pitch classes once and everything else works on integers.
+NOTES: tuple[MusicalNote, ...] = tuple(note.value for note in ChromaticNotes)
+NOTE_NAMES: tuple[str, ...] = tuple(note.standard_notation for note in NOTES)
+_STANDARD_PITCH_CLASSES: dict[str, int] = {note.standard_notation: pc for pc, note in enumerate(NOTES)}
+_ALTERNATIVE_PITCH_CLASSES: dict[str, int] = {note.alternative_notation: pc for pc, note in enumerate(NOTES)}
+_PITCH_CLASSES: dict[str, int] = {**_ALTERNATIVE_PITCH_CLASSES, **_STANDARD_PITCH_CLASSES}
+_C = _STANDARD_PITCH_CLASSES["C"]
+# full octave of notes starting from every pitch class
+_OCTAVES: tuple[tuple[MusicalNote, ...], ...] = tuple(NOTES[pc:] + NOTES[:pc] for pc in range(12))
 
 
 if __name__ == "__main__":
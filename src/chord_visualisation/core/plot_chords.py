@@ -1,13 +1,37 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-from sklearn.linear_model import LinearRegression
 
-from core.chord_shapes import ChordShapes
+from core.atlas import build_atlas, save_atlas
+from core.chord_shapes import ChordDiagram, ChordShapes
+from core.render_cache import RenderCache, file_digest, render_key
+from core.stats import COORDINATE_MAPPING, RENDER, current_stats, timed
+from core.voicing_library import VoicingLibrary
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.image import AxesImage
+
+    from core.raster_render import RasterRenderer
+    from core.svg_render import SvgRenderer
+
+T = TypeVar("T")
+
+
+def _pyplot():
+    """Import matplotlib.pyplot on first render, so that importing this module
+    does not load the plotting stack."""
+    import matplotlib.pyplot as plt
+
+    return plt
 
 
 class FretboardToCoord:
@@ -30,13 +54,14 @@ class FretboardToCoord:
         15: 1195,
     }
 
-    string_reg_data: dict[int, dict[str, NDArray[np.int64]]] = {
-        1: {"x": np.array([[86, 1485]]).reshape(-1, 1), "y": np.array([70, 54])},
-        2: {"x": np.array([[85, 1479]]).reshape(-1, 1), "y": np.array([93, 84])},
-        3: {"x": np.array([[83, 1479]]).reshape(-1, 1), "y": np.array([116, 115])},
-        4: {"x": np.array([[81, 1479]]).reshape(-1, 1), "y": np.array([140, 146])},
-        5: {"x": np.array([[81, 1479]]).reshape(-1, 1), "y": np.array([162, 176])},
-        6: {"x": np.array([[81, 1479]]).reshape(-1, 1), "y": np.array([187, 207])},
+    # two (x, y) points on the image that each string passes through
+    string_line_points: dict[int, tuple[tuple[int, int], tuple[int, int]]] = {
+        1: ((86, 70), (1485, 54)),
+        2: ((85, 93), (1479, 84)),
+        3: ((83, 116), (1479, 115)),
+        4: ((81, 140), (1479, 146)),
+        5: ((81, 162), (1479, 176)),
+        6: ((81, 187), (1479, 207)),
     }
 
     open_coords: dict[int, tuple[int, int]] = {
@@ -48,13 +73,60 @@ class FretboardToCoord:
         6: (61, 195),
     }
 
+    def __init__(self) -> None:
+        # x coordinate of every fret and slope/intercept of every string
+        # line, indexed by fret number and string number
+        self._fret_x: NDArray[np.int64] = np.array([self.fret_x_coord[f] for f in sorted(self.fret_x_coord)])
+        points = np.array([self.string_line_points[s] for s in sorted(self.string_line_points)], dtype=np.float64)
+        (x1, y1), (x2, y2) = points[:, 0].T, points[:, 1].T
+        slopes = (y2 - y1) / (x2 - x1)
+        self._slopes: NDArray[np.float64] = np.concatenate([[np.nan], slopes])
+        self._intercepts: NDArray[np.float64] = np.concatenate([[np.nan], y1 - slopes * x1])
+
     def get_fretboard_coords(self, string: int, fret: int) -> tuple[int, int]:
-        reg: LinearRegression = LinearRegression().fit(
-            self.string_reg_data[string]["x"], self.string_reg_data[string]["y"]
+        x, y = self.coords(np.array([string]), np.array([fret]))
+        return int(x[0]), int(y[0])
+
+    def coords(
+        self, strings: NDArray[np.integer], frets: NDArray[np.integer]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get image coordinates of many fretboard positions at once.
+
+        Args:
+            strings (NDArray[np.integer]): String numbers.
+            frets (NDArray[np.integer]): Fret numbers, same shape as strings.
+
+        Returns:
+            tuple[NDArray[np.int64], NDArray[np.int64]]: x and y coordinates.
+        """
+        strings = np.asarray(strings)
+        x = self._fret_x[np.asarray(frets)]
+        y = (self._slopes[strings] * x + self._intercepts[strings]).astype(np.int64)
+        return x, y
+
+    def diagram_coords(self, diagram: ChordDiagram) -> "CoordinateDiagram":
+        """Get image coordinates of all fretted notes of a chord diagram.
+
+        Args:
+            diagram (ChordDiagram): Chord diagram.
+
+        Returns:
+            CoordinateDiagram: Chord diagram in image coordinates.
+        """
+        stats = current_stats()
+        start = time.perf_counter() if stats is not None else 0.0
+        x, y = self.coords(
+            np.array([note.string for note in diagram.shape], dtype=np.int64),
+            np.array([note.fret for note in diagram.shape], dtype=np.int64),
         )
-        x_coord: int = self.fret_x_coord[fret]
-        y_coord: int = int(reg.predict(np.array([x_coord]).reshape(-1, 1))[0])
-        return x_coord, y_coord
+        coords = CoordinateDiagram(
+            shape_coords=list(zip(x.tolist(), y.tolist())),
+            open_strings=diagram.open_strings,
+            muted_strings=diagram.muted_strings,
+        )
+        if stats is not None:
+            stats.add_time(COORDINATE_MAPPING, time.perf_counter() - start)
+        return coords
 
 
 @dataclass
@@ -64,85 +136,543 @@ class CoordinateDiagram:
     muted_strings: list[int]
 
 
+@lru_cache(maxsize=4)
+def read_base_image(path: str) -> NDArray[np.float32]:
+    """Decode a base image once per process.
+
+    Args:
+        path (str): Path of the image.
+
+    Returns:
+        NDArray[np.float32]: Image array, must not be modified.
+    """
+    import matplotlib.image
+
+    im = matplotlib.image.imread(path)
+    im.flags.writeable = False
+    return im
+
+
+def _reuse_rasterised_image(image: "AxesImage") -> None:
+    """Resample an image only on its first draw with each renderer setup.
+
+    The fretboard never changes between diagrams, so the resampled array is
+    reused as long as the kind of renderer, the resolution and the size of
+    the canvas and of the image on it stay the same. Vector backends key
+    embedded images by object identity, so a multi-page PDF then holds a
+    single copy of the image.
+    """
+    make_image = image.make_image
+    cache: dict[tuple, tuple] = {}
+
+    def cached_make_image(renderer, magnification=1.0, unsampled=False):
+        key = (
+            type(renderer),
+            image.figure.dpi,
+            renderer.get_canvas_width_height(),
+            image.get_window_extent(renderer).bounds,
+            magnification,
+            unsampled,
+        )
+        if key not in cache:
+            cache[key] = make_image(renderer, magnification, unsampled=unsampled)
+        return cache[key]
+
+    image.make_image = cached_make_image
+
+
+class FigureRenderer:
+    """
+    Renders chord diagrams on a single long-lived figure.
+
+    The base image is decoded and drawn once. For every diagram only the
+    markers, open/muted string labels and the title are updated and
+    blitted onto a saved copy of the background on the Agg canvas, and
+    the canvas buffer is written straight to PNG.
+
+    Args:
+        base_img (str): Path of the fretboard image.
+        dpi (int): Resolution of the figure.
+        figsize (tuple[float, float]): Size of the figure in inches.
+        color (str): Colour of markers and labels.
+        n_strings (int, optional): Number of strings. Defaults to 6.
+    """
+
+    suffix = ".png"
+
+    def __init__(
+        self,
+        base_img: str,
+        dpi: int,
+        figsize: tuple[float, float],
+        color: str,
+        n_strings: int = 6,
+        blit: bool = True,
+    ) -> None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self._dpi = dpi
+        self._blit = blit
+        # figure is not managed by pyplot, so it stays alive without leaking into plt state
+        self._fig = Figure(figsize=figsize, dpi=dpi)
+        self._canvas = FigureCanvasAgg(self._fig)
+        self._ax = self._fig.subplots()
+        image = self._ax.imshow(read_base_image(base_img))
+        self._ax.set_axis_off()
+        _reuse_rasterised_image(image)
+
+        self._title = self._ax.set_title("")
+        self._markers = self._ax.scatter(np.empty(0), np.empty(0), color=color, s=70)
+        self._labels = [self._ax.text(x=0, y=0, s="", color=color, fontsize=15) for _ in range(n_strings)]
+        if blit:
+            for artist in [self._title, self._markers, *self._labels]:
+                artist.set_animated(True)
+            self._canvas.draw()
+            self._background = self._canvas.copy_from_bbox(self._fig.bbox)
+
+    @property
+    def figure(self) -> "Figure":
+        return self._fig
+
+    def update(self, diagram: CoordinateDiagram, title: str) -> None:
+        """Update the figure artists to show a chord diagram without drawing the figure.
+
+        Args:
+            diagram (CoordinateDiagram): Chord diagram in image coordinates.
+            title (str): Title of the plot.
+        """
+        self._markers.set_offsets(np.array(diagram.shape_coords, dtype=np.float64).reshape(-1, 2))
+        # title is only shown when there are fretted notes, same as ChordShapePlot.plot_by_idx()
+        self._title.set_text(title if diagram.shape_coords else "")
+
+        labels = [(i, "O") for i in diagram.open_strings] + [(i, "X") for i in diagram.muted_strings]
+        for label, (string, text) in zip(self._labels, labels):
+            label.set_position(FretboardToCoord.open_coords[string])
+            label.set_text(text)
+        for label in self._labels[len(labels) :]:
+            label.set_text("")
+
+    def render(self, diagram: CoordinateDiagram, title: str) -> NDArray[np.uint8]:
+        """Render a chord diagram.
+
+        Args:
+            diagram (CoordinateDiagram): Chord diagram in image coordinates.
+            title (str): Title of the plot.
+
+        Returns:
+            NDArray[np.uint8]: RGBA view of the canvas, valid until the next render.
+        """
+        self.update(diagram, title)
+        if not self._blit:
+            self._canvas.draw()
+            return np.asarray(self._canvas.buffer_rgba())
+
+        self._canvas.restore_region(self._background)
+        for artist in [self._title, self._markers, *self._labels]:
+            self._ax.draw_artist(artist)
+        return np.asarray(self._canvas.buffer_rgba())
+
+    def save(self, diagram: CoordinateDiagram, title: str, path: str | Path) -> None:
+        import matplotlib.image
+
+        matplotlib.image.imsave(str(path), self.render(diagram, title), dpi=self._dpi)
+
+
+@lru_cache(maxsize=4)
+def get_renderer(
+    backend: str, base_img: str, dpi: int, figsize: tuple[float, float], color: str
+) -> "FigureRenderer | RasterRenderer | SvgRenderer":
+    """Get the renderer shared by all plots of this process with the same settings.
+
+    Args:
+        backend (str): "raster", "svg" or any other value for matplotlib.
+        base_img (str): Path of the fretboard image.
+        dpi (int): Resolution of matplotlib figures.
+        figsize (tuple[float, float]): Size of matplotlib figures in inches.
+        color (str): Color of the finger positions.
+
+    Returns:
+        FigureRenderer | RasterRenderer | SvgRenderer: Cached renderer.
+    """
+    if backend == "raster":
+        from core.raster_render import RasterRenderer
+
+        return RasterRenderer(base_img, FretboardToCoord.open_coords, color)
+    if backend == "svg":
+        from core.svg_render import SvgRenderer
+
+        return SvgRenderer(base_img, FretboardToCoord.open_coords, color)
+    return FigureRenderer(base_img, dpi, figsize, color)
+
+
 class ChordShapePlot:
     BASE_IMG = "images/fretboard_2.png"
+    DPI = 600
+    FIGSIZE = (20, 5)
+    COLOR = "orangered"
+    BACKENDS = ("pyplot", "figure", "raster", "svg")
 
-    def __init__(self, chord_root_note: str, chord_quality: str) -> None:
+    def __init__(
+        self,
+        chord_root_note: str,
+        chord_quality: str,
+        limit: int | None = None,
+        rank: Callable[[ChordDiagram], float] | None = None,
+        library: VoicingLibrary | None = None,
+        cache: RenderCache | None = None,
+        backend: str = "pyplot",
+    ) -> None:
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend has to be one of {self.BACKENDS}")
         self._root_note = chord_root_note
         self._quality = chord_quality
+        self._limit = limit
+        self._rank = rank
         self._converter = FretboardToCoord()
-        self._shapes = ChordShapes()
+        self._library = library
+        self._cache = cache
+        self._backend = backend
+        self._shapes: ChordShapes | VoicingLibrary = library or ChordShapes()
         self.diags = self.get_note_locations()
 
-    def _create_base_image(self, no_subplots: int) -> list[Axes]:
-        _, axs = plt.subplots(no_subplots, figsize=(20, 5 * no_subplots), dpi=600)
+    def _create_base_image(self, no_subplots: int) -> list["Axes"]:
+        plt = _pyplot()
+        _, axs = plt.subplots(no_subplots, figsize=(self.FIGSIZE[0], self.FIGSIZE[1] * no_subplots), dpi=self.DPI)
         im: NDArray[np.int64] = plt.imread(self.BASE_IMG)
         if no_subplots == 1:
             axs.imshow(im)
             axs.set_axis_off()
             return axs
         else:
-            base: list[Axes] = []
+            base: list["Axes"] = []
             for a in axs:
                 a.imshow(im)
                 a.set_axis_off()
                 base.append(a)
             return base
 
-    def _display_open_strings(self, ax: Axes, strings: list[int], fontsize: int = 15):
+    def _display_open_strings(self, ax: "Axes", strings: list[int], fontsize: int = 15):
         coords = [FretboardToCoord.open_coords[i] for i in strings]
         for c in coords:
-            ax.text(x=c[0], y=c[1], s="O", color="orangered", fontsize=fontsize)
+            ax.text(x=c[0], y=c[1], s="O", color=self.COLOR, fontsize=fontsize)
 
-    def _display_muted_strings(self, ax: Axes, strings: list[int], fontsize: int = 15):
+    def _display_muted_strings(self, ax: "Axes", strings: list[int], fontsize: int = 15):
         coords = [FretboardToCoord.open_coords[i] for i in strings]
         for c in coords:
-            ax.text(x=c[0], y=c[1], s="X", color="orangered", fontsize=fontsize)
+            ax.text(x=c[0], y=c[1], s="X", color=self.COLOR, fontsize=fontsize)
 
     def get_note_locations(self) -> list[CoordinateDiagram]:
-        diagrams: list[CoordinateDiagram] = []
-        for diagram in self._shapes.get_chord_diagram(self._root_note, self._quality):
-            full_shape = []
-            for note in diagram.shape:
-                x, y = self._converter.get_fretboard_coords(note.string, note.fret)
-                full_shape.append((x, y))
-            diagrams.append(
-                CoordinateDiagram(
-                    shape_coords=full_shape, open_strings=diagram.open_strings, muted_strings=diagram.muted_strings
-                )
-            )
-        return diagrams
-
-    def plot_all(self):
+        return list(self.iter_note_locations())
+
+    def iter_note_locations(self) -> Iterator[CoordinateDiagram]:
+        diagrams = self._shapes.iter_chord_diagrams(self._root_note, self._quality, limit=self._limit, rank=self._rank)
+        for diagram in diagrams:
+            yield self._converter.diagram_coords(diagram)
+
+    def plot_all(self, atlas: bool = False, tile_width: int = 400, columns: int = 4):
+        plt = _pyplot()
+        if atlas:
+            im, _ = self._build_atlas(tile_width, columns)
+            _, ax = plt.subplots(figsize=(10, 10 * im.shape[0] / max(im.shape[1], 1)))
+            ax.imshow(im)
+            ax.set_axis_off()
+            plt.show()
+            return
         axs = self._create_base_image(no_subplots=len(self.diags))
         for idx, i in enumerate(self.diags):
             self._display_open_strings(axs[idx], i.open_strings, fontsize=7 // len(self.diags))
             self._display_muted_strings(axs[idx], i.muted_strings, fontsize=9 // len(self.diags))
             for note in i.shape_coords:
-                axs[idx].scatter(note[0], note[1], color="orangered", s=0.05 / len(self.diags))
+                axs[idx].scatter(note[0], note[1], color=self.COLOR, s=0.05 / len(self.diags))
         plt.axis("off")
         plt.show()
 
     def plot_by_idx(self, idx: int, save: bool = False, save_path: Path | None = None):
-        ax = self._create_base_image(no_subplots=1)
+        with timed(RENDER):
+            self._plot_by_idx(idx, save, save_path)
+
+    def _plot_by_idx(self, idx: int, save: bool, save_path: Path | None):
         chord_shape = self.diags[idx]
+        title = f"{self._root_note}{self._quality} chord |  plot# [{idx}]"
+        if save and save_path:
+            suffix = ".svg" if self._backend == "svg" else ".png"
+            dest = Path(save_path / f"{self._root_note}{self._quality}_{idx}{suffix}")
+            if self._cache:
+                key = self._render_key(chord_shape, title, dest)
+                if self._cache.get(key, dest):
+                    return
+                # dest may be a hard link into the cache, never write through it
+                dest.unlink(missing_ok=True)
+            if self._backend != "pyplot":
+                self._get_renderer().save(chord_shape, title, dest)
+                if self._cache:
+                    self._cache.put(key, dest)
+                return
+
+        plt = _pyplot()
+        ax = self._create_base_image(no_subplots=1)
         self._display_open_strings(ax, chord_shape.open_strings)
         self._display_muted_strings(ax, chord_shape.muted_strings)
         for note in chord_shape.shape_coords:
-            ax.scatter(note[0], note[1], color="orangered", s=70)
-            ax.set_title(f"{self._root_note}{self._quality} chord |  plot# [{idx}]")
+            ax.scatter(note[0], note[1], color=self.COLOR, s=70)
+            ax.set_title(title)
         if not save:
             plt.show()
         if save and save_path:
-            plt.savefig(str(Path(save_path / f"{self._root_note}{self._quality}_{idx}.png")))
+            plt.savefig(str(dest))
+            if self._cache:
+                self._cache.put(key, dest)
         plt.close()
 
-    def save_all_plots(self, save_path: str | Path | None = None):
+    def save_atlas(
+        self, save_path: str | Path | None = None, tile_width: int = 400, columns: int = 4
+    ) -> tuple[Path, Path]:
+        """Save all chord diagrams as thumbnails tiled in a single image with a JSON
+        index of the tile offsets.
+
+        Args:
+            save_path (str | Path | None, optional): Directory to save the atlas in.
+                Defaults to export/<root><quality> in the working directory.
+            tile_width (int, optional): Width of a thumbnail in pixels. Defaults to 400.
+            columns (int, optional): Number of thumbnails per row. Defaults to 4.
+
+        Returns:
+            tuple[Path, Path]: Paths of the atlas image and its index.
+        """
+        p = Path(save_path) if save_path else Path().resolve() / "export" / f"{self._root_note}{self._quality}"
+        p.mkdir(parents=True, exist_ok=True)
+        im, index = self._build_atlas(tile_width, columns)
+        return save_atlas(im, index, p / f"{self._root_note}{self._quality}_atlas.png")
+
+    def _build_atlas(self, tile_width: int, columns: int) -> tuple[NDArray[np.uint8], dict]:
+        renderer = get_renderer("raster", self.BASE_IMG, self.DPI, self.FIGSIZE, self.COLOR)
+        return build_atlas(self.diags, len(self.diags), renderer, tile_width=tile_width, columns=columns)
+
+    def _get_renderer(self) -> "FigureRenderer | RasterRenderer | SvgRenderer":
+        return get_renderer(self._backend, self.BASE_IMG, self.DPI, self.FIGSIZE, self.COLOR)
+
+    def _render_key(self, diagram: CoordinateDiagram, title: str, dest: Path) -> str:
+        # SVG files reference the base image relative to their own location
+        base_href = os.path.relpath(Path(self.BASE_IMG).resolve(), dest.parent.resolve())
+        return render_key(
+            shape_coords=diagram.shape_coords,
+            open_strings=diagram.open_strings,
+            muted_strings=diagram.muted_strings,
+            title=title,
+            base_image=file_digest(self.BASE_IMG),
+            dpi=self.DPI,
+            figsize=self.FIGSIZE,
+            color=self.COLOR,
+            backend=self._backend,
+            base_href=base_href if self._backend == "svg" else None,
+        )
+
+    def save_all_plots(self, save_path: str | Path | None = None, workers: int = 1) -> list["WorkerThroughput"]:
+        """Save plots of all chord diagrams.
+
+        Args:
+            save_path (str | Path | None, optional): Directory to save the plots in.
+                Defaults to export/<root><quality> in the working directory.
+            workers (int, optional): Number of worker processes, with 1 the plots
+                are rendered in this process. Defaults to 1.
+
+        Returns:
+            list[WorkerThroughput]: Number of plots and rendering time of every worker.
+        """
         p = Path(save_path) if save_path else Path().resolve() / "export" / f"{self._root_note}{self._quality}"
         if not p.is_dir():
             p.mkdir(parents=True, exist_ok=True)
+        if workers > 1:
+            return export_plots([self._plot_task(i, p) for i in range(len(self.diags))], workers)
+
+        start = time.perf_counter()
         for i in range(len(self.diags)):
             self.plot_by_idx(idx=i, save=True, save_path=p)
+        return [WorkerThroughput(pid=os.getpid(), plots=len(self.diags), seconds=time.perf_counter() - start)]
+
+    def _plot_task(self, idx: int, save_path: Path) -> "PlotTask":
+        return PlotTask(
+            root_note=self._root_note,
+            quality=self._quality,
+            idx=idx,
+            save_path=save_path,
+            limit=self._limit,
+            rank=self._rank,
+            library_path=self._library.path if self._library else None,
+            cache=self._cache,
+            backend=self._backend,
+        )
+
+
+@dataclass(frozen=True)
+class PlotTask:
+    """A single plot to render in a worker process."""
+
+    root_note: str
+    quality: str
+    idx: int
+    save_path: Path
+    limit: int | None = None
+    rank: Callable[[ChordDiagram], float] | None = None
+    library_path: Path | None = None
+    cache: RenderCache | None = None
+    backend: str = "pyplot"
+
+
+@dataclass(frozen=True)
+class ChordTask:
+    """All plots of a chord to render in a worker process."""
+
+    root_note: str
+    quality: str
+    save_path: Path
+    limit: int | None = None
+    rank: Callable[[ChordDiagram], float] | None = None
+    library_path: Path | None = None
+    cache: RenderCache | None = None
+    backend: str = "pyplot"
+
+
+@dataclass
+class WorkerThroughput:
+    """Number of plots rendered by a worker process and the time spent rendering them."""
+
+    pid: int
+    plots: int
+    seconds: float
+
+    @property
+    def plots_per_second(self) -> float:
+        return self.plots / self.seconds if self.seconds else 0.0
+
+
+def _init_render_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+@lru_cache(maxsize=None)
+def _get_worker_library(library_path: Path) -> VoicingLibrary:
+    # one memory map of a library per worker, shared by all plots of the worker
+    return VoicingLibrary(library_path)
+
+
+@lru_cache(maxsize=16)
+def _get_worker_plot(
+    root_note: str,
+    quality: str,
+    limit: int | None,
+    rank: Callable[[ChordDiagram], float] | None,
+    library_path: Path | None,
+    cache: RenderCache | None,
+    backend: str,
+) -> ChordShapePlot:
+    # consecutive tasks of a worker mostly belong to the same chord,
+    # so the chord diagrams are only generated once per worker
+    library = _get_worker_library(library_path) if library_path else None
+    return ChordShapePlot(root_note, quality, limit=limit, rank=rank, library=library, cache=cache, backend=backend)
+
+
+def _render_task(task: PlotTask) -> tuple[int, int, float]:
+    start = time.perf_counter()
+    plot = _get_worker_plot(
+        task.root_note, task.quality, task.limit, task.rank, task.library_path, task.cache, task.backend
+    )
+    plot.plot_by_idx(idx=task.idx, save=True, save_path=task.save_path)
+    return os.getpid(), 1, time.perf_counter() - start
+
+
+def _render_chord_task(task: ChordTask) -> tuple[int, int, float]:
+    start = time.perf_counter()
+    library = _get_worker_library(task.library_path) if task.library_path else None
+    plot = ChordShapePlot(
+        task.root_note,
+        task.quality,
+        limit=task.limit,
+        rank=task.rank,
+        library=library,
+        cache=task.cache,
+        backend=task.backend,
+    )
+    for idx in range(len(plot.diags)):
+        plot.plot_by_idx(idx=idx, save=True, save_path=task.save_path)
+    return os.getpid(), len(plot.diags), time.perf_counter() - start
+
+
+def _run_in_pool(
+    func: Callable[[T], tuple[int, int, float]], tasks: list[T], workers: int | None
+) -> list[WorkerThroughput]:
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as executor:
+        results = list(executor.map(func, tasks, chunksize=chunksize))
+
+    throughput: dict[int, WorkerThroughput] = {}
+    for pid, plots, seconds in results:
+        worker = throughput.setdefault(pid, WorkerThroughput(pid=pid, plots=0, seconds=0.0))
+        worker.plots += plots
+        worker.seconds += seconds
+    return sorted(throughput.values(), key=lambda w: w.pid)
+
+
+def export_plots(tasks: list[PlotTask], workers: int | None = None) -> list[WorkerThroughput]:
+    """Render plots in a pool of worker processes.
+
+    Every plot is written to its own file named after the chord and the
+    diagram index, so the output does not depend on which worker rendered it.
+
+    Args:
+        tasks (list[PlotTask]): Plots to render.
+        workers (int | None, optional): Number of worker processes.
+            Defaults to the number of CPUs.
+
+    Returns:
+        list[WorkerThroughput]: Number of plots and rendering time of every worker.
+    """
+    return _run_in_pool(_render_task, tasks, workers)
+
+
+def save_chord_library(
+    chords: Iterable[tuple[str, str]],
+    save_path: str | Path | None = None,
+    workers: int | None = None,
+    limit: int | None = None,
+    rank: Callable[[ChordDiagram], float] | None = None,
+    library: VoicingLibrary | None = None,
+    cache: RenderCache | None = None,
+    backend: str = "pyplot",
+) -> list[WorkerThroughput]:
+    """Save plots of all diagrams of many chords using a pool of worker processes.
+
+    Args:
+        chords (Iterable[tuple[str, str]]): Pairs of chord root note and quality.
+        save_path (str | Path | None, optional): Directory in which a sub-directory
+            <root><quality> is created for every chord. Defaults to export in the
+            working directory.
+        workers (int | None, optional): Number of worker processes.
+            Defaults to the number of CPUs.
+        limit (int | None, optional): Maximum number of diagrams per chord. Defaults to None.
+        rank (Callable[[ChordDiagram], float] | None, optional): Scoring function used to
+            pick the diagrams, has to be picklable. Defaults to None.
+        library (VoicingLibrary | None, optional): Precomputed voicing library to read
+            the diagrams from. Defaults to None.
+        cache (RenderCache | None, optional): Cache of rendered plots. Defaults to None.
+        backend (str, optional): Rendering backend, see ChordShapePlot.BACKENDS.
+            Defaults to "pyplot".
+
+    Returns:
+        list[WorkerThroughput]: Number of plots and rendering time of every worker.
+    """
+    base = Path(save_path) if save_path else Path().resolve() / "export"
+    tasks: list[ChordTask] = []
+    for root_note, quality in chords:
+        p = base / f"{root_note}{quality}"
+        p.mkdir(parents=True, exist_ok=True)
+        tasks.append(ChordTask(root_note, quality, p, limit, rank, library.path if library else None, cache, backend))
+    # every worker generates the diagrams of its chords and reports how many it rendered
+    return _run_in_pool(_render_chord_task, tasks, workers)
 
 
 if __name__ == "__main__":
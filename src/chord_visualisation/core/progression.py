@@ -0,0 +1,199 @@
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+from core.chord_shapes import ChordDiagram, ChordShapes
+from core.voicing import MUTED, Voicing
+
+TransitionCost = Callable[[Voicing, Voicing], float]
+
+
+def movement_cost(current: Voicing, following: Voicing, shift_weight: float = 2.0) -> float:
+    """Cost of moving the fretting hand from one voicing to the next.
+
+    Every string that is fretted in both voicings costs the number of frets
+    the finger moves, every finger that is put down or lifted costs 1, and
+    moving the hand along the neck costs shift_weight per fret that the
+    average fretted position moves.
+
+    Args:
+        current (Voicing): Voicing played first.
+        following (Voicing): Voicing played next.
+        shift_weight (float, optional): Cost of a hand shift of one fret. Defaults to 2.0.
+
+    Returns:
+        float: Transition cost, 0 for repeating a voicing.
+    """
+    cost = 0.0
+    current_frets: list[int] = []
+    following_frets: list[int] = []
+    for a, b in zip(current.frets, following.frets):
+        if a > 0:
+            current_frets.append(a)
+        if b > 0:
+            following_frets.append(b)
+        if a > 0 and b > 0:
+            cost += abs(a - b)
+        elif (a > 0) != (b > 0) or (a == MUTED) != (b == MUTED):
+            cost += 1
+    if current_frets and following_frets:
+        shift = sum(following_frets) / len(following_frets) - sum(current_frets) / len(current_frets)
+        cost += shift_weight * abs(shift)
+    return cost
+
+
+def parse_progression(progression: str) -> list[tuple[str, str]]:
+    """Parse a progression written as "A minor, D minor, E dom7".
+
+    Args:
+        progression (str): Comma separated chords as root note and quality.
+
+    Returns:
+        list[tuple[str, str]]: Root note and quality of every chord.
+    """
+    chords: list[tuple[str, str]] = []
+    for chord in progression.split(","):
+        root, quality = chord.split()
+        chords.append((root, quality))
+    return chords
+
+
+@dataclass
+class Progression:
+    chords: list[tuple[str, str]]
+    diagrams: list[ChordDiagram]
+    cost: float
+
+
+class ProgressionOptimiser:
+    """
+    Picks one voicing per chord of a progression that minimises the total
+    cost of moving between consecutive voicings.
+
+    The best path is found with Viterbi-style dynamic programming: for every
+    voicing of a chord only the cheapest way to reach it is kept, so the run
+    time grows linearly with the length of the progression and quadratically
+    with the number of voicings per chord. Candidate voicings and transition
+    cost matrices are computed once per chord and per pair of consecutive
+    chords.
+
+    Args:
+        transition_cost (TransitionCost, optional): Cost of playing one voicing
+            after another. Defaults to movement_cost.
+        voicing_cost (Callable[[ChordDiagram], float] | None, optional): Cost of
+            playing a voicing at all, for example playability_score. Defaults to None.
+        limit (int | None, optional): Maximum number of candidate voicings per
+            chord, ranked by voicing_cost when it is given. Defaults to None.
+        shapes (ChordShapes | None, optional): Chord shape generator. Defaults to
+            standard tuning.
+    """
+
+    def __init__(
+        self,
+        transition_cost: TransitionCost = movement_cost,
+        voicing_cost: Callable[[ChordDiagram], float] | None = None,
+        limit: int | None = None,
+        shapes: ChordShapes | None = None,
+    ) -> None:
+        self._transition_cost = transition_cost
+        self._voicing_cost = voicing_cost
+        self._limit = limit
+        self._shapes = shapes or ChordShapes(transpose=True)
+        self._candidates: dict[tuple[str, str], tuple[list[ChordDiagram], list[Voicing], np.ndarray]] = {}
+        self._transitions: dict[tuple[tuple[str, str], tuple[str, str]], np.ndarray] = {}
+
+    def candidates(self, chord: tuple[str, str]) -> tuple[list[ChordDiagram], list[Voicing], np.ndarray]:
+        """Get the candidate voicings of a chord.
+
+        Args:
+            chord (tuple[str, str]): Root note and quality.
+
+        Raises:
+            ValueError: The chord has no voicings.
+
+        Returns:
+            tuple[list[ChordDiagram], list[Voicing], np.ndarray]: Diagrams and voicings
+                of the candidates and the voicing cost of every candidate.
+        """
+        if chord not in self._candidates:
+            diagrams = list(self._shapes.iter_chord_diagrams(*chord, limit=self._limit, rank=self._voicing_cost))
+            if not diagrams:
+                raise ValueError(f"{chord[0]} {chord[1]} has no voicings")
+            voicings = [Voicing.from_diagram(d, len(self._shapes.tuning)) for d in diagrams]
+            costs = np.array([self._voicing_cost(d) if self._voicing_cost else 0.0 for d in diagrams], dtype=float)
+            self._candidates[chord] = (diagrams, voicings, costs)
+        return self._candidates[chord]
+
+    def _transition_matrix(self, current: tuple[str, str], following: tuple[str, str]) -> np.ndarray:
+        if (current, following) not in self._transitions:
+            _, a, _ = self.candidates(current)
+            _, b, _ = self.candidates(following)
+            self._transitions[(current, following)] = np.array(
+                [[self._transition_cost(x, y) for y in b] for x in a], dtype=float
+            )
+        return self._transitions[(current, following)]
+
+    def optimise(self, chords: Sequence[tuple[str, str]]) -> Progression:
+        """Find the voicings of a progression with the lowest total cost.
+
+        Args:
+            chords (Sequence[tuple[str, str]]): Root note and quality of every chord.
+
+        Returns:
+            Progression: Chosen diagram of every chord and the total cost.
+        """
+        chords = list(chords)
+        if not chords:
+            return Progression(chords=[], diagrams=[], cost=0.0)
+
+        cost = self.candidates(chords[0])[2].copy()
+        # index of the best previous voicing for every voicing of every chord
+        back_pointers: list[np.ndarray] = []
+        for current, following in zip(chords, chords[1:]):
+            total = cost[:, None] + self._transition_matrix(current, following)
+            best = np.argmin(total, axis=0)
+            back_pointers.append(best)
+            cost = total[best, np.arange(total.shape[1])] + self.candidates(following)[2]
+
+        path = [int(np.argmin(cost))]
+        for best in reversed(back_pointers):
+            path.append(int(best[path[-1]]))
+        path.reverse()
+        return Progression(
+            chords=chords,
+            diagrams=[self.candidates(chord)[0][idx] for chord, idx in zip(chords, path)],
+            cost=float(cost.min()),
+        )
+
+
+def optimise_progression(
+    progression: str | Sequence[tuple[str, str]],
+    transition_cost: TransitionCost = movement_cost,
+    voicing_cost: Callable[[ChordDiagram], float] | None = None,
+    limit: int | None = None,
+) -> Progression:
+    """Pick one voicing per chord of a progression with the least hand movement.
+
+    Args:
+        progression (str | Sequence[tuple[str, str]]): Progression written as
+            "A minor, D minor, E dom7" or as (root, quality) tuples.
+        transition_cost (TransitionCost, optional): Cost of playing one voicing
+            after another. Defaults to movement_cost.
+        voicing_cost (Callable[[ChordDiagram], float] | None, optional): Cost of
+            playing a voicing at all. Defaults to None.
+        limit (int | None, optional): Maximum number of candidate voicings per chord.
+            Defaults to None.
+
+    Returns:
+        Progression: Chosen diagram of every chord and the total cost.
+    """
+    chords = parse_progression(progression) if isinstance(progression, str) else progression
+    return ProgressionOptimiser(transition_cost, voicing_cost, limit).optimise(chords)
+
+
+if __name__ == "__main__":
+    result = optimise_progression("A minor, D minor, E dom7, A minor")
+    for (root, quality), diagram in zip(result.chords, result.diagrams):
+        print(root, quality, Voicing.from_diagram(diagram).frets)
+    print(f"cost: {result.cost:.1f}")
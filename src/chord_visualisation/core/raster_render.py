@@ -0,0 +1,135 @@
+import io
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image, ImageColor
+
+if TYPE_CHECKING:
+    from core.plot_chords import CoordinateDiagram
+
+
+@lru_cache(maxsize=4)
+def read_base_image_rgba(path: str) -> NDArray[np.uint8]:
+    """Decode a base image to an RGBA array once per process.
+
+    Args:
+        path (str): Path of the image.
+
+    Returns:
+        NDArray[np.uint8]: Image array of shape (height, width, 4), must not be modified.
+    """
+    with Image.open(path) as im:
+        arr = np.array(im.convert("RGBA"))
+    arr.flags.writeable = False
+    return arr
+
+
+def _distance_grid(size: int) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    # pixel centre coordinates relative to the centre of a size x size sprite
+    c = np.arange(size) + 0.5 - size / 2
+    return np.meshgrid(c, c)
+
+
+def dot_sprite(radius: float) -> NDArray[np.float32]:
+    """Anti-aliased alpha mask of a filled circle."""
+    x, y = _distance_grid(int(np.ceil(radius)) * 2 + 2)
+    return np.clip(radius + 0.5 - np.hypot(x, y), 0, 1).astype(np.float32)
+
+
+def ring_sprite(size: int, width: float) -> NDArray[np.float32]:
+    """Anti-aliased alpha mask of the "O" glyph."""
+    x, y = _distance_grid(size)
+    radius = (size - width) / 2
+    return np.clip(width / 2 + 0.5 - np.abs(np.hypot(x, y) - radius), 0, 1).astype(np.float32)
+
+
+def cross_sprite(size: int, width: float) -> NDArray[np.float32]:
+    """Anti-aliased alpha mask of the "X" glyph."""
+    x, y = _distance_grid(size)
+    # distance of every pixel to the two diagonals
+    dist = np.minimum(np.abs(x - y), np.abs(x + y)) / np.sqrt(2)
+    return np.clip(width / 2 + 0.5 - dist, 0, 1).astype(np.float32)
+
+
+class RasterRenderer:
+    """
+    Renders chord diagrams without matplotlib by stamping pre-rasterised
+    sprites onto a copy of the decoded base image.
+
+    Diagrams are drawn in the pixel coordinates of the base image, which are
+    the coordinates produced by FretboardToCoord, so the output has the size
+    of the base image. Plot titles are not drawn.
+
+    Args:
+        base_img (str): Path of the fretboard image.
+        label_coords (dict[int, tuple[int, int]]): Position of the open/muted
+            glyph of every string, see FretboardToCoord.open_coords.
+        color (str): Colour of markers and glyphs, any colour name known to Pillow.
+        dot_radius (float, optional): Radius of a fretted note marker in pixels. Defaults to 6.
+        glyph_size (int, optional): Size of the open/muted string glyphs in pixels. Defaults to 15.
+        compress_level (int, optional): PNG compression level from 0 to 9. Defaults to 1.
+    """
+
+    suffix = ".png"
+
+    def __init__(
+        self,
+        base_img: str,
+        label_coords: dict[int, tuple[int, int]],
+        color: str,
+        dot_radius: float = 6,
+        glyph_size: int = 15,
+        compress_level: int = 1,
+    ) -> None:
+        self._base = read_base_image_rgba(base_img)
+        self._label_coords = label_coords
+        self._color = np.array(ImageColor.getrgb(color)[:3], dtype=np.float32)
+        self._compress_level = compress_level
+        self._dot = dot_sprite(dot_radius)
+        stroke = max(1.0, glyph_size / 7)
+        self._glyphs = {"O": ring_sprite(glyph_size, stroke), "X": cross_sprite(glyph_size, stroke)}
+
+    def _stamp(self, img: NDArray[np.uint8], sprite: NDArray[np.float32], x: int, y: int) -> None:
+        # clip the sprite to the image borders
+        h, w = sprite.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, img.shape[1]), min(y + h, img.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        alpha = sprite[y0 - y : y1 - y, x0 - x : x1 - x, None]
+        region = img[y0:y1, x0:x1, :3]
+        region[:] = region * (1 - alpha) + self._color * alpha + 0.5
+        img[y0:y1, x0:x1, 3] = np.maximum(img[y0:y1, x0:x1, 3], (alpha[..., 0] * 255).astype(np.uint8))
+
+    def render(self, diagram: "CoordinateDiagram") -> NDArray[np.uint8]:
+        """Render a chord diagram.
+
+        Args:
+            diagram (CoordinateDiagram): Chord diagram in image coordinates.
+
+        Returns:
+            NDArray[np.uint8]: RGBA image array.
+        """
+        img = self._base.copy()
+        radius = self._dot.shape[0] // 2
+        for x, y in diagram.shape_coords:
+            self._stamp(img, self._dot, x - radius, y - radius)
+        # glyphs are anchored at their bottom left corner, like matplotlib text
+        labels = [(i, "O") for i in diagram.open_strings] + [(i, "X") for i in diagram.muted_strings]
+        for string, glyph in labels:
+            x, y = self._label_coords[string]
+            sprite = self._glyphs[glyph]
+            self._stamp(img, sprite, x, y - sprite.shape[0])
+        return img
+
+    def encode(self, diagram: "CoordinateDiagram") -> bytes:
+        """Render a chord diagram as PNG bytes."""
+        buffer = io.BytesIO()
+        Image.fromarray(self.render(diagram)).save(buffer, format="PNG", compress_level=self._compress_level)
+        return buffer.getvalue()
+
+    def save(self, diagram: "CoordinateDiagram", title: str, path: str | Path) -> None:
+        Image.fromarray(self.render(diagram)).save(path, format="PNG", compress_level=self._compress_level)
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+@lru_cache(maxsize=32)
+def file_digest(path: str | Path) -> str:
+    """Get the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path (str | Path): Path of the file.
+
+    Returns:
+        str: Hex digest.
+    """
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def render_key(**params: Any) -> str:
+    """Create a cache key from everything that affects a rendered file.
+
+    Args:
+        **params: JSON serialisable diagram contents and render settings.
+
+    Returns:
+        str: Hex digest of the parameters.
+    """
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RenderCache:
+    """
+    Content-addressed cache of rendered files.
+
+    Files are stored under their render_key() and are handed out as hard
+    links, falling back to a copy when linking is not possible. When the
+    total size of the cache exceeds max_bytes the least recently used
+    files are evicted. The total size is kept as a running count that is
+    only corrected by scanning the directory when it exceeds max_bytes, so
+    files added by other processes are noticed at the next eviction.
+
+    Args:
+        directory (Path): Directory of the cache.
+        max_bytes (int, optional): Maximum total size of cached files.
+            Defaults to 1 GiB.
+        suffix (str, optional): File name suffix of cached files. Defaults to ".png".
+    """
+
+    directory: Path
+    max_bytes: int = 1 << 30
+    suffix: str = ".png"
+    # running total size of the cached files, None until the directory was scanned
+    _state: dict[str, int | None] = field(
+        default_factory=lambda: {"bytes": None}, init=False, repr=False, compare=False
+    )
+
+    def _entry(self, key: str) -> Path:
+        return Path(self.directory) / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str, dest: str | Path, link: bool = True) -> bool:
+        """Place a cached file at dest.
+
+        Args:
+            key (str): Cache key.
+            dest (str | Path): Destination path, replaced if it exists.
+            link (bool, optional): Hard link the cached file instead of copying it.
+                Defaults to True.
+
+        Returns:
+            bool: True on a cache hit.
+        """
+        entry = self._entry(key)
+        try:
+            # mark the entry as recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            return False
+        dest = Path(dest)
+        dest.unlink(missing_ok=True)
+        try:
+            if not link:
+                raise OSError
+            os.link(entry, dest)
+        except OSError:
+            try:
+                shutil.copyfile(entry, dest)
+            except FileNotFoundError:
+                # evicted by another process in the meantime
+                return False
+        return True
+
+    def put(self, key: str, src: str | Path) -> None:
+        """Copy a rendered file into the cache and evict old files if the cache is too big.
+
+        Args:
+            key (str): Cache key.
+            src (str | Path): Path of the rendered file.
+        """
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so other processes never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(src, tmp)
+        if self._state["bytes"] is None:
+            self._state["bytes"] = self.size()
+        try:
+            replaced = entry.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        added = os.stat(tmp).st_size
+        os.replace(tmp, entry)
+        self._state["bytes"] += added - replaced
+        if self._state["bytes"] > self.max_bytes:
+            self.evict()
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self) -> None:
+        """Remove the least recently used files until the cache fits in max_bytes."""
+        entries = sorted(self._entries(), key=lambda x: x[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+        self._state["bytes"] = total
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries: list[tuple[Path, os.stat_result]] = []
+        for path in Path(self.directory).glob(f"??/*{self.suffix}"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
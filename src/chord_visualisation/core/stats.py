@@ -0,0 +1,152 @@
+import json
+import logging
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import IO, Iterator
+
+# counters
+SHAPE_CANDIDATES = "shape_candidates"
+SHAPE_PRUNED = "shape_pruned"
+DIAGRAMS_EMITTED = "diagrams_emitted"
+# timers
+COORDINATE_MAPPING = "coordinate_mapping"
+RENDER = "render"
+
+
+@dataclass
+class PipelineStats:
+    """
+    Counters and timers of the chord shape pipeline, collected with collect_stats().
+
+    Counters:
+        shape_candidates: complete shapes found by the shape search.
+        shape_pruned: partial shapes abandoned by the shape search.
+        diagrams_emitted: chord diagrams yielded to the caller.
+
+    Timers:
+        coordinate_mapping: mapping chord diagrams to image coordinates.
+        render: rendering and saving a plot.
+    """
+
+    counters: Counter[str] = field(default_factory=Counter)
+    seconds: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+    calls: Counter[str] = field(default_factory=Counter)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+
+    def to_dict(self) -> dict[str, dict]:
+        return {
+            "counters": dict(self.counters),
+            "timers": {name: {"seconds": self.seconds[name], "calls": self.calls[name]} for name in self.seconds},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    def to_prometheus(self, prefix: str = "chord_visualisation") -> str:
+        """Format the stats in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Prefix of the metric names. Defaults to "chord_visualisation".
+
+        Returns:
+            str: Metrics, one counter per line.
+        """
+        lines: list[str] = []
+        for name, value in sorted(self.counters.items()):
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value}"]
+        for name in sorted(self.seconds):
+            for metric, value in ((f"{name}_seconds", self.seconds[name]), (f"{name}_calls", self.calls[name])):
+                lines += [f"# TYPE {prefix}_{metric}_total counter", f"{prefix}_{metric}_total {value}"]
+        return "\n".join(lines) + "\n"
+
+
+_current_stats: ContextVar[PipelineStats | None] = ContextVar("current_stats", default=None)
+
+
+def current_stats() -> PipelineStats | None:
+    """Get the stats being collected in the current context, None when nothing is collected."""
+    return _current_stats.get()
+
+
+@contextmanager
+def collect_stats(stats: PipelineStats | None = None) -> Iterator[PipelineStats]:
+    """Collect pipeline counters and timers of everything run in the block.
+
+    Stats are kept per context, work handed to other threads or processes
+    is not counted.
+
+    Args:
+        stats (PipelineStats | None, optional): Stats to add to. Defaults to new stats.
+
+    Yields:
+        PipelineStats: The collected stats.
+    """
+    stats = stats if stats is not None else PipelineStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add the time spent in the block to a timer of the current stats, if any."""
+    stats = _current_stats.get()
+    if stats is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_time(name, time.perf_counter() - start)
+
+
+# attributes every log record has, anything else was passed with extra=
+_RECORD_ATTRIBUTES = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records as one JSON object per line including all fields passed with extra=."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRIBUTES})
+        return json.dumps(entry, default=str)
+
+
+def enable_debug_logging(stream: IO[str] | None = None, structured: bool = True) -> logging.Handler:
+    """Log debug messages of the chord pipeline.
+
+    Debug logging is off unless enabled, the pipeline only builds log
+    records when the debug level is enabled.
+
+    Args:
+        stream (IO[str] | None, optional): Stream to log to. Defaults to stderr.
+        structured (bool, optional): Log JSON lines instead of plain text. Defaults to True.
+
+    Returns:
+        logging.Handler: The added handler, remove it from the "core" logger to stop logging.
+    """
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if structured else logging.Formatter("%(name)s %(levelname)s %(message)s"))
+    logger = logging.getLogger("core")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    return handler
@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape, quoteattr
+
+from PIL import Image
+
+if TYPE_CHECKING:
+    from core.plot_chords import CoordinateDiagram
+
+SVG_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+    "<title>{title}</title>"
+    '<image href={href} width="{width}" height="{height}"/>'
+    '<g fill="{color}">{dots}</g>'
+    '<g fill="{color}" font-family="sans-serif" font-size="{font_size}">{labels}</g>'
+    "</svg>\n"
+)
+DOT_TEMPLATE = '<circle cx="{x}" cy="{y}" r="{r}"/>'
+LABEL_TEMPLATE = '<text x="{x}" y="{y}">{text}</text>'
+
+
+class SvgRenderer:
+    """
+    Renders chord diagrams as small SVG files.
+
+    The fretboard image is not embedded, every file references it through
+    an external href relative to the file, so a file only holds a few
+    circles and glyphs and is produced by string templating.
+
+    Args:
+        base_img (str): Path of the fretboard image.
+        label_coords (dict[int, tuple[int, int]]): Position of the open/muted
+            glyph of every string, see FretboardToCoord.open_coords.
+        color (str): Colour of markers and glyphs, any SVG colour.
+        dot_radius (float, optional): Radius of a fretted note marker. Defaults to 6.
+        font_size (int, optional): Font size of open/muted glyphs. Defaults to 21.
+    """
+
+    suffix = ".svg"
+
+    def __init__(
+        self,
+        base_img: str,
+        label_coords: dict[int, tuple[int, int]],
+        color: str,
+        dot_radius: float = 6,
+        font_size: int = 21,
+    ) -> None:
+        self._base_img = Path(base_img).resolve()
+        with Image.open(self._base_img) as im:
+            self._width, self._height = im.size
+        self._label_coords = label_coords
+        self._color = color
+        self._dot_radius = dot_radius
+        self._font_size = font_size
+
+    def base_href(self, directory: str | Path) -> str:
+        """Get the href of the fretboard image relative to a directory."""
+        return Path(os.path.relpath(self._base_img, Path(directory).resolve())).as_posix()
+
+    def render(self, diagram: "CoordinateDiagram", title: str, base_href: str) -> str:
+        """Render a chord diagram.
+
+        Args:
+            diagram (CoordinateDiagram): Chord diagram in image coordinates.
+            title (str): Title of the plot.
+            base_href (str): href of the fretboard image.
+
+        Returns:
+            str: SVG document.
+        """
+        dots = "".join(DOT_TEMPLATE.format(x=x, y=y, r=self._dot_radius) for x, y in diagram.shape_coords)
+        labels = [(i, "O") for i in diagram.open_strings] + [(i, "X") for i in diagram.muted_strings]
+        texts = "".join(
+            LABEL_TEMPLATE.format(x=self._label_coords[string][0], y=self._label_coords[string][1], text=text)
+            for string, text in labels
+        )
+        return SVG_TEMPLATE.format(
+            width=self._width,
+            height=self._height,
+            title=escape(title),
+            href=quoteattr(base_href),
+            color=self._color,
+            dots=dots,
+            font_size=self._font_size,
+            labels=texts,
+        )
+
+    def save(self, diagram: "CoordinateDiagram", title: str, path: str | Path) -> None:
+        path = Path(path)
+        path.write_text(self.render(diagram, title, self.base_href(path.parent)), encoding="utf-8")
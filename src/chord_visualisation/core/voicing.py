@@ -0,0 +1,109 @@
+import struct
+from typing import Iterable, Iterator
+
+from core.chord_shapes import ChordDiagram, FingerPosition
+
+MUTED = -1
+
+
+class Voicing:
+    """
+    Compact immutable chord voicing.
+
+    The fret of every string, string 1 first, is stored as one signed byte
+    with 0 for an open string and MUTED for a muted string, the same layout
+    as a voicing in a VoicingLibrary file. Voicings are hashable, compare
+    equal when all frets are equal and take a fraction of the memory of an
+    equivalent ChordDiagram.
+
+    Args:
+        frets (Iterable[int]): Fret of every string, string 1 first.
+
+    Raises:
+        ValueError: A fret is not an integer from -128 to 127.
+    """
+
+    __slots__ = ("_frets",)
+
+    def __init__(self, frets: Iterable[int]) -> None:
+        frets = tuple(frets)
+        try:
+            self._frets: bytes = struct.pack(f"{len(frets)}b", *frets)
+        except struct.error:
+            raise ValueError(f"frets have to be integers from -128 to 127, got {frets}") from None
+
+    @classmethod
+    def from_bytes(cls, frets: bytes) -> "Voicing":
+        """Create a voicing from one signed byte per string without decoding it.
+
+        Args:
+            frets (bytes): One signed byte per string.
+
+        Returns:
+            Voicing: The voicing.
+        """
+        voicing = cls.__new__(cls)
+        voicing._frets = bytes(frets)
+        return voicing
+
+    @classmethod
+    def from_diagram(cls, diagram: ChordDiagram, n_strings: int = 6) -> "Voicing":
+        """Create a voicing from a chord diagram.
+
+        Strings that are neither fretted nor open are muted.
+
+        Args:
+            diagram (ChordDiagram): Chord diagram.
+            n_strings (int, optional): Number of strings. Defaults to 6.
+
+        Returns:
+            Voicing: The voicing.
+        """
+        frets = [MUTED] * n_strings
+        for pos in diagram.shape:
+            frets[pos.string - 1] = pos.fret
+        for string in diagram.open_strings:
+            frets[string - 1] = 0
+        return cls(frets)
+
+    def to_diagram(self) -> ChordDiagram:
+        """Convert the voicing to a chord diagram with all lists in string order.
+
+        Returns:
+            ChordDiagram: Chord diagram.
+        """
+        frets = self.frets
+        return ChordDiagram(
+            shape=[FingerPosition(idx + 1, f) for idx, f in enumerate(frets) if f > 0],
+            open_strings=[idx + 1 for idx, f in enumerate(frets) if f == 0],
+            muted_strings=[idx + 1 for idx, f in enumerate(frets) if f == MUTED],
+        )
+
+    def to_bytes(self) -> bytes:
+        return self._frets
+
+    @property
+    def frets(self) -> tuple[int, ...]:
+        return struct.unpack(f"{len(self._frets)}b", self._frets)
+
+    def __len__(self) -> int:
+        return len(self._frets)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.frets)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Voicing):
+            return NotImplemented
+        return self._frets == other._frets
+
+    def __hash__(self) -> int:
+        return hash(self._frets)
+
+    def __repr__(self) -> str:
+        return f"Voicing({self.frets})"
+
+
+if __name__ == "__main__":
+    v = Voicing((0, 1, 2, 2, 0, MUTED))
+    print(v, v.to_diagram())
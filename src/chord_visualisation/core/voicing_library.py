@@ -0,0 +1,217 @@
+import mmap
+import struct
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+from core.chord_shapes import ChordDiagram, ChordShapes, select_diagrams
+from core.chords import ChordFormula
+from core.notes import ChromaticNotes
+from core.voicing import Voicing
+
+
+class VoicingLibrary:
+    """
+    Precomputed chord voicings for a single tuning, read from a
+    memory-mapped binary file.
+
+    Every voicing is stored as a fixed-width array of signed bytes, one per
+    string, holding the fret of the string, 0 for an open string and
+    MUTED for a muted string. Voicings of a chord are stored next to each
+    other and an index maps (root, quality) to their offset and count, so
+    fetching the voicings of a chord is a single slice of the mapped file.
+    The pages of the file are shared between all processes that open it.
+
+    File layout (little endian):
+        header: magic, version, number of strings, number of index entries,
+            length of the tuning string
+        tuning: comma separated open string notes
+        index: (root, quality, offset, count) for every chord
+        data: voicing fret arrays
+
+    Args:
+        path (str | Path): Path of the library file created by build().
+    """
+
+    MAGIC = b"CHORDLIB"
+    VERSION = 1
+    _HEADER = struct.Struct("<8sHBHH")
+    _INDEX_ENTRY = struct.Struct("<2s16sII")
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        with open(self._path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_index()
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _read_index(self) -> None:
+        magic, version, n_strings, n_entries, tuning_len = self._HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{self._path} is not a version {self.VERSION} voicing library")
+        offset = self._HEADER.size
+        self.tuning: tuple[str, ...] = tuple(self._mm[offset : offset + tuning_len].decode("ascii").split(","))
+        self._n_strings: int = n_strings
+        offset += tuning_len
+
+        self._index: dict[tuple[str, str], tuple[int, int]] = {}
+        for root, quality, data_offset, count in self._INDEX_ENTRY.iter_unpack(
+            self._mm[offset : offset + n_entries * self._INDEX_ENTRY.size]
+        ):
+            key = (root.decode("ascii").rstrip("\x00"), quality.decode("ascii").rstrip("\x00"))
+            self._index[key] = (data_offset, count)
+
+    @classmethod
+    def build(
+        cls,
+        path: str | Path,
+        tuning: tuple[str, ...] = ("E", "B", "G", "D", "A", "E"),
+        roots: tuple[str, ...] | None = None,
+        qualities: tuple[str, ...] | None = None,
+    ) -> "VoicingLibrary":
+        """Precompute voicings of every root and quality and write them to a library file.
+
+        Args:
+            path (str | Path): Path of the library file.
+            tuning (tuple[str, ...], optional): Guitar tuning. Defaults to standard tuning.
+            roots (tuple[str, ...] | None, optional): Root notes to include.
+                Defaults to all 12 notes.
+            qualities (tuple[str, ...] | None, optional): Chord qualities to include.
+                Defaults to all ChordFormula members.
+
+        Returns:
+            VoicingLibrary: The opened library.
+        """
+        roots = roots or tuple(ChromaticNotes.get_standard_notations_for_full_octave_from_starting_note("A"))
+        qualities = qualities or tuple(ChordFormula.__members__)
+        shapes = ChordShapes(tuning, transpose=True)
+
+        index: list[tuple[str, str, int, int]] = []
+        data = bytearray()
+        for root in roots:
+            for quality in qualities:
+                count = 0
+                for diagram in shapes.iter_chord_diagrams(root, quality):
+                    data += encode_diagram(diagram, len(tuning))
+                    count += 1
+                index.append((root, quality, len(data) - count * len(tuning), count))
+
+        tuning_bytes = ",".join(tuning).encode("ascii")
+        data_start = cls._HEADER.size + len(tuning_bytes) + len(index) * cls._INDEX_ENTRY.size
+        with open(path, "wb") as f:
+            f.write(cls._HEADER.pack(cls.MAGIC, cls.VERSION, len(tuning), len(index), len(tuning_bytes)))
+            f.write(tuning_bytes)
+            for root, quality, offset, count in index:
+                entry = cls._INDEX_ENTRY.pack(root.encode("ascii"), quality.encode("ascii"), data_start + offset, count)
+                f.write(entry)
+            f.write(data)
+        return cls(path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get_frets(self, root_note: str, quality: str) -> memoryview:
+        """Get the fret arrays of all voicings of a chord without copying.
+
+        The returned view has a shape of (number of voicings, number of strings)
+        and has to be released before the library is closed.
+
+        Args:
+            root_note (str): Root note of the chord.
+            quality (str): Quality of the chord.
+
+        Returns:
+            memoryview: Signed byte view into the library file.
+        """
+        offset, count = self._index[(root_note, quality)]
+        with memoryview(self._mm) as view:
+            return view[offset : offset + count * self._n_strings].cast("b", (count, self._n_strings))
+
+    def get_chord_diagram(self, root_note: str, quality: str) -> list[ChordDiagram]:
+        return list(self.iter_chord_diagrams(root_note, quality))
+
+    def iter_chord_diagrams(
+        self,
+        root_note: str,
+        quality: str,
+        limit: int | None = None,
+        rank: Callable[[ChordDiagram], float] | None = None,
+    ) -> Iterator[ChordDiagram]:
+        """Lazily decode chord diagrams of a chord, same as ChordShapes.iter_chord_diagrams().
+
+        Args:
+            root_note (str): Root note of the chord.
+            quality (str): Quality of the chord.
+            limit (int | None, optional): Maximum number of diagrams to yield.
+                Defaults to None.
+            rank (Callable[[ChordDiagram], float] | None, optional): Scoring
+                function where a lower score is a better diagram. Defaults to None.
+
+        Yields:
+            ChordDiagram: Chord diagram.
+        """
+        offset, count = self._index[(root_note, quality)]
+        n = self._n_strings
+        diagrams = (decode_diagram(self._mm[offset + i * n : offset + (i + 1) * n]) for i in range(count))
+        yield from select_diagrams(diagrams, limit, rank)
+
+    def iter_voicings(self, root_note: str, quality: str) -> Iterator[Voicing]:
+        """Lazily read voicings of a chord without decoding them.
+
+        Args:
+            root_note (str): Root note of the chord.
+            quality (str): Quality of the chord.
+
+        Yields:
+            Voicing: Voicing.
+        """
+        offset, count = self._index[(root_note, quality)]
+        n = self._n_strings
+        for i in range(count):
+            yield Voicing.from_bytes(self._mm[offset + i * n : offset + (i + 1) * n])
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "VoicingLibrary":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def encode_diagram(diagram: ChordDiagram, n_strings: int = 6) -> bytes:
+    """Encode a chord diagram as a fixed-width array of frets.
+
+    Args:
+        diagram (ChordDiagram): Chord diagram.
+        n_strings (int, optional): Number of strings. Defaults to 6.
+
+    Returns:
+        bytes: One signed byte per string.
+    """
+    return Voicing.from_diagram(diagram, n_strings).to_bytes()
+
+
+def decode_diagram(frets: bytes | Sequence[int]) -> ChordDiagram:
+    """Decode a fixed-width array of frets into a chord diagram.
+
+    Args:
+        frets (bytes | Sequence[int]): One signed byte per string, or the
+            frets as integers with -1 for a muted string.
+
+    Returns:
+        ChordDiagram: Chord diagram.
+    """
+    voicing = Voicing.from_bytes(frets) if isinstance(frets, bytes) else Voicing(frets)
+    return voicing.to_diagram()
+
+
+if __name__ == "__main__":
+    import sys
+
+    library = VoicingLibrary.build(sys.argv[1] if len(sys.argv) > 1 else "voicings.lib")
+    print(library.get_chord_diagram("A", "minor")[:3])
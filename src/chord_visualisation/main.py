@@ -1,6 +1,19 @@
-from core.plot_chords import ChordShapePlot
-from core.chord_shapes import ChordDiagram, FingerPosition
-from core.chord_name import ChordNameGenerator
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from typing import IO, Iterable, Iterator
+
+from core.chord_shapes import RANKS, ChordDiagram, ChordShapes, FingerPosition
+from core.chord_name import chord_name
+from core.voicing_library import decode_diagram
 
 
 def plot_chord_shapes(chord_root_note: str, chord_quality: str, plot: int | str = 1):
@@ -21,6 +34,9 @@ def plot_chord_shapes(chord_root_note: str, chord_quality: str, plot: int | str
             then the script will display plots one by one in the
             order of the index.
     """
+    # plotting stack is only imported when something is plotted
+    from core.plot_chords import ChordShapePlot
+
     c = ChordShapePlot(chord_root_note, chord_quality)
 
     if isinstance(plot, int):
@@ -46,22 +62,178 @@ def find_chord_name_from_diagram(
         str | None: A string of the chord name
     """
     shape = [FingerPosition(i[0], i[1]) for i in finger_positions]
-    cd = ChordDiagram(shape=shape, open_strings=open_strings, muted_strings=muted_strings)
-    cng = ChordNameGenerator()
-    cng.identify_root_note(cd)
-    quality = cng.indentify_chord_quality(cd)
-    return f"{cng.root_note_name} {quality}"
+    return chord_name(ChordDiagram(shape=shape, open_strings=open_strings, muted_strings=muted_strings))
 
 
-if __name__ == "__main__":
-    # plot_chord_shapes('Am', 'one-by-one')
+def find_chord_names_from_frets(frets) -> list[str | None]:
+    """Find the names of many chords at once from an array of frets.
+
+    Args:
+        frets (NDArray[np.integer]): An integer array of shape (N, 6) with the fret
+            of every string, where column 0 is string 1. 0 is an open string
+            and -1 is a muted string.
+
+    Returns:
+        list[str | None]: A list of chord names, None where all strings are muted.
+    """
+    from core.batch_chord_name import identify_chords
+
+    return identify_chords(frets).names()
+
+
+@lru_cache(maxsize=1)
+def _get_chord_shapes() -> ChordShapes:
+    # one ChordShapes object per worker process
+    return ChordShapes(transpose=True)
+
+
+def run_job(line: str) -> tuple[str, bool]:
+    """Run one batch job given as a line of JSON.
+
+    A job either generates voicings of a chord,
+    {"root": "A", "quality": "minor", "limit": 5, "rank": "playability"},
+    or names a chord diagram given as frets from string 1 to string 6 with
+    0 for an open string and -1 for a muted string, {"frets": [0, 1, 2, 2, 0, -1]}.
+    An optional "id" of the job is copied to the result.
+
+    Args:
+        line (str): Job as a line of JSON.
+
+    Returns:
+        tuple[str, bool]: Result as a line of JSON with either a "voicings",
+            a "name" or an "error" key, and whether the job failed.
+    """
+    result: dict = {}
+    try:
+        job = json.loads(line)
+        if "id" in job:
+            result["id"] = job["id"]
+        if "frets" in job:
+            frets = job["frets"]
+            _get_chord_shapes().fretboard.check_frets(frets)
+            if all(f < 0 for f in frets):
+                raise ValueError("at least one string has to be played")
+            result["name"] = chord_name(decode_diagram(frets))
+        else:
+            rank = job.get("rank")
+            if rank is not None and rank not in RANKS:
+                raise ValueError(f"rank has to be one of {', '.join(RANKS)}")
+            diagrams = _get_chord_shapes().iter_chord_diagrams(
+                job["root"], job["quality"], limit=job.get("limit"), rank=RANKS.get(rank)
+            )
+            result["voicings"] = [asdict(d) for d in diagrams]
+    except Exception as e:
+        # a bad job is reported in its result and never stops the batch
+        result["error"] = repr(e)
+    return json.dumps(result), "error" in result
+
+
+@dataclass
+class BatchStats:
+    """Number of jobs processed by a batch run and the time it took."""
+
+    jobs: int
+    errors: int
+    seconds: float
 
-    shape_3 = [(1, 3), (5, 2), (6, 3)]
-    open_strings = [2, 3, 4]
-    muted_strings = []
+    @property
+    def jobs_per_second(self) -> float:
+        return self.jobs / self.seconds if self.seconds else 0.0
 
-    # res = find_chord_name_from_diagram(
-    # finger_positions=shape_3, open_strings=open_strings, muted_strings=muted_strings
-    # )
-    # print(res)
-    plot_chord_shapes("A", "major", "save-all")
+
+def _run_chunk(lines: list[str]) -> list[tuple[str, bool]]:
+    return [run_job(line) for line in lines]
+
+
+def run_jobs(lines: Iterable[str], workers: int = 1, chunksize: int = 64) -> Iterator[tuple[str, bool]]:
+    """Lazily run a stream of batch jobs, see run_job.
+
+    Results are yielded in the order of the jobs. With more than one worker
+    the jobs are sent to a process pool in chunks and at most a few chunks
+    per worker are in flight at any time, so arbitrarily long inputs are
+    processed in constant memory. Closing the iterator early stops the pool.
+
+    Args:
+        lines (Iterable[str]): Jobs as lines of JSON, blank lines are skipped.
+        workers (int, optional): Number of worker processes, with 1 the jobs
+            run in this process. Defaults to 1.
+        chunksize (int, optional): Number of jobs sent to a worker at once.
+            Defaults to 64.
+
+    Yields:
+        tuple[str, bool]: Result of every job as a line of JSON and whether the job failed.
+    """
+    jobs = (line for line in lines if line.strip())
+    if workers <= 1:
+        yield from map(run_job, jobs)
+        return
+
+    with Pool(workers) as pool:
+        # chunks are submitted from this thread, so nothing inside the pool
+        # ever waits for the consumer and the pool can always be terminated
+        pending: deque[AsyncResult] = deque()
+        while chunk := list(islice(jobs, chunksize)):
+            pending.append(pool.apply_async(_run_chunk, (chunk,)))
+            if len(pending) >= 4 * workers:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+def run_batch(
+    infile: IO[str], outfile: IO[str], workers: int = 1, chunksize: int = 64, report_every: int = 0
+) -> BatchStats:
+    """Run batch jobs from a JSONL stream and write the results as JSONL.
+
+    Args:
+        infile (IO[str]): Stream of jobs, one JSON object per line.
+        outfile (IO[str]): Stream the results are written to.
+        workers (int, optional): Number of worker processes. Defaults to 1.
+        chunksize (int, optional): Number of jobs sent to a worker at once.
+            Defaults to 64.
+        report_every (int, optional): Report throughput on stderr after every
+            report_every jobs, 0 only reports at the end. Defaults to 0.
+
+    Returns:
+        BatchStats: Number of jobs and errors and the time it took.
+    """
+    stats = BatchStats(jobs=0, errors=0, seconds=0.0)
+    start = time.perf_counter()
+    for result, failed in run_jobs(infile, workers, chunksize):
+        outfile.write(result + "\n")
+        stats.jobs += 1
+        stats.errors += failed
+        if report_every and stats.jobs % report_every == 0:
+            stats.seconds = time.perf_counter() - start
+            print(f"{stats.jobs} jobs, {stats.jobs_per_second:.0f} jobs/s", file=sys.stderr)
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate chord voicings and name chord diagrams from a JSONL stream of jobs."
+    )
+    parser.add_argument("input", nargs="?", type=argparse.FileType("r"), default=sys.stdin)
+    parser.add_argument("-o", "--output", type=argparse.FileType("w"), default=sys.stdout)
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-c", "--chunksize", type=int, default=64)
+    parser.add_argument("--report-every", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        stats = run_batch(args.input, args.output, args.workers, args.chunksize, args.report_every)
+        args.output.flush()
+    except BrokenPipeError:
+        # the reader of the output went away, e.g. `| head`, so the
+        # remaining output is dropped instead of failing again at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), args.output.fileno())
+        sys.exit(1)
+    print(
+        f"{stats.jobs} jobs ({stats.errors} errors) in {stats.seconds:.2f} s, {stats.jobs_per_second:.0f} jobs/s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
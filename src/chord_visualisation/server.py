@@ -0,0 +1,224 @@
+"""Local HTTP service for chord voicings, rendered diagrams and chord naming.
+
+Endpoints:
+    GET /voicings?root=A&quality=minor[&limit=5][&rank=playability]
+        Chord diagrams as JSON.
+    GET /render?root=A&quality=minor&idx=0[&format=png|svg]
+        A rendered chord diagram.
+    GET /name?frets=0,1,2,2,0,-1
+        Name of a chord, frets are given from string 1 to string 6 with 0
+        for an open string and -1 for a muted string.
+    GET /fretboard.png
+        Fretboard image referenced by SVG diagrams.
+
+Usage (from src/chord_visualisation):
+    python server.py --port 8000
+"""
+import argparse
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from core.chord_name import chord_name
+from core.chord_shapes import RANKS, ChordDiagram, ChordShapes
+from core.voicing_library import decode_diagram
+
+BASE_IMG = Path(__file__).resolve().parents[2] / "images" / "fretboard_2.png"
+logger = logging.getLogger(__name__)
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _error_response(status: int, message: str) -> tuple[int, str, bytes]:
+    return status, "application/json", json.dumps({"error": message}).encode()
+
+
+class ChordService:
+    """
+    Chord shape and naming service with in-process LRU caches in front of
+    the shape search and the renderers.
+
+    Args:
+        executor (Executor | None, optional): Executor for CPU bound work.
+            Defaults to a thread pool.
+        cache_size (int, optional): Maximum number of cached chords and
+            cached rendered diagrams. Defaults to 1024.
+    """
+
+    def __init__(self, executor: Executor | None = None, cache_size: int = 1024) -> None:
+        self._executor = executor or ThreadPoolExecutor()
+        self._shapes = ChordShapes(transpose=True)
+        self.chord_diagrams = lru_cache(maxsize=cache_size)(self._chord_diagrams)
+        self.render = lru_cache(maxsize=cache_size)(self._render)
+
+    def _chord_diagrams(self, root: str, quality: str) -> tuple[ChordDiagram, ...]:
+        return tuple(self._shapes.get_chord_diagram(root, quality))
+
+    def _render(self, root: str, quality: str, idx: int, fmt: str) -> bytes:
+        from core.plot_chords import FretboardToCoord
+
+        diagram = FretboardToCoord().diagram_coords(self.chord_diagrams(root, quality)[idx])
+        if fmt == "svg":
+            from core.svg_render import SvgRenderer
+
+            renderer = SvgRenderer(str(BASE_IMG), FretboardToCoord.open_coords, "orangered")
+            return renderer.render(diagram, f"{root}{quality} chord |  plot# [{idx}]", "/fretboard.png").encode()
+
+        from core.plot_chords import get_renderer
+
+        renderer = get_renderer("raster", str(BASE_IMG), 600, (20, 5), "orangered")
+        return renderer.encode(diagram)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def handle(self, path: str, query: dict[str, list[str]]) -> tuple[int, str, bytes]:
+        """Handle a GET request.
+
+        Args:
+            path (str): Request path.
+            query (dict[str, list[str]]): Parsed query string.
+
+        Raises:
+            HTTPError: Invalid request.
+
+        Returns:
+            tuple[int, str, bytes]: Status, content type and body of the response.
+        """
+
+        def param(name: str, default: str | None = None) -> str:
+            try:
+                return query[name][0]
+            except KeyError:
+                if default is None:
+                    raise HTTPError(400, f"missing parameter {name}")
+                return default
+
+        if path == "/voicings":
+            diagrams = await self._run(self.chord_diagrams, param("root"), param("quality"))
+            rank = param("rank", "")
+            if rank:
+                if rank not in RANKS:
+                    raise HTTPError(400, f"rank has to be one of {', '.join(RANKS)}")
+                diagrams = sorted(diagrams, key=RANKS[rank])
+            limit = int(param("limit", "0"))
+            if limit < 0:
+                raise HTTPError(400, "limit can not be negative")
+            limit = limit or None
+            body = json.dumps([asdict(d) for d in diagrams[:limit]]).encode()
+            return 200, "application/json", body
+
+        if path == "/render":
+            fmt = param("format", "png")
+            if fmt not in ("png", "svg"):
+                raise HTTPError(400, "format has to be png or svg")
+            root, quality, idx = param("root"), param("quality"), int(param("idx", "0"))
+            count = len(await self._run(self.chord_diagrams, root, quality))
+            if not 0 <= idx < count:
+                raise HTTPError(404, f"{root}{quality} has {count} diagrams")
+            body = await self._run(self.render, root, quality, idx, fmt)
+            return 200, "image/svg+xml" if fmt == "svg" else "image/png", body
+
+        if path == "/name":
+            frets = [int(f) for f in param("frets").split(",")]
+            try:
+                self._shapes.fretboard.check_frets(frets)
+            except ValueError as e:
+                raise HTTPError(400, str(e)) from None
+            if all(f < 0 for f in frets):
+                raise HTTPError(400, "at least one string has to be played")
+            name = chord_name(decode_diagram(frets))
+            return 200, "application/json", json.dumps({"name": name}).encode()
+
+        if path == "/fretboard.png":
+            return 200, "image/png", await self._run(BASE_IMG.read_bytes)
+
+        raise HTTPError(404, f"unknown path {path}")
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on a connection until the client closes it."""
+        try:
+            while True:
+                request_line = b""
+                headers: dict[str, str] = {}
+                keep_alive = False
+                try:
+                    # an over-long line raises ValueError and is answered with a 400
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                    if length := int(headers.get("content-length", 0)):
+                        await reader.readexactly(length)
+
+                    method, target, version = request_line.decode("latin-1").split()
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                    url = urlsplit(target)
+                    if method != "GET":
+                        raise HTTPError(405, "only GET is supported")
+                    status, content_type, body = await self.handle(url.path, parse_qs(url.query))
+                except HTTPError as e:
+                    status, content_type, body = _error_response(e.status, str(e))
+                except (KeyError, ValueError) as e:
+                    status, content_type, body = _error_response(400, repr(e))
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception:
+                    logger.exception("error handling %r", request_line)
+                    status, content_type, body = _error_response(500, "internal error")
+
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8000, service: ChordService | None = None) -> asyncio.Server:
+    """Start the chord service.
+
+    Args:
+        host (str, optional): Host to bind. Defaults to "127.0.0.1".
+        port (int, optional): Port to bind, 0 picks a free port. Defaults to 8000.
+        service (ChordService | None, optional): Service to run. Defaults to a new ChordService.
+
+    Returns:
+        asyncio.Server: The started server.
+    """
+    service = service or ChordService()
+    return await asyncio.start_server(service.serve_connection, host, port)
+
+
+async def _main(host: str, port: int) -> None:
+    server = await serve(host, port)
+    print(f"serving on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    asyncio.run(_main(args.host, args.port))
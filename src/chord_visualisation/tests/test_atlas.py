@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.atlas import build_atlas, save_atlas
+from core.plot_chords import CoordinateDiagram, FretboardToCoord
+from core.raster_render import RasterRenderer
+
+BASE_IMG = str(Path(__file__).resolve().parents[3] / "images" / "fretboard_2.png")
+
+
+@pytest.fixture(scope="module")
+def renderer():
+    return RasterRenderer(BASE_IMG, FretboardToCoord.open_coords, "orangered")
+
+
+@pytest.fixture
+def diagrams():
+    return [CoordinateDiagram(shape_coords=[(168, 69 + i)], open_strings=[1], muted_strings=[6]) for i in range(5)]
+
+
+def test_build_atlas(renderer, diagrams):
+    atlas, index = build_atlas(diagrams, len(diagrams), renderer, tile_width=200, columns=2)
+    tile_height = index["tile_height"]
+    assert tile_height == round(246 * 200 / 1556)
+    assert atlas.shape == (3 * tile_height, 2 * 200, 4)
+    assert [(t["x"], t["y"]) for t in index["tiles"]] == [
+        (0, 0),
+        (200, 0),
+        (0, tile_height),
+        (200, tile_height),
+        (0, 2 * tile_height),
+    ]
+    # the last row only has a single tile
+    assert not atlas[2 * tile_height :, 200:].any()
+
+
+def test_save_atlas(renderer, diagrams, tmp_path):
+    atlas, index = build_atlas(diagrams, len(diagrams), renderer, tile_width=100, columns=8)
+    image_path, index_path = save_atlas(atlas, index, tmp_path / "atlas.png")
+    saved = json.loads(index_path.read_text())
+    assert saved["image"] == "atlas.png"
+    assert saved["columns"] == 5
+    with Image.open(image_path) as im:
+        assert np.array_equal(np.array(im), atlas)
@@ -0,0 +1,66 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from core.audio import ChordSynth, export_library
+from core.notes import ChromaticNotes
+from core.voicing_library import decode_diagram
+
+A_MINOR = decode_diagram([0, 1, 2, 2, 0, -1])
+
+
+def test_note_frequency():
+    assert ChromaticNotes.frequency("A", 4) == pytest.approx(440)
+    assert ChromaticNotes.frequency("C", 4) == pytest.approx(261.6, abs=0.1)
+    assert ChromaticNotes.frequency("E", 2) == pytest.approx(82.4, abs=0.1)
+
+
+def test_frequencies():
+    # A2, E3, A3, C4, E4 from the lowest played string
+    expected = [110, 164.8, 220, 261.6, 329.6]
+    assert ChordSynth().frequencies(A_MINOR) == pytest.approx(expected, abs=0.1)
+
+
+def test_octaves_must_match_tuning():
+    with pytest.raises(ValueError):
+        ChordSynth(octaves=(4, 3))
+
+
+def test_chunks():
+    synth = ChordSynth(sample_rate=8000, duration=0.5, chunk_size=1000)
+    chunks = list(synth.iter_chunks(A_MINOR))
+    assert [len(c) for c in chunks] == [1000] * 4
+    samples = np.concatenate(chunks)
+    assert samples.dtype == np.int16
+    assert np.abs(samples).max() > 1000
+    assert np.array_equal(samples, synth.synthesise(A_MINOR))
+
+
+def test_strum():
+    synth = ChordSynth(sample_rate=8000, duration=0.5, strum=0.1)
+    samples = synth.synthesise(decode_diagram([0, -1, -1, -1, -1, 0]))
+    # string 1 is struck 0.1 s after string 6, before that only string 6 sounds
+    only_low = ChordSynth(sample_rate=8000, duration=0.5).synthesise(decode_diagram([-1, -1, -1, -1, -1, 0]))
+    assert np.corrcoef(samples[:700], only_low[:700])[0, 1] > 0.99
+
+
+def test_write_wav():
+    buffer = io.BytesIO()
+    synth = ChordSynth(sample_rate=8000, duration=0.25)
+    synth.write_wav(A_MINOR, buffer)
+    buffer.seek(0)
+    with wave.open(buffer) as w:
+        assert (w.getnchannels(), w.getsampwidth(), w.getframerate(), w.getnframes()) == (1, 2, 8000, 2000)
+        samples = np.frombuffer(w.readframes(w.getnframes()), "<i2")
+    assert np.array_equal(samples, synth.synthesise(A_MINOR))
+
+
+def test_export_library(tmp_path):
+    synth = ChordSynth(sample_rate=8000, duration=0.1)
+    stats = export_library(tmp_path, roots=["A"], qualities=["minor", "major"], synth=synth)
+    files = sorted(tmp_path.glob("*/*.wav"))
+    assert stats.files == len(files) > 0
+    assert (tmp_path / "Aminor" / "Aminor_0.wav") in files
+    assert stats.audio_seconds == pytest.approx(0.1 * stats.files)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from core.batch_chord_name import QUALITIES, identify_chords
+from core.chord_name import ChordNameGenerator
+from core.chord_shapes import ChordDiagram, FingerPosition
+
+
+@pytest.fixture
+def frets():
+    return np.array(
+        [
+            [0, 1, 0, 2, 3, -1],
+            [0, 1, 2, 2, 0, -1],
+            [0, 0, 1, 0, 2, 0],
+            [1, 1, 2, 0, -1, -1],
+            [-1, 1, 1, 1, -1, -1],
+            [-1, -1, -1, -1, -1, -1],
+        ]
+    )
+
+
+def test_identify_chords_names(frets):
+    assert identify_chords(frets).names() == ["C major", "A minor", "E dom7", "D minor7", "D# None", None]
+
+
+def test_identify_chords_arrays(frets):
+    result = identify_chords(frets)
+    assert result.bass_notes.tolist() == [3, 0, 7, 5, 6, -1]
+    assert QUALITIES[result.qualities[0]] == "major"
+    assert result.qualities[-1] == -1
+    # C major is C, E and G
+    assert result.pitch_class_masks[0] == (1 << 3) | (1 << 7) | (1 << 10)
+
+
+def test_identify_chords_matches_chord_name_generator():
+    rng = np.random.default_rng(0)
+    frets = rng.integers(-1, 13, size=(500, 6))
+    frets = frets[(frets != -1).any(axis=1)]
+    cng = ChordNameGenerator()
+    expected = []
+    for row in frets:
+        diagram = ChordDiagram(
+            shape=[FingerPosition(s + 1, int(f)) for s, f in enumerate(row) if f > 0],
+            open_strings=[s + 1 for s, f in enumerate(row) if f == 0],
+            muted_strings=[s + 1 for s, f in enumerate(row) if f == -1],
+        )
+        cng.identify_root_note(diagram)
+        expected.append(f"{cng.root_note_name} {cng.indentify_chord_quality(diagram)}")
+    assert identify_chords(frets).names() == expected
+
+
+def test_identify_chords_wrong_shape():
+    with pytest.raises(ValueError):
+        identify_chords(np.zeros((3, 5), dtype=int))
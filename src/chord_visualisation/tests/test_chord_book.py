@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+from core.chord_book import save_chord_book
+from core.chord_shapes import playability_score
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    # ChordShapePlot.BASE_IMG is relative to the repository root
+    monkeypatch.chdir(REPO_ROOT)
+
+
+def test_save_chord_book(tmp_path):
+    path = tmp_path / "book.pdf"
+    pages = save_chord_book([("A", "minor"), ("C", "major")], path, limit=3, rank=playability_score)
+    assert pages == 6
+    pdf = path.read_bytes()
+    assert pdf.count(b"/Type /Page ") == 6
+    # fretboard image is embedded once and shared by all pages
+    assert pdf.count(b"/Subtype /Image") == 1
@@ -0,0 +1,35 @@
+import pytest
+
+from core.chord_name import ChordNameGenerator
+from core.chord_shapes import ChordDiagram, FingerPosition
+from core.chords import ChordFormula, interval_mask
+
+
+@pytest.mark.parametrize(
+    "shape, open_strings, muted_strings, expected",
+    [
+        ([(5, 3), (4, 2), (2, 1)], [3, 1], [6], ("C", "major")),
+        ([(4, 2), (3, 2), (2, 1)], [5, 1], [6], ("A", "minor")),
+        ([(5, 2), (3, 1)], [6, 4, 2, 1], [], ("E", "dom7")),
+        ([(3, 2), (2, 1), (1, 1)], [4], [6, 5], ("D", "minor7")),
+        ([(4, 1), (3, 1), (2, 1)], [], [6, 5, 1], ("D#", None)),
+    ],
+)
+def test_identify_chord(shape, open_strings, muted_strings, expected):
+    diagram = ChordDiagram([FingerPosition(*i) for i in shape], open_strings, muted_strings)
+    cng = ChordNameGenerator()
+    cng.identify_root_note(diagram)
+    assert (cng.root_note_name, cng.indentify_chord_quality(diagram)) == expected
+
+
+def test_identify_chord_does_not_change_diagram():
+    diagram = ChordDiagram([FingerPosition(5, 3), FingerPosition(4, 2), FingerPosition(2, 1)], [3, 1], [6])
+    cng = ChordNameGenerator()
+    cng.identify_root_note(diagram)
+    cng.indentify_chord_quality(diagram)
+    assert diagram.shape == [FingerPosition(5, 3), FingerPosition(4, 2), FingerPosition(2, 1)]
+
+
+@pytest.mark.parametrize("quality", ["major", "minor", "dim", "sus2", "major7", "dim7"])
+def test_get_quality_from_mask(quality):
+    assert ChordFormula.get_quality_from_mask(interval_mask(i.value for i in ChordFormula[quality].value)) == quality
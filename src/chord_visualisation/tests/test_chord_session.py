@@ -0,0 +1,90 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.chord_name import chord_name
+from core.chord_session import ChordNameSession
+from core.chord_shapes import ChordDiagram, FingerPosition
+from core.voicing_library import decode_diagram
+
+
+@pytest.fixture
+def session():
+    return ChordNameSession()
+
+
+def test_edits(session):
+    assert session.name is None
+    for string, fret in [(5, 0), (4, 2), (3, 2), (2, 1), (1, 0)]:
+        session.add(string, fret)
+    assert session.name == "A minor"
+    session.add(2, 2)
+    assert session.name == "A major"
+    session.open(6)
+    assert session.name == "E None"
+    session.mute(6)
+    session.remove(2, fret=1)
+    assert session.frets == (0, 2, 2, 2, 0, -1)
+    session.remove(2)
+    assert session.frets == (0, -1, 2, 2, 0, -1)
+    assert session.root_note_name == "A"
+
+
+def test_repeated_pitch_class(session):
+    # E is played on strings 1, 4 and 6
+    for string, fret in [(6, 0), (5, 2), (4, 2), (3, 1), (2, 0), (1, 0)]:
+        session.add(string, fret)
+    assert session.name == "E major"
+    session.mute(1)
+    session.mute(6)
+    assert session.pitch_class_mask & (1 << 7)
+    assert session.name == "B None"
+
+
+def test_diagram_is_not_mutated():
+    diagram = ChordDiagram(
+        shape=[FingerPosition(2, 1), FingerPosition(4, 2)], open_strings=[1, 3], muted_strings=[5, 6]
+    )
+    session = ChordNameSession.from_diagram(diagram)
+    session.add(5, 3)
+    assert diagram.shape == [FingerPosition(2, 1), FingerPosition(4, 2)]
+    assert session.to_diagram().shape == [FingerPosition(2, 1), FingerPosition(4, 2), FingerPosition(5, 3)]
+
+
+def test_matches_chord_name_generator(session):
+    rng = random.Random(0)
+    for _ in range(500):
+        session.add(rng.randint(1, 6), rng.randint(0, 5))
+        if rng.random() < 0.3:
+            session.mute(rng.randint(1, 6))
+        if session.bass is not None:
+            assert session.name == chord_name(decode_diagram(session.frets))
+
+
+@pytest.mark.parametrize("string, fret", [(0, 1), (7, 1), (1, -2), (1, 20)])
+def test_invalid_position(session, string, fret):
+    with pytest.raises(ValueError):
+        session.add(string, fret)
+
+
+@pytest.mark.parametrize("string", [0, 7])
+def test_invalid_string(session, string):
+    with pytest.raises(ValueError):
+        session.remove(string, 1)
+    with pytest.raises(ValueError):
+        session.remove(string)
+    with pytest.raises(ValueError):
+        session.mute(string)
+
+
+@pytest.mark.parametrize("frets", [[0, 1], [0, 1, 2, 2, 0, -1, 3]])
+def test_frets_of_wrong_length(frets):
+    with pytest.raises(ValueError):
+        ChordNameSession(frets=frets)
+
+
+def test_frets_from_numpy_row():
+    session = ChordNameSession(frets=np.array([[0, 1, 2, 2, 0, -1]])[0])
+    assert session.name == "A minor"
+    assert session.frets == (0, 1, 2, 2, 0, -1)
@@ -0,0 +1,76 @@
+from itertools import product
+
+import pytest
+
+from core.chord_shapes import ChordShapes, playability_score
+from core.chords import ChordFormula
+from core.notes import NOTE_NAMES
+
+
+@pytest.fixture
+def chord_shapes():
+    return ChordShapes()
+
+
+def product_shapes(chord_shapes: ChordShapes, root: str, quality: str) -> list[list[tuple[int, int]]]:
+    positions = [
+        chord_shapes.fretboard.get_fret_position_from_note(n) for n in chord_shapes.get_chord_notes(root, quality)
+    ]
+    return [
+        sorted(shape, key=lambda x: x[0])
+        for shape in product(*positions)
+        if max(f for _, f in shape) - min(f for _, f in shape) < 3 and len({s for s, _ in shape}) == len(shape)
+    ]
+
+
+@pytest.mark.parametrize("quality", list(ChordFormula.__members__))
+@pytest.mark.parametrize("root", ["A", "C", "F#"])
+def test_search_shapes_matches_full_product(chord_shapes, root, quality):
+    assert list(chord_shapes._search_shapes(root, quality)) == product_shapes(chord_shapes, root, quality)
+
+
+def test_search_shapes_are_playable(chord_shapes):
+    for shape in chord_shapes._search_shapes("D", "dom7"):
+        frets = [f for _, f in shape]
+        assert max(frets) - min(frets) < ChordShapes.MAX_FRET_RANGE
+        assert len({s for s, _ in shape}) == len(shape)
+
+
+def test_get_chord_diagram_notes(chord_shapes):
+    for diagram in chord_shapes.get_chord_diagram("A", "major"):
+        notes = {chord_shapes.fretboard.get_note(p.string, p.fret) for p in diagram.shape}
+        assert notes <= {"A", "C#", "E"}
+
+
+def test_chord_shapes_in_open_tuning():
+    dadgad = ChordShapes(("D", "A", "G", "D", "A", "D"))
+    shapes = list(dadgad._search_shapes("D", "major"))
+    assert shapes == product_shapes(dadgad, "D", "major")
+    # the two lowest strings are tuned to different notes than in standard tuning
+    assert any(string == 6 for shape in shapes for string, _ in shape)
+    for shape in shapes:
+        assert {dadgad.fretboard.get_note(s, f) for s, f in shape} <= {"D", "F#", "A"}
+
+
+@pytest.mark.parametrize("quality", ["major", "minor7", "dim", "dom9"])
+@pytest.mark.parametrize("tuning", [("E", "B", "G", "D", "A", "E"), ("D", "A", "G", "D", "A", "D")])
+def test_transposed_diagrams_match_search(tuning, quality):
+    search, transpose = ChordShapes(tuning), ChordShapes(tuning, transpose=True)
+    for root in NOTE_NAMES:
+        assert transpose.get_chord_diagram(root, quality) == search.get_chord_diagram(root, quality)
+
+
+def test_iter_chord_diagrams_matches_get_chord_diagram(chord_shapes):
+    assert list(chord_shapes.iter_chord_diagrams("D", "minor")) == chord_shapes.get_chord_diagram("D", "minor")
+
+
+def test_iter_chord_diagrams_limit(chord_shapes):
+    assert (
+        list(chord_shapes.iter_chord_diagrams("D", "minor", limit=3))
+        == chord_shapes.get_chord_diagram("D", "minor")[:3]
+    )
+
+
+def test_iter_chord_diagrams_ranked_top_k(chord_shapes):
+    expected = sorted(chord_shapes.get_chord_diagram("G", "major"), key=playability_score)[:5]
+    assert list(chord_shapes.iter_chord_diagrams("G", "major", limit=5, rank=playability_score)) == expected
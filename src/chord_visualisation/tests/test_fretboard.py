@@ -1,5 +1,5 @@
 import pytest
-from core.fretboard import FretboardNotes
+from core.fretboard import FretboardNotes, get_fretboard
 
 
 @pytest.fixture
@@ -15,14 +15,43 @@ def test_get_fret_position_from_note(fretboard):
     assert fretboard.get_fret_position_from_note("E") == [
         (1, 0),
         (1, 12),
-        (6, 0),
-        (6, 12),
         (2, 5),
         (3, 9),
         (4, 2),
         (5, 7),
+        (6, 0),
+        (6, 12),
     ]
 
 
 def test_get_root_note_string_from_chord_shape(fretboard):
     assert fretboard.get_root_note_string_from_chord_shape([(1, 2), (2, 3), (3, 2)], "D") == 4
+
+
+def test_get_pitch_class(fretboard):
+    assert fretboard.get_pitch_class(3, 3) == 1
+    assert fretboard.open_pitch_classes == (7, 2, 10, 5, 0, 7)
+
+
+def test_get_fret_position_from_pitch_class(fretboard):
+    assert fretboard.get_fret_position_from_pitch_class(7) == fretboard.get_fret_position_from_note("E")
+
+
+def test_repeated_open_notes():
+    dadgad = FretboardNotes(("D", "A", "G", "D", "A", "D"))
+    assert [p for p in dadgad.get_fret_position_from_note("D") if p[1] == 0] == [(1, 0), (4, 0), (6, 0)]
+    assert dadgad.string_notes[6][:3] == ["D", "D#", "E"]
+    assert len(dadgad.string_notes) == 6
+
+
+def test_get_fretboard():
+    assert get_fretboard(("E", "B", "G", "D", "A", "E")) is get_fretboard()
+    assert get_fretboard(("D", "A", "G", "D", "A", "D")) is not get_fretboard()
+
+
+def test_check_frets(fretboard):
+    fretboard.check_frets([0, 1, 2, 2, 0, -1])
+    fretboard.check_frets([13, 13, 13, 13, 13, 13])
+    for frets in ([0, 1, 2, 2], [0, 1, 2, 2, 0, -1, 3], [0, 1, 2, 2, 0, 14], [0, 1, 2, 2, 0, -5], [0, 1, 2, 2, 0, 1.0]):
+        with pytest.raises(ValueError):
+            fretboard.check_frets(frets)
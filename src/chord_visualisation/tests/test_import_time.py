@@ -0,0 +1,19 @@
+import pytest
+
+from benchmarks.bench_import_time import heavy_imports, import_times
+
+
+@pytest.mark.parametrize("module", ["main", "core.chord_shapes", "core.chord_name"])
+def test_no_heavy_imports(module):
+    assert heavy_imports(import_times(module)) == []
+
+
+def test_plot_chords_does_not_import_matplotlib():
+    times = import_times("core.plot_chords")
+    assert "matplotlib" not in times
+    assert "sklearn" not in times
+
+
+def test_main_import_time_budget():
+    # generous budget, without plotting stack importing main takes well under 100ms
+    assert import_times("main")["main"] < 500_000
@@ -0,0 +1,98 @@
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from main import run_batch, run_job, run_jobs
+
+MAIN = Path(__file__).resolve().parents[1] / "main.py"
+
+
+@pytest.fixture
+def jobs():
+    return [
+        json.dumps({"id": 1, "frets": [0, 1, 2, 2, 0, -1]}),
+        json.dumps({"id": 2, "root": "A", "quality": "minor", "limit": 2, "rank": "playability"}),
+        "",
+        json.dumps({"id": 3, "frets": [-1] * 6}),
+        json.dumps({"id": 4, "root": "A"}),
+        json.dumps({"id": 5, "frets": [0, 0, 1, 2, 2, 0]}),
+    ]
+
+
+def test_run_job_name():
+    result, failed = run_job('{"frets": [0, 1, 2, 2, 0, -1]}')
+    assert not failed
+    assert json.loads(result) == {"name": "A minor"}
+
+
+def test_run_job_voicings():
+    result, failed = run_job('{"id": "x", "root": "C", "quality": "major", "limit": 3}')
+    assert not failed
+    result = json.loads(result)
+    assert result["id"] == "x"
+    assert len(result["voicings"]) == 3
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "not json",
+        "[1, 2]",
+        '{"root": "A"}',
+        '{"frets": [-1, -1, -1, -1, -1, -1]}',
+        '{"frets": [0, 1, 2, 2, 0, -1, 3]}',
+        '{"frets": [0, 1, 2, 2]}',
+        '{"frets": [0, 1, 2, 2, 0, 200]}',
+        '{"frets": [0, 1, 2, 2, 0, -5]}',
+        '{"frets": "0,1,2,2,0,-1"}',
+        '{"root": "A", "quality": "minor", "rank": "playabilty"}',
+    ],
+)
+def test_run_job_error(line):
+    result, failed = run_job(line)
+    assert failed
+    assert "error" in json.loads(result)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_jobs_keeps_order(jobs, workers):
+    results = [json.loads(r) for r, _ in run_jobs(iter(jobs), workers=workers, chunksize=2)]
+    assert [r["id"] for r in results] == [1, 2, 3, 4, 5]
+    assert results[0]["name"] == "A minor"
+    assert results[4]["name"] == "E major"
+
+
+def test_run_batch(jobs):
+    out = io.StringIO()
+    stats = run_batch(io.StringIO("\n".join(jobs)), out)
+    assert stats.jobs == 5
+    assert stats.errors == 2
+    assert len(out.getvalue().splitlines()) == 5
+
+
+def test_bad_job_does_not_stop_workers():
+    jobs = [json.dumps({"id": i, "frets": [0, 1, 2, 2, 0, 200 if i == 1 else -1]}) for i in range(4)]
+    results = [json.loads(r) for r, _ in run_jobs(iter(jobs), workers=2, chunksize=1)]
+    assert [r["id"] for r in results] == [0, 1, 2, 3]
+    assert "error" in results[1]
+    assert results[3]["name"] == "A minor"
+
+
+def test_closing_output_early_stops_workers(tmp_path):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text("".join(json.dumps({"id": i, "root": "A", "quality": "minor"}) + "\n" for i in range(5000)))
+    proc = subprocess.Popen(
+        [sys.executable, str(MAIN), str(jobs), "-w", "2", "-c", "16"],
+        cwd=MAIN.parent,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    # same as piping the output through `head -2`
+    lines = [proc.stdout.readline() for _ in range(2)]
+    proc.stdout.close()
+    proc.wait(timeout=30)
+    assert [json.loads(line)["id"] for line in lines] == [0, 1]
@@ -0,0 +1,23 @@
+import pytest
+
+from core.chord_shapes import ChordShapes
+from core.music_scale import MusicScale, ScalePatterns
+
+
+@pytest.mark.parametrize(
+    "key, pattern, expected",
+    [
+        ("A", ScalePatterns.minor, ["A", "B", "C", "D", "E", "F", "G"]),
+        ("D", ScalePatterns.minor, ["D", "E", "F", "G", "A", "A#", "C"]),
+        ("G", ScalePatterns.major, ["G", "A", "B", "C", "D", "E", "F#"]),
+    ],
+)
+def test_scale_starts_from_key(key, pattern, expected):
+    assert MusicScale(key).scale(pattern.value) == expected
+
+
+def test_open_strings_are_in_chord_scale():
+    # the open B string is not in the D minor scale
+    diagrams = ChordShapes().get_chord_diagram("D", "minor")
+    assert diagrams
+    assert all(2 not in d.open_strings for d in diagrams)
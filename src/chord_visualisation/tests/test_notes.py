@@ -124,3 +124,14 @@ def test_get_standard_notations_for_full_octave_from_starting_note(test_input, e
 )
 def test_get_standard_notation_from_alternative_notation(test_input, expected):
     assert test_input == expected
+
+
+@pytest.mark.parametrize("note, expected", [("A", 0), ("A#", 1), ("Bb", 1), ("C", 3), ("Gb", 9), ("G#", 11)])
+def test_pitch_class(note, expected):
+    assert ChromaticNotes.pitch_class(note) == expected
+    assert ChromaticNotes.note_name(expected) == ChromaticNotes.get_standard_notation_from_alternative_notation(note)
+
+
+def test_pitch_class_unknown_note():
+    with pytest.raises(ValueError):
+        ChromaticNotes.pitch_class("H")
@@ -0,0 +1,128 @@
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+import pytest
+
+from core.plot_chords import ChordShapePlot, FretboardToCoord, save_chord_library
+from core.voicing_library import VoicingLibrary
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CHORDS = [("A", "minor"), ("C", "major7")]
+
+
+@pytest.fixture
+def converter():
+    return FretboardToCoord()
+
+
+@pytest.mark.parametrize(
+    "string, fret, expected",
+    [
+        (1, 0, (65, 70)),
+        (1, 3, (373, 66)),
+        (3, 5, (557, 115)),
+        (6, 0, (65, 186)),
+        (6, 12, (1044, 200)),
+    ],
+)
+def test_get_fretboard_coords(converter, string, fret, expected):
+    assert converter.get_fretboard_coords(string, fret) == expected
+
+
+# coordinates predicted by the LinearRegression fit of the string lines that the closed form replaced
+REGRESSION_COORDS = [
+    (1, 0, (65, 70)),
+    (1, 7, (717, 62)),
+    (1, 15, (1195, 57)),
+    (3, 3, (373, 115)),
+    (3, 12, (1044, 115)),
+    (4, 0, (65, 139)),
+    (4, 7, (717, 142)),
+    (4, 15, (1195, 144)),
+    (6, 3, (373, 191)),
+    (6, 7, (717, 196)),
+    (6, 15, (1195, 202)),
+]
+
+
+def test_coords_matches_regression_fit(converter):
+    strings, frets, expected = zip(*REGRESSION_COORDS)
+    x, y = converter.coords(np.array(strings), np.array(frets))
+    assert list(zip(x.tolist(), y.tolist())) == list(expected)
+
+
+def exported_files(path: Path) -> dict[str, bytes]:
+    return {str(f.relative_to(path)): f.read_bytes() for f in sorted(path.rglob("*.png"))}
+
+
+@pytest.mark.parametrize("use_library", [False, True])
+def test_parallel_export_matches_serial(tmp_path, monkeypatch, use_library):
+    # ChordShapePlot.BASE_IMG is relative to the repository root
+    monkeypatch.chdir(REPO_ROOT)
+    library = VoicingLibrary.build(tmp_path / "voicings.bin", roots=("A", "C")) if use_library else None
+    for root, quality in CHORDS:
+        ChordShapePlot(root, quality, limit=3, library=library, backend="raster").save_all_plots(
+            tmp_path / "serial" / f"{root}{quality}"
+        )
+
+    throughput = save_chord_library(
+        CHORDS, tmp_path / "parallel", workers=2, limit=3, library=library, backend="raster"
+    )
+
+    serial = exported_files(tmp_path / "serial")
+    assert len(serial) == 6
+    assert exported_files(tmp_path / "parallel") == serial
+    assert sum(w.plots for w in throughput) == len(serial)
+    assert all(w.seconds > 0 for w in throughput)
+    if library:
+        library.close()
+
+
+def test_save_all_plots_in_workers_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    plot = ChordShapePlot("A", "minor", limit=4, backend="raster")
+    plot.save_all_plots(tmp_path / "serial")
+    throughput = plot.save_all_plots(tmp_path / "parallel", workers=2)
+
+    assert exported_files(tmp_path / "parallel") == exported_files(tmp_path / "serial")
+    assert sum(w.plots for w in throughput) == 4
+
+
+def test_figure_backend_matches_pyplot(tmp_path, monkeypatch):
+    from PIL import Image
+
+    monkeypatch.chdir(REPO_ROOT)
+    monkeypatch.setenv("MPLBACKEND", "Agg")
+    # a low resolution keeps the test fast, both backends use the same settings
+    monkeypatch.setattr(ChordShapePlot, "DPI", 60)
+    for backend in ("pyplot", "figure"):
+        plot = ChordShapePlot("A", "minor", limit=3, backend=backend)
+        plot.save_all_plots(tmp_path / backend)
+
+    pyplot_files = sorted((tmp_path / "pyplot").glob("*.png"))
+    assert len(pyplot_files) == 3
+    for pyplot_file in pyplot_files:
+        pyplot_img = np.asarray(Image.open(pyplot_file).convert("RGBA"))
+        figure_img = np.asarray(Image.open(tmp_path / "figure" / pyplot_file.name).convert("RGBA"))
+        assert np.array_equal(pyplot_img, figure_img)
+
+
+def test_figure_renderer_rasterises_again_at_other_dpi(monkeypatch):
+    import io
+
+    from PIL import Image
+
+    from core.plot_chords import FigureRenderer
+
+    monkeypatch.chdir(REPO_ROOT)
+
+    def png(renderer: FigureRenderer, dpi: int) -> NDArray[np.uint8]:
+        buffer = io.BytesIO()
+        renderer.figure.savefig(buffer, format="png", dpi=dpi)
+        return np.asarray(Image.open(buffer))
+
+    renderer = FigureRenderer(ChordShapePlot.BASE_IMG, 30, (20, 5), "orangered", blit=False)
+    png(renderer, 30)
+    fresh = FigureRenderer(ChordShapePlot.BASE_IMG, 30, (20, 5), "orangered", blit=False)
+    assert np.array_equal(png(renderer, 60), png(fresh, 60))
@@ -0,0 +1,55 @@
+from itertools import product
+
+import pytest
+
+from core.chord_shapes import playability_score
+from core.progression import ProgressionOptimiser, movement_cost, optimise_progression, parse_progression
+from core.voicing import Voicing
+
+
+def test_parse_progression():
+    assert parse_progression("A minor, D minor, E dom7") == [("A", "minor"), ("D", "minor"), ("E", "dom7")]
+
+
+def test_movement_cost():
+    a_minor = Voicing((0, 1, 2, 2, 0, -1))
+    a_major = Voicing((0, 2, 2, 2, 0, -1))
+    assert movement_cost(a_minor, a_minor) == 0
+    assert movement_cost(a_minor, a_major) > 0
+    assert movement_cost(a_minor, a_major) == movement_cost(a_major, a_minor)
+
+
+def test_voicings_match_progression():
+    optimiser = ProgressionOptimiser()
+    result = optimiser.optimise(parse_progression("A minor, D minor, E dom7"))
+    assert result.chords == [("A", "minor"), ("D", "minor"), ("E", "dom7")]
+    for chord, diagram in zip(result.chords, result.diagrams):
+        assert diagram in optimiser.candidates(chord)[0]
+
+
+@pytest.mark.parametrize("voicing_cost", [None, playability_score])
+def test_matches_brute_force(voicing_cost):
+    chords = [("A", "minor"), ("D", "minor"), ("E", "dom7")]
+    optimiser = ProgressionOptimiser(voicing_cost=voicing_cost, limit=8)
+    result = optimiser.optimise(chords)
+
+    candidates = [optimiser.candidates(chord) for chord in chords]
+    best = float("inf")
+    for path in product(*(range(len(c[0])) for c in candidates)):
+        cost = sum(c[2][i] for c, i in zip(candidates, path))
+        for (a, i), (b, j) in zip(zip(candidates, path), zip(candidates[1:], path[1:])):
+            cost += movement_cost(a[1][i], b[1][j])
+        best = min(best, cost)
+
+    assert result.cost == pytest.approx(best)
+
+
+def test_pluggable_transition_cost():
+    # a cost that only allows repeating the same voicing forces one voicing for a repeated chord
+    result = optimise_progression([("C", "major")] * 4, transition_cost=lambda a, b: 0 if a == b else 100)
+    assert result.cost == 0
+    assert all(d == result.diagrams[0] for d in result.diagrams)
+
+
+def test_empty_progression():
+    assert optimise_progression([]).diagrams == []
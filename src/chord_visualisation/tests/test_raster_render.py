@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.plot_chords import CoordinateDiagram, FretboardToCoord
+from core.raster_render import RasterRenderer, dot_sprite, read_base_image_rgba
+
+BASE_IMG = str(Path(__file__).resolve().parents[3] / "images" / "fretboard_2.png")
+ORANGERED = (255, 69, 0)
+
+
+@pytest.fixture(scope="module")
+def renderer():
+    return RasterRenderer(BASE_IMG, FretboardToCoord.open_coords, "orangered")
+
+
+@pytest.fixture
+def diagram():
+    converter = FretboardToCoord()
+    return CoordinateDiagram(
+        shape_coords=[converter.get_fretboard_coords(5, 3), converter.get_fretboard_coords(2, 1)],
+        open_strings=[3, 1],
+        muted_strings=[6],
+    )
+
+
+def test_dot_sprite():
+    sprite = dot_sprite(4)
+    assert sprite.shape == (10, 10)
+    assert sprite[5, 5] == 1
+    assert sprite[0, 0] == 0
+
+
+def test_render_marks_notes(renderer, diagram):
+    img = renderer.render(diagram)
+    assert img.shape == read_base_image_rgba(BASE_IMG).shape
+    for x, y in diagram.shape_coords:
+        assert tuple(img[y, x, :3]) == ORANGERED
+
+
+def test_render_draws_glyphs(renderer, diagram):
+    base = read_base_image_rgba(BASE_IMG)
+    img = renderer.render(diagram)
+    for string in diagram.open_strings + diagram.muted_strings:
+        x, y = FretboardToCoord.open_coords[string]
+        assert (img[y - 15 : y, x : x + 15] != base[y - 15 : y, x : x + 15]).any()
+    # strings that are neither open nor muted have no glyph
+    x, y = FretboardToCoord.open_coords[4]
+    assert (img[y - 15 : y, x : x + 15] == base[y - 15 : y, x : x + 15]).all()
+
+
+def test_render_does_not_change_base_image(renderer, diagram):
+    base = read_base_image_rgba(BASE_IMG).copy()
+    renderer.render(diagram)
+    assert np.array_equal(base, read_base_image_rgba(BASE_IMG))
+
+
+def test_render_clips_at_border(renderer):
+    img = renderer.render(CoordinateDiagram(shape_coords=[(0, 0), (1555, 245)], open_strings=[], muted_strings=[]))
+    assert tuple(img[0, 0, :3]) == ORANGERED
+
+
+def test_save(renderer, diagram, tmp_path):
+    renderer.save(diagram, "", tmp_path / "out.png")
+    with Image.open(tmp_path / "out.png") as im:
+        assert np.array_equal(np.array(im), renderer.render(diagram))
@@ -0,0 +1,96 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from core.plot_chords import ChordShapePlot
+from core.render_cache import RenderCache, render_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderCache(tmp_path / "cache", max_bytes=250)
+
+
+def test_render_key_depends_on_params():
+    assert render_key(dpi=600, shape=[(1, 2)]) == render_key(shape=[(1, 2)], dpi=600)
+    assert render_key(dpi=600, shape=[(1, 2)]) != render_key(dpi=300, shape=[(1, 2)])
+
+
+def test_cache_miss(cache, tmp_path):
+    assert not cache.get(render_key(a=1), tmp_path / "out.png")
+    assert not (tmp_path / "out.png").exists()
+
+
+def test_cache_hit_links_file(cache, tmp_path):
+    src = tmp_path / "src.png"
+    src.write_bytes(b"x" * 100)
+    key = render_key(a=1)
+    cache.put(key, src)
+
+    dest = tmp_path / "dest.png"
+    dest.write_bytes(b"old")
+    assert cache.get(key, dest)
+    assert dest.read_bytes() == b"x" * 100
+    assert os.stat(dest).st_nlink == 2
+
+    copy = tmp_path / "copy.png"
+    assert cache.get(key, copy, link=False)
+    assert os.stat(copy).st_nlink == 1
+
+
+def test_cache_evicts_least_recently_used(cache, tmp_path):
+    src = tmp_path / "src.png"
+    src.write_bytes(b"x" * 100)
+    keys = [render_key(a=i) for i in range(3)]
+    for key in keys[:2]:
+        cache.put(key, src)
+    # use the oldest entry so that the second one gets evicted
+    past = time.time() - 10
+    for path, _ in cache._entries():
+        os.utime(path, (past, past))
+    assert cache.get(keys[0], tmp_path / "hit.png")
+
+    cache.put(keys[2], src)
+    assert cache.size() <= 250
+    assert cache.get(keys[0], tmp_path / "a.png")
+    assert not cache.get(keys[1], tmp_path / "b.png")
+    assert cache.get(keys[2], tmp_path / "c.png")
+
+
+def test_put_only_scans_when_full(cache, tmp_path, monkeypatch):
+    src = tmp_path / "src.png"
+    src.write_bytes(b"x" * 100)
+    cache.put(render_key(a=0), src)
+
+    scans = []
+    entries = RenderCache._entries
+    monkeypatch.setattr(RenderCache, "_entries", lambda self: scans.append(1) or entries(self))
+    cache.put(render_key(a=1), src)
+    # replacing an entry does not change the size
+    cache.put(render_key(a=1), src)
+    assert not scans
+    cache.put(render_key(a=2), src)
+    assert scans
+    assert cache.size() <= 250
+
+
+def test_plot_uses_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(Path(__file__).resolve().parents[3])
+    cache = RenderCache(tmp_path / "cache")
+    plot = ChordShapePlot("A", "minor", limit=1, cache=cache, backend="raster")
+    (tmp_path / "first").mkdir()
+    plot.plot_by_idx(0, save=True, save_path=tmp_path / "first")
+    first = tmp_path / "first" / "Aminor_0.png"
+    assert os.stat(first).st_nlink == 1
+
+    def render_again(*args):
+        raise AssertionError("cached plot rendered again")
+
+    monkeypatch.setattr(plot, "_get_renderer", render_again)
+    (tmp_path / "second").mkdir()
+    plot.plot_by_idx(0, save=True, save_path=tmp_path / "second")
+    second = tmp_path / "second" / "Aminor_0.png"
+    assert second.read_bytes() == first.read_bytes()
+    assert os.stat(second).st_nlink == 2
@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import pytest
+
+from server import ChordService, serve
+
+
+async def _get(targets: list[str], service: ChordService | None = None) -> list[tuple[int, bytes]]:
+    server = await serve("127.0.0.1", 0, service or ChordService(cache_size=8))
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    responses = []
+    # all requests go over one keep-alive connection
+    for target in targets:
+        writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while (line := await reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            headers[name.lower()] = value.strip()
+        responses.append((status, await reader.readexactly(int(headers["content-length"]))))
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    return responses
+
+
+def get(*targets: str, service: ChordService | None = None) -> list[tuple[int, bytes]]:
+    return asyncio.run(_get(list(targets), service))
+
+
+def test_voicings():
+    [(status, body)] = get("/voicings?root=A&quality=minor&limit=3&rank=playability")
+    assert status == 200
+    voicings = json.loads(body)
+    assert len(voicings) == 3
+    assert set(voicings[0]) == {"shape", "open_strings", "muted_strings"}
+
+
+@pytest.mark.parametrize(
+    "frets, name",
+    [
+        ("0,1,2,2,0,-1", "A minor"),
+        ("0,0,1,2,2,0", "E major"),
+    ],
+)
+def test_name(frets, name):
+    [(status, body)] = get(f"/name?frets={frets}")
+    assert status == 200
+    assert json.loads(body) == {"name": name}
+
+
+def test_render():
+    (png_status, png), (svg_status, svg) = get(
+        "/render?root=C&quality=major&idx=0", "/render?root=C&quality=major&idx=0&format=svg"
+    )
+    assert png_status == svg_status == 200
+    assert png.startswith(b"\x89PNG")
+    assert b"<svg" in svg and b"/fretboard.png" in svg
+
+
+@pytest.mark.parametrize(
+    "target, status",
+    [
+        ("/voicings?root=A", 400),
+        ("/render?root=A&quality=minor&idx=999", 404),
+        ("/render?root=A&quality=minor&format=gif", 400),
+        ("/name?frets=1,2,3", 400),
+        ("/name?frets=0,1,2,2,0,200", 400),
+        ("/name?frets=0,1,2,2,0,-5", 400),
+        ("/name?frets=-1,-1,-1,-1,-1,-1", 400),
+        ("/voicings?root=A&quality=minor&limit=-1", 400),
+        ("/voicings?root=A&quality=minor&rank=playabilty", 400),
+        ("/unknown", 404),
+    ],
+)
+def test_errors(target, status):
+    [(response_status, body)] = get(target)
+    assert response_status == status
+    assert "error" in json.loads(body)
+
+
+def test_render_is_cached():
+    service = ChordService(cache_size=8)
+    service.render("A", "minor", 0, "svg")
+    service.render("A", "minor", 0, "svg")
+    assert service.render.cache_info().hits == 1
+
+
+def test_unexpected_error_is_internal_server_error():
+    class BrokenService(ChordService):
+        async def handle(self, path, query):
+            if path == "/broken":
+                raise RuntimeError("broken")
+            return await super().handle(path, query)
+
+    (status, body), (next_status, _) = get("/broken", "/fretboard.png", service=BrokenService(cache_size=8))
+    assert status == 500
+    assert "error" in json.loads(body)
+    # the connection is still usable
+    assert next_status == 200
+
+
+async def _send_raw(request: bytes) -> bytes:
+    server = await serve("127.0.0.1", 0, ChordService(cache_size=8))
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    response = await reader.read()
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    return response
+
+
+def test_malformed_request_line():
+    response = asyncio.run(_send_raw(b"GARBAGE\r\n\r\n"))
+    assert response.startswith(b"HTTP/1.1 400 ")
+
+
+def test_request_line_too_long():
+    response = asyncio.run(_send_raw(b"GET /" + b"a" * 70_000 + b" HTTP/1.1\r\n\r\n"))
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert b"Connection: close" in response
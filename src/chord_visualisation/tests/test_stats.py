@@ -0,0 +1,80 @@
+import io
+import json
+import logging
+
+import pytest
+
+from core.chord_shapes import ChordShapes
+from core.plot_chords import FretboardToCoord
+from core.stats import (
+    COORDINATE_MAPPING,
+    DIAGRAMS_EMITTED,
+    SHAPE_CANDIDATES,
+    SHAPE_PRUNED,
+    PipelineStats,
+    collect_stats,
+    current_stats,
+    enable_debug_logging,
+    timed,
+)
+
+
+@pytest.fixture
+def debug_log():
+    stream = io.StringIO()
+    handler = enable_debug_logging(stream)
+    yield stream
+    logger = logging.getLogger("core")
+    logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+
+
+def test_no_output_on_stdout(capsys):
+    ChordShapes().get_chord_diagram("A", "minor")
+    assert capsys.readouterr().out == ""
+
+
+def test_collect_stats():
+    shapes = ChordShapes()
+    with collect_stats() as stats:
+        diagrams = shapes.get_chord_diagram("A", "minor")
+        limited = list(shapes.iter_chord_diagrams("A", "minor", limit=3))
+        coords = [FretboardToCoord().diagram_coords(d) for d in diagrams]
+    assert current_stats() is None
+    assert stats.counters[SHAPE_CANDIDATES] >= len(diagrams) + len(limited)
+    assert stats.counters[SHAPE_PRUNED] > 0
+    assert stats.counters[DIAGRAMS_EMITTED] == len(diagrams) + len(limited)
+    assert stats.calls[COORDINATE_MAPPING] == len(coords)
+
+
+def test_timed():
+    with timed("unused"):
+        pass
+    with collect_stats() as stats:
+        with timed("block"):
+            pass
+    assert stats.calls["block"] == 1
+    assert stats.seconds["block"] >= 0
+
+
+def test_dump_stats():
+    stats = PipelineStats()
+    stats.count(SHAPE_CANDIDATES, 3)
+    stats.add_time(COORDINATE_MAPPING, 0.5)
+    assert json.loads(stats.to_json()) == {
+        "counters": {"shape_candidates": 3},
+        "timers": {"coordinate_mapping": {"seconds": 0.5, "calls": 1}},
+    }
+    metrics = stats.to_prometheus()
+    assert "# TYPE chord_visualisation_shape_candidates_total counter" in metrics
+    assert "chord_visualisation_shape_candidates_total 3" in metrics
+    assert "chord_visualisation_coordinate_mapping_seconds_total 0.5" in metrics
+
+
+def test_structured_debug_logging(debug_log):
+    diagrams = ChordShapes().get_chord_diagram("C", "major")
+    records = [json.loads(line) for line in debug_log.getvalue().splitlines()]
+    checked = [r for r in records if r["message"] == "open strings checked"]
+    assert len(checked) == len(diagrams)
+    assert {"shape", "open_strings", "muted_strings", "raw_open_strings"} <= set(checked[0])
+    assert records[0]["logger"].startswith("core.")
@@ -0,0 +1,39 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from core.plot_chords import CoordinateDiagram, FretboardToCoord
+from core.svg_render import SvgRenderer
+
+BASE_IMG = str(Path(__file__).resolve().parents[3] / "images" / "fretboard_2.png")
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+@pytest.fixture
+def renderer():
+    return SvgRenderer(BASE_IMG, FretboardToCoord.open_coords, "orangered")
+
+
+@pytest.fixture
+def diagram():
+    return CoordinateDiagram(shape_coords=[(373, 170), (168, 91)], open_strings=[3, 1], muted_strings=[6])
+
+
+def test_render(renderer, diagram):
+    root = ET.fromstring(renderer.render(diagram, "C major <0>", "fretboard.png"))
+    assert root.get("width") == "1556"
+    assert root.find(f"{SVG}title").text == "C major <0>"
+    assert root.find(f"{SVG}image").get("href") == "fretboard.png"
+    circles = [(c.get("cx"), c.get("cy")) for c in root.iter(f"{SVG}circle")]
+    assert circles == [("373", "170"), ("168", "91")]
+    assert [t.text for t in root.iter(f"{SVG}text")] == ["O", "O", "X"]
+
+
+def test_save_references_base_image(renderer, diagram, tmp_path):
+    path = tmp_path / "chords" / "Cmajor_0.svg"
+    path.parent.mkdir()
+    renderer.save(diagram, "C major", path)
+    href = ET.parse(path).getroot().find(f"{SVG}image").get("href")
+    assert (path.parent / href).resolve() == Path(BASE_IMG).resolve()
+    assert path.stat().st_size < 1000
@@ -0,0 +1,52 @@
+import pytest
+
+from core.chord_shapes import ChordDiagram, ChordShapes, FingerPosition
+from core.voicing import MUTED, Voicing
+
+
+@pytest.fixture
+def a_minor():
+    return Voicing((0, 1, 2, 2, 0, MUTED))
+
+
+def test_frets(a_minor):
+    assert a_minor.frets == (0, 1, 2, 2, 0, -1)
+    assert len(a_minor) == 6
+    assert list(a_minor) == [0, 1, 2, 2, 0, -1]
+
+
+def test_to_diagram(a_minor):
+    assert a_minor.to_diagram() == ChordDiagram(
+        shape=[FingerPosition(2, 1), FingerPosition(3, 2), FingerPosition(4, 2)],
+        open_strings=[1, 5],
+        muted_strings=[6],
+    )
+
+
+@pytest.mark.parametrize("root, quality", [("A", "minor"), ("C", "major"), ("G", "dom7")])
+def test_diagram_round_trip(root, quality):
+    for diagram in ChordShapes().get_chord_diagram(root, quality):
+        assert Voicing.from_diagram(diagram).to_diagram() == diagram
+
+
+def test_bytes_round_trip(a_minor):
+    assert Voicing.from_bytes(a_minor.to_bytes()) == a_minor
+
+
+def test_hash_and_equality(a_minor):
+    same = Voicing([0, 1, 2, 2, 0, -1])
+    assert a_minor == same
+    assert a_minor != Voicing((0, 1, 2, 2, 1, -1))
+    assert a_minor != (0, 1, 2, 2, 0, -1)
+    assert len({a_minor, same}) == 1
+
+
+def test_slots(a_minor):
+    with pytest.raises(AttributeError):
+        a_minor.string = 1
+
+
+@pytest.mark.parametrize("frets", [(0, 1, 2, 2, 0, 200), (0, 1, 2, 2, 0, -129), (0, 1.5, 2, 2, 0, -1)])
+def test_frets_out_of_range(frets):
+    with pytest.raises(ValueError):
+        Voicing(frets)
@@ -0,0 +1,48 @@
+import pytest
+
+from core.chord_shapes import ChordShapes
+from core.voicing import MUTED, Voicing
+from core.voicing_library import VoicingLibrary, decode_diagram, encode_diagram
+
+
+@pytest.fixture(scope="module")
+def library(tmp_path_factory):
+    path = tmp_path_factory.mktemp("library") / "voicings.lib"
+    with VoicingLibrary.build(path, roots=("A", "C"), qualities=("major", "minor7")) as lib:
+        yield lib
+
+
+@pytest.mark.parametrize("root, quality", [("A", "major"), ("A", "minor7"), ("C", "major"), ("C", "minor7")])
+def test_library_matches_chord_shapes(library, root, quality):
+    assert library.get_chord_diagram(root, quality) == ChordShapes().get_chord_diagram(root, quality)
+
+
+def test_get_frets(library):
+    diagrams = library.get_chord_diagram("A", "major")
+    with library.get_frets("A", "major") as frets:
+        assert frets.shape == (len(diagrams), 6)
+        assert frets.tolist()[0] == memoryview(encode_diagram(diagrams[0])).cast("b").tolist()
+
+
+def test_iter_voicings(library):
+    voicings = list(library.iter_voicings("C", "minor7"))
+    assert [v.to_diagram() for v in voicings] == library.get_chord_diagram("C", "minor7")
+    assert all(isinstance(v, Voicing) for v in voicings)
+
+
+def test_library_tuning(library):
+    assert library.tuning == ("E", "B", "G", "D", "A", "E")
+
+
+def test_encode_decode_diagram():
+    diagram = ChordShapes().get_chord_diagram("D", "major")[0]
+    frets = memoryview(encode_diagram(diagram)).cast("b").tolist()
+    assert [idx + 1 for idx, f in enumerate(frets) if f == MUTED] == diagram.muted_strings
+    assert decode_diagram(encode_diagram(diagram)) == diagram
+
+
+def test_invalid_library(tmp_path):
+    path = tmp_path / "invalid.lib"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        VoicingLibrary(path)